@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.db import router
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from api.scopes import get_state
+
+from .tokens import SCOPE_CLAIMS, scope_claims
+
+
+class ScopedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that skips the user lookup on read requests to views
+    that only need the user's id, role and scope.
+
+    Such views set ``user_from_claims = True``. For their safe methods, when
+    the token's scope claims still match the cached user state,
+    ``request.user`` is a ``User`` built from the claims with all other
+    fields deferred; each deferred field read would cost a query.
+    ``edu_center_id`` is set on it. Other views, writes,
+    stale claims and tokens issued before scope claims existed fall back to
+    the regular database lookup. Inactive or deleted users are rejected on
+    every path.
+    """
+
+    def authenticate(self, request):
+        view = (request.parser_context or {}).get("view")
+        self.from_claims = (
+            request.method in SAFE_METHODS and getattr(view, "user_from_claims", False)
+        )
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        state = get_state(user_id)
+        if not state:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if not state["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        claims = scope_claims(state)
+        claims_match = all(
+            claim in validated_token and validated_token[claim] == claims[claim]
+            for claim in SCOPE_CLAIMS
+        )
+        if not (self.from_claims and claims_match):
+            return super().get_user(validated_token)
+        return self.hydrate_user(user_id, validated_token)
+
+    def hydrate_user(self, user_id, validated_token):
+        User = get_user_model()
+        known = {"id": user_id, "role": validated_token["role"], "is_active": True}
+        names = [f.attname for f in User._meta.concrete_fields if f.attname in known]
+        user = User.from_db(router.db_for_read(User), names, [known[n] for n in names])
+        user.edu_center_id = validated_token["edu_center_id"]
+        return user
@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from accounts.models import MonthlyCenterReport
+from main.models import Enrollment
+
+CHARGE_RATE = Decimal("0.03")
+CENT = Decimal("0.01")
+RECONCILE_BATCH_SIZE = 500
+
+
+def monthly_totals():
+    """
+    ``{(edu_center_id, year, month): (total_applications, payable_amount)}``
+    for every center-month with applications, from a single ``GROUP BY``.
+    """
+    rows = (
+        Enrollment.objects
+        .annotate(year=ExtractYear("applied_at"), month=ExtractMonth("applied_at"))
+        .values("course__branch__edu_center_id", "year", "month")
+        .annotate(total=Count("id"), price_sum=Sum("course__price"))
+        .order_by()
+    )
+    return {
+        (r["course__branch__edu_center_id"], r["year"], r["month"]):
+            (r["total"], (r["price_sum"] * CHARGE_RATE).quantize(CENT))
+        for r in rows
+    }
+
+
+def reconcile_monthly_reports():
+    """
+    Rebuild ``total_applications`` and ``payable_amount`` of every
+    ``MonthlyCenterReport`` from the enrollments: one aggregate query, one
+    read of the reports, then batched inserts and updates of what differs.
+    Reports whose enrollments are all gone drop to zero; ``paid_amount`` is
+    left alone.
+
+    Returns the corrections as dicts with ``(old, new)`` pairs.
+    """
+    expected = monthly_totals()
+    reports = {
+        (r.edu_center_id, r.year, r.month): r
+        for r in MonthlyCenterReport.objects.only(
+            "edu_center_id", "year", "month", "total_applications", "payable_amount"
+        )
+    }
+
+    now = timezone.now()
+    created, updated, diffs = [], [], []
+    for key in expected.keys() | reports.keys():
+        total, payable = expected.get(key, (0, Decimal("0.00")))
+        report = reports.get(key)
+        old = (report.total_applications, report.payable_amount) if report else (0, Decimal("0.00"))
+        if report is not None and old == (total, payable):
+            continue
+
+        center_id, year, month = key
+        diffs.append({
+            "edu_center_id": center_id,
+            "year": year,
+            "month": month,
+            "created": report is None,
+            "total_applications": (old[0], total),
+            "payable_amount": (old[1], payable),
+        })
+        if report is None:
+            created.append(MonthlyCenterReport(
+                edu_center_id=center_id, year=year, month=month,
+                total_applications=total, payable_amount=payable,
+            ))
+        else:
+            report.total_applications = total
+            report.payable_amount = payable
+            report.updated_at = now
+            updated.append(report)
+
+    with transaction.atomic():
+        MonthlyCenterReport.objects.bulk_create(created, batch_size=RECONCILE_BATCH_SIZE)
+        MonthlyCenterReport.objects.bulk_update(
+            updated,
+            ["total_applications", "payable_amount", "updated_at"],
+            batch_size=RECONCILE_BATCH_SIZE,
+        )
+    return sorted(diffs, key=lambda d: (d["edu_center_id"], d["year"], d["month"]))
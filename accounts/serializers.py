@@ -4,8 +4,9 @@ from djoser.serializers import UserCreateSerializer as BaseUserCreateSerializer
 from djoser.serializers import UserSerializer as BaseUserSerializer
 from rest_framework import serializers
 
+from api.media import get_media_resolver
 from api.serializers import EducationCenterSerializer
-from main.models import Branch, EducationCenter, Enrollment
+from main.models import DAY_MASK_LABELS, Branch, EducationCenter, Enrollment
 
 User = get_user_model()
 
@@ -147,7 +148,7 @@ class MyCourseSerializer(serializers.ModelSerializer):
         fields = ["id", "course_name", "level", "days", "start_time", "edu_center_logo"]
 
     def get_days(self, obj):
-        return [day.name[:3].capitalize() for day in obj.course.days.all()]
+        return list(DAY_MASK_LABELS[obj.course.day_mask])
 
     def get_start_time(self, obj):
         return (
@@ -162,13 +163,7 @@ class MyCourseSerializer(serializers.ModelSerializer):
         if not edu_center:
             return None
 
-        logo_field = getattr(edu_center, "logo", None)
-        if not logo_field:
-            return None
-
-        request = self.context.get("request")
-        logo_url = logo_field.url
-        return request.build_absolute_uri(logo_url) if request else logo_url
+        return get_media_resolver(self.context).file_url(getattr(edu_center, "logo", None))
 
 
 class EmptySerializer(serializers.Serializer):
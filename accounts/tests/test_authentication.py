@@ -0,0 +1,123 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.scopes import get_state, state_key
+from main.models import EducationCenter
+
+
+@pytest.fixture
+def center_user():
+    user = get_user_model().objects.create_user(
+        username="center", full_name="Center Admin", password="Test1234!",
+        role="EDU_CENTER",
+    )
+    center = EducationCenter.objects.create(
+        name="Compass", user=user, country="Uzbekistan", region="Tashkent",
+        city="Tashkent",
+    )
+    return user, center
+
+
+def login(username="center", password="Test1234!"):
+    response = APIClient().post(
+        "/api/auth/login/", {"username": username, "password": password}
+    )
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+def client_for(access):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"JWT {access}")
+    return client
+
+
+def user_queries(ctx):
+    return [q for q in ctx.captured_queries if '"accounts_user"' in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestScopedJWTAuthentication:
+    def test_tokens_carry_scope_claims(self, center_user):
+        _, center = center_user
+        token = AccessToken(login()["access"])
+
+        assert token["role"] == "EDU_CENTER"
+        assert token["edu_center_id"] == center.id
+
+    def test_reads_skip_the_user_lookup(self, center_user):
+        client = client_for(login()["access"])
+        assert client.get("/api/applied-students/").status_code == 200
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/applied-students/")
+
+        assert response.status_code == 200
+        assert user_queries(ctx) == []
+
+    def test_other_views_load_the_whole_user_once(self, center_user):
+        client = client_for(login()["access"])
+        assert client.get("/api/auth/me/").status_code == 200
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/auth/me/")
+
+        assert response.status_code == 200
+        assert response.data["full_name"] == "Center Admin"
+        assert len(user_queries(ctx)) == 1
+
+    def test_deactivated_user_is_rejected(self, center_user):
+        user, _ = center_user
+        client = client_for(login()["access"])
+        assert client.get("/api/applied-students/").status_code == 200
+
+        user.is_active = False
+        user.save()
+
+        assert client.get("/api/applied-students/").status_code == 401
+
+    def test_stale_role_claim_falls_back_to_database(self, center_user):
+        user, _ = center_user
+        client = client_for(login()["access"])
+
+        get_user_model().objects.filter(pk=user.pk).update(role="ACCOUNTANT")
+        cache.clear()
+
+        response = client.get("/api/edu-center/reports/")
+        assert response.status_code == 403
+
+    def test_reassigned_center_resets_previous_owner(self, center_user):
+        user, center = center_user
+        get_state(user.pk)
+        other = get_user_model().objects.create_user(
+            username="other", full_name="Other Admin", role="EDU_CENTER",
+        )
+
+        center.user = other
+        center.save()
+
+        assert cache.get(state_key(user.pk)) is None
+        assert get_state(user.pk)["center_ids"] == []
+        assert get_state(other.pk)["center_ids"] == [center.id]
+
+    def test_refresh_updates_scope_claims(self):
+        user = get_user_model().objects.create_user(
+            username="center", full_name="Center Admin", password="Test1234!",
+            role="EDU_CENTER",
+        )
+        tokens = login()
+        assert AccessToken(tokens["access"])["edu_center_id"] is None
+
+        center = EducationCenter.objects.create(
+            name="Compass", user=user, country="Uzbekistan", region="Tashkent",
+            city="Tashkent",
+        )
+        response = APIClient().post("/api/auth/refresh/", {"refresh": tokens["refresh"]})
+
+        assert response.status_code == 200
+        assert AccessToken(response.data["access"])["edu_center_id"] == center.id
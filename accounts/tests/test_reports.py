@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from accounts.models import MonthlyCenterReport
+from accounts.reports import reconcile_monthly_reports
+from main.models import Branch, Category, Course, EducationCenter, Enrollment, Level
+
+
+@pytest.fixture
+def course():
+    center = EducationCenter.objects.create(
+        name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent"
+    )
+    category = Category.objects.create(name="English")
+    return Course.objects.create(
+        name="General", branch=Branch.objects.create(name="Main", edu_center=center),
+        category=category, level=Level.objects.create(category=category, name="Beginner"),
+        total_places=10, price=100, start_time="10:00", end_time="12:00",
+    )
+
+
+def enroll(course, phone, month):
+    user = get_user_model().objects.create_user(
+        full_name="Student", phone_number=phone, password="Test1234!"
+    )
+    return Enrollment.objects.create(
+        user=user, course=course, applied_at=datetime(2025, month, 10, tzinfo=timezone.utc)
+    )
+
+
+@pytest.mark.django_db
+class TestReconcileMonthlyReports:
+    def test_drift_is_corrected_in_constant_queries(
+        self, course, django_assert_max_num_queries
+    ):
+        for i, month in enumerate([4, 4, 5]):
+            enroll(course, f"+99890123456{i}", month)
+        Course.objects.filter(pk=course.pk).update(price=200)  # no signal
+        MonthlyCenterReport.objects.filter(month=5).delete()
+        MonthlyCenterReport.objects.create(
+            edu_center=course.branch.edu_center, year=2025, month=6,
+            total_applications=3, paid_amount=Decimal("5.00"),
+        )
+
+        with django_assert_max_num_queries(6):
+            diffs = reconcile_monthly_reports()
+
+        assert [(d["month"], d["created"]) for d in diffs] == [(4, False), (5, True), (6, False)]
+        reports = {
+            r.month: (r.total_applications, r.payable_amount, r.paid_amount)
+            for r in MonthlyCenterReport.objects.all()
+        }
+        assert reports == {
+            4: (2, Decimal("12.00"), Decimal("0.00")),
+            5: (1, Decimal("6.00"), Decimal("0.00")),
+            6: (0, Decimal("0.00"), Decimal("5.00")),
+        }
+
+    def test_command_reports_nothing_when_in_sync(self, course):
+        enroll(course, "+998901234567", 4)
+
+        out = StringIO()
+        call_command("reconcile_monthly_reports", stdout=out)
+
+        assert "Corrected 0 reports" in out.getvalue()
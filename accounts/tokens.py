@@ -0,0 +1,53 @@
+from rest_framework_simplejwt.serializers import (TokenObtainPairSerializer,
+                                                  TokenRefreshSerializer)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.scopes import get_state, resolve_state
+
+SCOPE_CLAIMS = ("role", "edu_center_id")
+
+
+def scope_claims(state):
+    """
+    Token claims of a user's ``api.scopes`` state: the role and the first
+    center the user administers.
+    """
+    centers = state["center_ids"]
+    return {"role": state["role"], "edu_center_id": centers[0] if centers else None}
+
+
+class ScopedRefreshToken(RefreshToken):
+    """
+    Refresh token carrying ``role`` and ``edu_center_id``. They are copied
+    into every access token minted from it.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token.payload.update(scope_claims(get_state(user.pk)))
+        return token
+
+
+class RescopedRefreshToken(ScopedRefreshToken):
+    """
+    A decoded refresh token whose scope claims are re-read from the database,
+    so role or ownership changes reach the next access token.
+    """
+
+    def __init__(self, token=None, verify=True):
+        super().__init__(token, verify)
+        if token is None:
+            return
+        state = resolve_state(self.payload.get(api_settings.USER_ID_CLAIM))
+        if state:
+            self.payload.update(scope_claims(state))
+
+
+class ScopedTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ScopedRefreshToken
+
+
+class ScopedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RescopedRefreshToken
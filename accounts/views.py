@@ -8,13 +8,17 @@ from rest_framework.generics import CreateAPIView, RetrieveUpdateAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from accounts.serializers import UserCreateSerializer
+from accounts.tokens import ScopedRefreshToken
+from api.conditional import ConditionalGetMixin
 from api.paginations import DefaultPagination
+from api.scopes import get_scope
+from api.sparse import SparseQuerysetMixin
 from api.serializers import (EducationCenterSerializer, LikeSerializer,
                              ViewSerializer)
-from main.models import Branch, Course, EducationCenter, Enrollment, Like, View
+from main.models import (Branch, Category, Course, EducationCenter, Enrollment,
+                         EduType, Like, View)
 
 from .permissions import IsEduCenterOrReadOnly, IsSuperUser
 from .serializers import (BranchCreateSerializer, EduCenterCreateSerializer,
@@ -23,28 +27,42 @@ from .serializers import (BranchCreateSerializer, EduCenterCreateSerializer,
 User = get_user_model()
 
 
-class EduCenterViewSet(ReadOnlyModelViewSet):
+class EduCenterViewSet(ConditionalGetMixin, SparseQuerysetMixin, ReadOnlyModelViewSet):
+    user_from_claims = True
     serializer_class = EducationCenterSerializer
     pagination_class = DefaultPagination
+    # Centers list the categories of their courses; dating those rows directly
+    # also covers queryset updates that bypass main.signals.
+    watermark_fields = (
+        "updated_at", "branches__updated_at", "branches__courses__updated_at"
+    )
+    watermark_lookups = (Category, EduType)
+    queryset = EducationCenter.objects.filter(active=True)
 
-    queryset = (
-        EducationCenter.objects.filter(active=True)
-        .annotate(
-            likes_count=Count("likes", distinct=True),
-            views_count=Count("views", distinct=True),
-        )
-        .prefetch_related(
-            "edu_type",
-            Prefetch(
-                "branches",
-                queryset=Branch.objects.prefetch_related(
-                    Prefetch(
-                        "courses", queryset=Course.objects.select_related("category")
-                    )
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.wants("likes_count"):
+            qs = qs.annotate(likes_count=Count("likes", distinct=True))
+        if self.wants("views_count"):
+            qs = qs.annotate(views_count=Count("views", distinct=True))
+        if self.wants("edu_type"):
+            qs = qs.prefetch_related("edu_type")
+        if self.wants("categories"):
+            qs = qs.prefetch_related(
+                Prefetch(
+                    "branches",
+                    queryset=Branch.objects.prefetch_related(
+                        Prefetch(
+                            "courses", queryset=Course.objects.select_related("category")
+                        )
+                    ),
                 ),
-            ),
-        )
-    )
+            )
+        return self.sparse_queryset(qs)
+
+    def get_watermark_queryset(self):
+        # Likes and views bump the center's updated_at themselves.
+        return EducationCenter.objects.filter(active=True)
 
 
 class EduCenterCreateView(CreateAPIView):
@@ -106,12 +124,13 @@ class ViewViewSet(ModelViewSet):
         serializer.save(user=self.request.user, content_object=edu_center)
 
 
-class BranchViewSet(ModelViewSet):
+class BranchViewSet(ConditionalGetMixin, ModelViewSet):
     """
     GET (list/retrieve):   hammaga (shu jumladan student/anonim) ochiq.
     POST/PUT/PATCH/DELETE:  faqat EDU_CENTER.
     """
 
+    user_from_claims = True
     queryset = Branch.objects.all()
     serializer_class = BranchCreateSerializer
     permission_classes = [IsEduCenterOrReadOnly]
@@ -121,7 +140,7 @@ class BranchViewSet(ModelViewSet):
         user = self.request.user
         # Edu center admini o‘z markazi filiallarini boshqaradi:
         if user.is_authenticated and user.role == "EDU_CENTER":
-            return qs.filter(edu_center__user=user)
+            return qs.filter(id__in=get_scope(self.request).branch_ids)
         # STUDENT/BRANCH/anonim: barcha filiallarni list qiladi
         return qs
 
@@ -134,14 +153,14 @@ class BranchViewSet(ModelViewSet):
 
 
 class MyCoursesView(generics.ListAPIView):
+    user_from_claims = True
     serializer_class = MyCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         return (
             Enrollment.objects.filter(user=self.request.user)
-            .select_related("course__level")
-            .prefetch_related("course__days")
+            .select_related("course__level", "course__branch__edu_center")
         )
 
 
@@ -152,7 +171,7 @@ class RegisterView(generics.CreateAPIView):
         response = super().create(request, *args, **kwargs)
         user_data = response.data
         user = User.objects.get(pk=user_data["id"])
-        refresh = RefreshToken.for_user(user)
+        refresh = ScopedRefreshToken.for_user(user)
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
 
@@ -0,0 +1,38 @@
+"""
+Django cache backends that count hits and misses for ``api.metrics``.
+"""
+from django.core.cache import caches
+from django.core.cache.backends import locmem, redis
+
+from api.metrics import record_cache_read
+
+_MISSING = object()
+
+
+def is_cache_shared(alias="default"):
+    """
+    Whether every worker sees the same cache. A local-memory cache is private
+    to each process, so deleting a key there only reaches the current worker.
+    """
+    return not isinstance(caches[alias], locmem.LocMemCache)
+
+
+class CacheMetricsMixin:
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        record_cache_read(value is not _MISSING)
+        return default if value is _MISSING else value
+
+
+class LocMemCache(CacheMetricsMixin, locmem.LocMemCache):
+    pass
+
+
+class RedisCache(CacheMetricsMixin, redis.RedisCache):
+    def get_many(self, keys, version=None):
+        # Unlike the base class, Redis reads all keys at once, not via get().
+        keys = list(keys)
+        found = super().get_many(keys, version)
+        for key in keys:
+            record_cache_read(key in found)
+        return found
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from api.caches import is_cache_shared
+
+
+@register()
+def shared_cache_check(app_configs, **kwargs):
+    if settings.DEBUG or is_cache_shared():
+        return []
+    return [
+        Warning(
+            "The default cache is process-local, so other workers see lookup "
+            "table edits (main.lookups) only after LOCAL_VERSION_TIMEOUT "
+            "seconds and user state and ownership changes (api.scopes) only "
+            "after LOCAL_STATE_TIMEOUT seconds.",
+            hint="Set CACHE_URL to a shared Redis cache.",
+            id="api.W001",
+        )
+    ]
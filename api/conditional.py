@@ -0,0 +1,106 @@
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import (get_conditional_response, patch_cache_control,
+                                patch_vary_headers, quote_etag)
+from django.utils.http import http_date
+from django.utils.translation import get_language
+
+from api.scopes import get_scope
+from main import lookups
+
+
+class ConditionalGetMixin:
+    """
+    ``ETag`` and ``Last-Modified`` on ``list`` and ``retrieve``.
+
+    The validators come from one aggregate over the filtered queryset: the
+    newest ``updated_at`` of the rows (and the related rows named in
+    ``watermark_fields``) plus the row count, so deletions change the ETag
+    too. A matching ``If-None-Match`` answers ``304 Not Modified`` before
+    the page is fetched or serialized.
+
+    Lists only honour ``If-None-Match``: a deleted row leaves the newest
+    ``updated_at`` unchanged, so ``If-Modified-Since`` alone cannot tell.
+    """
+
+    # ``updated_at`` paths whose newest value dates the payload.
+    watermark_fields = ("updated_at",)
+    # Lookup models rendered by name; their table versions join the ETag.
+    watermark_lookups = ()
+
+    def get_watermark_queryset(self):
+        """
+        Rows the response renders. Override to drop costly annotations.
+        """
+        return self.filter_queryset(self.get_queryset())
+
+    def get_validators(self, queryset):
+        """
+        ``(etag, last_modified)`` of ``queryset`` for this request, or
+        ``(None, None)`` when it is empty (detail views then 404 as usual).
+        """
+        stamps = queryset.order_by().aggregate(
+            rows=Count("pk", distinct=True),
+            **{f"w{i}": Max(path) for i, path in enumerate(self.watermark_fields)},
+        )
+        rows = stamps.pop("rows")
+        if not rows and self.action != "list":
+            return None, None
+        last_modified = max(filter(None, stamps.values()), default=None)
+
+        scope = get_scope(self.request)
+        renderer = getattr(self.request, "accepted_renderer", None)
+        parts = [
+            self.request.get_full_path(),
+            getattr(renderer, "format", ""),
+            get_language() or "",
+            str(self.request.user.pk) if scope is not None else "",
+            str(rows),
+            last_modified.isoformat() if last_modified else "",
+            *(lookups.get_version(model) for model in self.watermark_lookups),
+        ]
+        digest = hashlib.md5("|".join(parts).encode(), usedforsecurity=False)
+        return quote_etag(digest.hexdigest()), last_modified
+
+    def _conditional(self, queryset, render):
+        etag, last_modified = self.get_validators(queryset)
+        if etag is None:
+            return render()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=timestamp if self.action != "list" else None,
+        )
+        if response is None:
+            response = render()
+        if response.status_code in (200, 304):
+            response.headers["ETag"] = etag
+            if timestamp is not None:
+                response.headers["Last-Modified"] = http_date(timestamp)
+            # Clients keep their copy but revalidate it on every use.
+            patch_cache_control(response, no_cache=True)
+            patch_vary_headers(response, ("Authorization", "Accept-Language"))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(
+            self.get_watermark_queryset(),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        def render():
+            return super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.get_watermark_queryset().filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (TypeError, ValueError, ValidationError):
+            return render()  # malformed lookups 404 there
+        return self._conditional(queryset, render)
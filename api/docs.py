@@ -0,0 +1,24 @@
+"""
+``swagger_auto_schema`` and ``openapi`` for view modules. With the API
+docs off (``settings.API_DOCS``, off in the production profile) drf_yasg
+is never imported: the decorator returns the view unchanged and
+``openapi`` accepts any attribute or call, so schema annotations cost
+nothing.
+"""
+from django.conf import settings
+
+if settings.API_DOCS:
+    from drf_yasg import openapi  # noqa: F401
+    from drf_yasg.utils import swagger_auto_schema  # noqa: F401
+else:
+    class _Unused:
+        def __getattr__(self, name):
+            return self
+
+        def __call__(self, *args, **kwargs):
+            return self
+
+    openapi = _Unused()
+
+    def swagger_auto_schema(*args, **kwargs):
+        return lambda view: view
@@ -0,0 +1,302 @@
+"""
+Serializer-free rendering for hot list endpoints.
+
+A ``RowFormat`` describes the output of a serializer as one
+``(columns, format)`` pair per field: the ``.values()`` columns the field
+reads and a function turning a row into the field's JSON value. For the
+fields a request asks for, the columns are fetched in one query and each
+row is built by a precompiled list of formatters, without instantiating a
+single DRF field. ``api/tests/test_fastpath.py`` compares the output with
+the serializers so the two cannot drift apart.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from rest_framework.response import Response
+
+from api.instrumentation import serializing
+from api.media import get_media_resolver
+from api.sparse import is_sparse_request, sparse_field_names
+from main import lookups
+from main.models import (DAY_MASK_LABELS, Category, EducationCenter, Enrollment,
+                         Event, Level)
+from main.thumbnails import srcset_from
+
+CENT = Decimal("0.01")
+
+# Returned by a formatter to leave its key out, as DRF does for a dotted
+# ``source`` crossing a null foreign key.
+SKIP = object()
+
+
+# ─── Value formatters (DRF's to_representation, minus the field objects) ────
+
+
+def _decimal(value):
+    return f"{Decimal(value).quantize(CENT):f}"
+
+
+def _iso(value):
+    return value.isoformat()
+
+
+def column(name, convert=None):
+    """
+    A field rendering column ``name`` as is, or through ``convert`` when set.
+    """
+    if convert is None:
+        return (name,), lambda row, ctx: row[name]
+
+    def format(row, ctx):
+        value = row[name]
+        return None if value is None else convert(value)
+    return (name,), format
+
+
+def through_nullable(name):
+    """
+    A field reading column ``name`` across a nullable foreign key.
+    """
+    return (name,), lambda row, ctx: SKIP if row[name] is None else row[name]
+
+
+def or_none(name):
+    """
+    A field rendering empty values of column ``name`` as ``None``.
+    """
+    return (name,), lambda row, ctx: row[name] or None
+
+
+def media(name, storage):
+    """
+    Absolute URL of the file stored under column ``name``.
+    """
+    return (name,), lambda row, ctx: ctx["media"].url(row[name], storage)
+
+
+def srcset(variants, name, field):
+    """
+    Thumbnail map of image ``field``, from its ``variants`` and ``name`` columns.
+    """
+    return (variants, name), lambda row, ctx: srcset_from(
+        row[variants], field, row[name], ctx["media"].url
+    )
+
+
+def lookup_name(model, name):
+    def format(row, ctx):
+        obj = lookups.get(model, row[name])
+        return obj.name if obj else None
+    return (name,), format
+
+
+def related(key):
+    """
+    A field filled by the ``RowFormat`` loader of the same name.
+    """
+    return ("id",), lambda row, ctx: ctx[key].get(row["id"], [])
+
+
+class RowFormat:
+    """
+    Ordered ``{field: (columns, format)}`` plus ``loaders``: per-page queries
+    (``{field: fn(ids) -> {id: value}}``) for to-many fields.
+    """
+
+    def __init__(self, fields, loaders=None):
+        self.fields = fields
+        self.loaders = loaders or {}
+        self._compiled = {}
+
+    def field_names(self, request):
+        if is_sparse_request(request):
+            return tuple(sparse_field_names(request, self.fields))
+        return tuple(self.fields)
+
+    def compile(self, names):
+        """
+        ``(columns, formatters)`` for the fields ``names``, built once per set.
+        """
+        compiled = self._compiled.get(names)
+        if compiled is None:
+            columns = {"id"}
+            for name in names:
+                columns.update(self.fields[name][0])
+            formatters = [(name, self.fields[name][1]) for name in names]
+            compiled = self._compiled[names] = (sorted(columns), formatters)
+        return compiled
+
+    def render(self, rows, names, request):
+        _, formatters = self.compile(names)
+        ctx = {"media": get_media_resolver({"request": request})}
+        ids = [row["id"] for row in rows]
+        for name, load in self.loaders.items():
+            if name in names:
+                ctx[name] = load(ids) if ids else {}
+        items = [{name: format(row, ctx) for name, format in formatters} for row in rows]
+        for item in items:
+            if SKIP in item.values():
+                for name in [name for name, value in item.items() if value is SKIP]:
+                    del item[name]
+        return items
+
+
+class FastListMixin:
+    """
+    Serve ``list`` through ``row_format`` instead of the serializer.
+    """
+
+    row_format = None
+
+    def get_rows_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        if self.row_format is None:
+            return super().list(request, *args, **kwargs)
+        names = self.row_format.field_names(request)
+        columns, _ = self.row_format.compile(names)
+        queryset = self.get_rows_queryset().values(*columns)
+
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+        with serializing():
+            data = self.row_format.render(rows, names, request)
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
+
+
+# ─── Courses ────────────────────────────────────────────────────────────────
+
+
+def _final_price(row, ctx):
+    return _decimal(max(row["price"] - row["discount"], 0))
+
+
+def _available_places(row, ctx):
+    return max(row["total_places"] - row["booked_places"], 0)
+
+
+def _duration_months(row, ctx):
+    start, end = row["start_date"], row["end_date"]
+    if start and end:
+        d = relativedelta(end, start)
+        return d.years * 12 + d.months + (1 if d.days > 0 else 0)
+    return None
+
+
+def _coordinate(name):
+    return (name,), lambda row, ctx: float(row[name]) if row[name] else None
+
+
+def _map_url(template):
+    def format(row, ctx):
+        lat, lng = row["branch__latitude"], row["branch__longitude"]
+        return template.format(lat=lat, lng=lng) if lat and lng else None
+    return ("branch__latitude", "branch__longitude"), format
+
+
+def course_students(ids):
+    students = defaultdict(list)
+    rows = (
+        Enrollment.objects.filter(course_id__in=ids)
+        .values_list("course_id", "id", "user__full_name", "user__phone_number", "status")
+    )
+    for course_id, pk, full_name, phone_number, status in rows:
+        students[course_id].append({
+            "id": pk,
+            "full_name": full_name,
+            "phone_number": phone_number,
+            "status": status,
+        })
+    return students
+
+
+_center_storage = EducationCenter._meta.get_field("logo").storage
+
+COURSE_ROWS = RowFormat(
+    {
+        "id": column("id"),
+        "name": column("name"),
+        "is_archived": column("is_archived"),
+        "branch_id": column("branch_id"),
+        "branch_name": column("branch__name"),
+        "category_id": column("category_id"),
+        "category_name": lookup_name(Category, "category_id"),
+        "level_id": column("level_id"),
+        "level_name": lookup_name(Level, "level_id"),
+        "teacher_id": column("teacher_id"),
+        "teacher_name": through_nullable("teacher__full_name"),
+        "teacher_gender": through_nullable("teacher__gender"),
+        "days": (("day_mask",), lambda row, ctx: list(DAY_MASK_LABELS[row["day_mask"]])),
+        "start_date": column("start_date", _iso),
+        "end_date": column("end_date", _iso),
+        "total_places": column("total_places"),
+        "price": column("price", _decimal),
+        "discount": column("discount", _decimal),
+        "start_time": column("start_time", _iso),
+        "end_time": column("end_time", _iso),
+        "intensive": column("intensive"),
+        "final_price": (("price", "discount"), _final_price),
+        "available_places": (("total_places", "booked_places"), _available_places),
+        "duration_months": (("start_date", "end_date"), _duration_months),
+        "work_time": column("branch__work_time"),
+        "edu_center_logo": media("branch__edu_center__logo", _center_storage),
+        "edu_center_logo_srcset": srcset(
+            "branch__edu_center__image_variants", "branch__edu_center__logo", "logo"),
+        "cover": media("branch__edu_center__cover", _center_storage),
+        "cover_srcset": srcset(
+            "branch__edu_center__image_variants", "branch__edu_center__cover", "cover"),
+        "latitude": _coordinate("branch__latitude"),
+        "longitude": _coordinate("branch__longitude"),
+        "phone_number": column("branch__phone_number"),
+        "telegram_link": column("branch__edu_center__telegram_link"),
+        "google_map": _map_url("https://www.google.com/maps/dir/?api=1&destination={lat},{lng}"),
+        "yandex_map": _map_url("https://yandex.com/maps/?rtext=~{lat},{lng}"),
+        "students": related("students"),
+    },
+    loaders={"students": course_students},
+)
+
+
+# ─── Events ─────────────────────────────────────────────────────────────────
+
+
+def event_category_names(ids):
+    names = defaultdict(list)
+    rows = (
+        Event.categories.through.objects.filter(event_id__in=ids)
+        .order_by(*(f"category__{f}" for f in Category._meta.ordering))
+        .values_list("event_id", "category__name")
+    )
+    for event_id, name in rows:
+        names[event_id].append(name)
+    return names
+
+
+EVENT_ROWS = RowFormat(
+    {
+        "id": column("id"),
+        "name": column("name"),
+        "picture": media("picture", Event._meta.get_field("picture").storage),
+        "picture_srcset": srcset("image_variants", "picture", "picture"),
+        "date": column("date", _iso),
+        "start_time": column("start_time", _iso),
+        "requirements": column("requirements"),
+        "price": column("price", _decimal),
+        "description": column("description"),
+        "link": column("link"),
+        "branch_name": or_none("branch__name"),
+        "phone_number": or_none("branch__phone_number"),
+        "edu_center_name": column("branch__edu_center__name"),
+        "edu_center_logo": media("branch__edu_center__logo", _center_storage),
+        "edu_center_logo_srcset": srcset(
+            "edu_center__image_variants", "edu_center__logo", "logo"),
+        "category_names": related("category_names"),
+        "is_archived": column("is_archived"),
+        "telegram_link": or_none("branch__telegram_link"),
+    },
+    loaders={"category_names": event_category_names},
+)
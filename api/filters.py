@@ -1,7 +1,8 @@
 import json
-from django.db.models import Q
+from django.db.models import F, Q
+from django.utils import timezone
 from django_filters import rest_framework as filters
-from main.models import Course, Event, Day
+from main.models import DAY_BITS, Course, Event
 
 
 def parse_int_list(raw):
@@ -96,12 +97,14 @@ class CourseFilter(filters.FilterSet):
 
     def filter_day(self, qs, name, raw):
         codes = [v.capitalize()[:3].upper() for v in parse_str_list(raw)]
-        if not codes:
+        mask = 0
+        for value, bit in DAY_BITS.items():
+            if any(value.startswith(c) for c in codes):
+                mask |= bit
+        if not mask:
             return qs
-        q = Q()
-        for c in codes:
-            q |= Q(days__name__startswith=c)
-        filtered = qs.filter(q).distinct()
+        # A bitwise test on Course.day_mask: no join, so no DISTINCT either.
+        filtered = qs.alias(day_hits=F("day_mask").bitand(mask)).filter(day_hits__gt=0)
         return filtered if filtered.exists() else qs
 
     def filter_queryset(self, qs):
@@ -130,10 +133,13 @@ class CourseFilter(filters.FilterSet):
         if raw_d not in (None, '', []):
             qs = self.filter_day(qs, 'day', raw_d)
 
-        return qs.distinct()
+        # Every filter above follows a forward FK or the day mask, so rows
+        # cannot repeat and no DISTINCT is needed.
+        return qs
 
 
 class EventFilter(filters.FilterSet):
+    upcoming = filters.BooleanFilter(method="filter_upcoming")
     category_ids = filters.CharFilter(method="filter_category")
     edu_center_ids = filters.CharFilter(method="filter_center")
     start_date = filters.DateFilter(field_name="date", lookup_expr="gte")
@@ -157,9 +163,16 @@ class EventFilter(filters.FilterSet):
         filtered = qs.filter(edu_center__id__in=ids)
         return filtered if filtered.exists() else qs
 
+    def filter_upcoming(self, qs, name, value):
+        if not value:
+            return qs
+        # Walks main_event_upcoming_idx in order.
+        return qs.filter(date__gte=timezone.localdate()).order_by("date", "start_time")
+
     def filter_queryset(self, qs):
         params = self.request.query_params
 
+        qs = self.filter_upcoming(qs, 'upcoming', self.form.cleaned_data.get('upcoming'))
         qs = self.filter_category(qs, 'category_ids',     params.get('category_ids'))
         qs = self.filter_center(qs, 'edu_center_ids',   params.get('edu_center_ids'))
 
@@ -170,4 +183,7 @@ class EventFilter(filters.FilterSet):
                 if candidate.exists():
                     qs = candidate
 
-        return qs.distinct()
+        # Only the categories M2M join can repeat rows.
+        if parse_int_list(params.get('category_ids')):
+            qs = qs.distinct()
+        return qs
@@ -0,0 +1,167 @@
+"""
+Per-request SQL and timing instrumentation, cheap enough for production.
+
+A sampled request records every query it runs, the time spent turning
+objects into response data (serializers and ``api.fastpath`` rows) and the
+response size. The numbers go out as a ``Server-Timing`` header and as one
+JSON log line on the ``api.instrumentation`` logger. Queries are grouped by
+a signature of their SQL with values and ``IN`` lists stripped, so a
+signature repeated ``INSTRUMENTATION_DUPLICATE_THRESHOLD`` times is flagged
+as a likely N+1, e.g. an aggregate run once per serialized row.
+"""
+import hashlib
+import json
+import logging
+import random
+import re
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+
+logger = logging.getLogger(__name__)
+
+_profile = ContextVar("request_profile", default=None)
+
+_IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_SPACE = re.compile(r"\s+")
+
+
+def query_signature(sql):
+    """
+    Short hash of ``sql`` with its varying parts (``IN`` lists, literal
+    numbers such as ``LIMIT``/``OFFSET``, whitespace) normalized away.
+    """
+    normalized = _NUMBER.sub("?", _IN_LIST.sub("IN (...)", _SPACE.sub(" ", sql)))
+    return hashlib.blake2b(normalized.encode(), digest_size=6).hexdigest()
+
+
+class RequestProfile:
+    """
+    What one request spent: an ``execute_wrapper`` counting and timing its
+    queries, plus the time spent serializing.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.signatures = Counter()
+        self.examples = {}
+        self._serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - started
+            self.queries += 1
+            signature = query_signature(sql)
+            self.signatures[signature] += 1
+            self.examples.setdefault(signature, sql)
+
+    def duplicates(self, threshold):
+        return [
+            {"signature": signature, "count": count, "sql": self.examples[signature][:300]}
+            for signature, count in self.signatures.most_common()
+            if count >= threshold
+        ]
+
+
+@contextmanager
+def serializing():
+    """
+    Count the enclosed block as serializer time of the current request.
+    Nested blocks are counted once.
+    """
+    profile = _profile.get()
+    if profile is None or profile._serializing:
+        yield
+        return
+    profile._serializing = True
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        profile._serializing = False
+        profile.serialize_time += perf_counter() - started
+
+
+def instrument_serializers():
+    """
+    Time ``.data`` of every DRF serializer. ``Serializer.data`` and
+    ``ListSerializer.data`` both go through ``BaseSerializer.data``.
+
+    Patched on the first sampled request, so processes that never sample
+    keep DRF's own property.
+    """
+    data = BaseSerializer.data
+    if getattr(data.fget, "instrumented", False):
+        return
+
+    def get(self):
+        with serializing():
+            return data.fget(self)
+    get.instrumented = True
+    BaseSerializer.data = property(get, doc=data.__doc__)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Profile ``INSTRUMENTATION_SAMPLE_RATE`` of requests (0 disables, 1
+    profiles all). Place it first in ``MIDDLEWARE`` so the queries of every
+    other middleware are included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.INSTRUMENTATION_SAMPLE_RATE
+        if not rate or random.random() >= rate:
+            return self.get_response(request)
+
+        instrument_serializers()
+        profile = RequestProfile()
+        token = _profile.set(profile)
+        started = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        total = perf_counter() - started
+
+        size = None if response.streaming else len(response.content)
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={profile.db_time * 1000:.1f};desc="{profile.queries} queries"',
+            f"serialize;dur={profile.serialize_time * 1000:.1f}",
+            f"total;dur={total * 1000:.1f}",
+        ])
+
+        duplicates = profile.duplicates(settings.INSTRUMENTATION_DUPLICATE_THRESHOLD)
+        match = request.resolver_match
+        logger.log(
+            logging.WARNING if duplicates else logging.INFO,
+            json.dumps({
+                "method": request.method,
+                "path": request.path,
+                "view": match.view_name if match else None,
+                "status": response.status_code,
+                "total_ms": round(total * 1000, 1),
+                "db_ms": round(profile.db_time * 1000, 1),
+                "queries": profile.queries,
+                "serialize_ms": round(profile.serialize_time * 1000, 1),
+                "response_bytes": size,
+                "duplicate_queries": duplicates,
+            }),
+        )
+        return response
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+
+class MediaResolver:
+    """
+    Absolute media URLs for one request.
+
+    The base (``MEDIA_HOST`` when configured, else the request's scheme and
+    host) is resolved once, and each storage name is turned into a URL at
+    most once, however many rows or fields repeat it.
+    """
+
+    def __init__(self, request=None):
+        host = getattr(settings, "MEDIA_HOST", "")
+        if host:
+            self.base = host.rstrip("/")
+        elif request is not None:
+            self.base = request.build_absolute_uri("/").rstrip("/")
+        else:
+            self.base = ""
+        self._urls = {}
+
+    def url(self, name, storage=default_storage):
+        """
+        Absolute URL of ``name`` in ``storage``; URLs the storage already
+        makes absolute (e.g. S3) are returned unchanged.
+        """
+        if not name:
+            return None
+        url = self._urls.get(name)
+        if url is None:
+            url = storage.url(name)
+            if url.startswith("/"):
+                url = self.base + url
+            self._urls[name] = url
+        return url
+
+    def file_url(self, file):
+        if not file:
+            return None
+        return self.url(file.name, file.storage)
+
+
+def get_media_resolver(context):
+    """
+    The ``MediaResolver`` of the serializer ``context``'s request, created on
+    first use and shared by every serializer rendering that request.
+    """
+    request = context.get("request")
+    if request is None:
+        return MediaResolver()
+    resolver = getattr(request, "_media_resolver", None)
+    if resolver is None:
+        resolver = request._media_resolver = MediaResolver(request)
+    return resolver
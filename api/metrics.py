@@ -0,0 +1,132 @@
+"""
+Prometheus metrics for the API, the cache and Celery, exposed at ``/metrics``.
+
+Gunicorn runs several worker processes, so each one would otherwise report
+only its own requests. Set ``PROMETHEUS_MULTIPROC_DIR`` to an empty
+directory, the same one for the web workers and any Celery workers on the
+host, before they start: every process then writes its samples there and
+``/metrics`` merges them. Point gunicorn's ``child_exit`` hook at
+``api.metrics.child_exit`` so dead workers' gauges are dropped.
+"""
+import os
+from time import perf_counter
+
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter,
+                               Histogram, generate_latest, multiprocess)
+
+REQUEST_LATENCY = Histogram(
+    "educompass_http_request_duration_seconds",
+    "Time to serve a request, by URL name (DRF route and action), method and status class.",
+    ["view", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_QUERIES = Histogram(
+    "educompass_http_request_db_queries",
+    "SQL queries run while serving a request, by URL name.",
+    ["view"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000),
+)
+CACHE_REQUESTS = Counter(
+    "educompass_cache_requests_total",
+    "Cache reads by result (hit or miss); hit ratio = hits / all.",
+    ["result"],
+)
+TASK_DURATION = Histogram(
+    "educompass_celery_task_duration_seconds",
+    "Celery task run time, by task name.",
+    ["task"],
+    buckets=(0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+)
+TASKS = Counter(
+    "educompass_celery_tasks_total",
+    "Finished Celery task runs, by task name and final state (SUCCESS, FAILURE, RETRY...).",
+    ["task", "state"],
+)
+
+
+def record_cache_read(hit):
+    CACHE_REQUESTS.labels("hit" if hit else "miss").inc()
+
+
+# ─── HTTP ────────────────────────────────────────────────────────────────────
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """
+    Observe latency and query count of every request. Put it first in
+    ``MIDDLEWARE`` so the time spent in other middleware is included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = _QueryCounter()
+        started = perf_counter()
+        with connections["default"].execute_wrapper(queries):
+            response = self.get_response(request)
+        elapsed = perf_counter() - started
+
+        match = request.resolver_match
+        view = match.view_name if match else "<unmatched>"
+        REQUEST_LATENCY.labels(view, request.method, f"{response.status_code // 100}xx").observe(
+            elapsed
+        )
+        REQUEST_QUERIES.labels(view).observe(queries.count)
+        return response
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition. With ``METRICS_TOKEN`` set, scrapers must
+    send ``Authorization: Bearer <token>``.
+    """
+    token = settings.METRICS_TOKEN
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponse(status=401)
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+def child_exit(server, worker):
+    """
+    Gunicorn hook: forget the samples of a worker that exited.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(worker.pid)
+
+
+# ─── Celery ──────────────────────────────────────────────────────────────────
+
+_task_started = {}
+
+
+@task_prerun.connect
+def task_started(task_id=None, **kwargs):
+    _task_started[task_id] = perf_counter()
+
+
+@task_postrun.connect
+def task_finished(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        TASK_DURATION.labels(task.name).observe(perf_counter() - started)
+    TASKS.labels(task.name, state or "UNKNOWN").inc()
@@ -0,0 +1,67 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib classes below take over
+    orjson = None
+
+ORJSON_OPTIONS = (
+    orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` on top of orjson, with the same output: compact,
+    unescaped UTF-8, datetimes in ISO 8601 with ``Z`` for UTC and anything
+    orjson does not know natively (``Decimal``, lazy strings, querysets...)
+    converted by DRF's own encoder.
+
+    Falls back to the stdlib renderer when orjson is missing, for indented
+    output (browsable API, ``; indent=`` in ``Accept``) and for settings the
+    fast path does not implement.
+    """
+
+    _default = staticmethod(encoders.JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            or self.ensure_ascii
+            or not self.compact
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        ret = orjson.dumps(data, default=self._default, option=ORJSON_OPTIONS)
+        # Like DRF, escape the separators that break JSON embedded in JS.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    """
+    ``JSONParser`` on top of orjson; plain ``JSONParser`` without it.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read() if stream is not None else b""
+            if encoding.lower().replace("-", "") != "utf8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except ValueError as exc:  # includes orjson.JSONDecodeError
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,97 @@
+"""
+Who may act on which centers and branches.
+
+One resolver reads a user's ``is_active``, role and administered centers
+and branches; the result is cached per user and shared by the dashboard
+querysets (``get_scope``) and JWT authentication
+(``accounts.authentication``). ``api.signals`` drops the entry whenever any
+of it can change.
+"""
+from collections import namedtuple
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from api.caches import is_cache_shared
+from main.models import Branch, EducationCenter
+
+STATE_TIMEOUT = 60
+# In a process-local cache (no CACHE_URL) invalidate_state() only reaches the
+# worker that made the write; the others must not trust a state for long,
+# since update/destroy querysets are filtered by it.
+LOCAL_STATE_TIMEOUT = 5
+SCOPED_ROLES = ("EDU_CENTER", "BRANCH")
+
+Scope = namedtuple("Scope", ["center_ids", "branch_ids"])
+
+
+def state_timeout():
+    return STATE_TIMEOUT if is_cache_shared() else LOCAL_STATE_TIMEOUT
+
+
+def state_key(user_id):
+    return f"api:user-state:{user_id}"
+
+
+def resolve_state(user_id):
+    """
+    ``{"is_active", "role", "center_ids", "branch_ids"}`` of a user, straight
+    from the database; an empty dict when the user does not exist.
+
+    Only center admins administer anything: BRANCH users have no link to a
+    branch in this schema, so their scope is empty.
+    """
+    user = get_user_model().objects.filter(pk=user_id).values("is_active", "role").first()
+    if user is None:
+        return {}
+    center_ids, branch_ids = [], []
+    if user["role"] == "EDU_CENTER":
+        center_ids = list(
+            EducationCenter.objects.filter(user_id=user_id)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        branch_ids = list(
+            Branch.objects.filter(edu_center_id__in=center_ids)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+    return {**user, "center_ids": center_ids, "branch_ids": branch_ids}
+
+
+def get_state(user_id):
+    """
+    ``resolve_state`` of a user, cached.
+    """
+    key = state_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        state = resolve_state(user_id)
+        cache.set(key, state, state_timeout())
+    return state
+
+
+def invalidate_state(user_id):
+    cache.delete(state_key(user_id))
+
+
+def get_scope(request):
+    """
+    The caller's allowed center and branch IDs, or ``None`` for roles that
+    are not limited to their own centers (anonymous, students, staff).
+
+    Resolved at most once per request and cached per user across requests,
+    so role-based querysets can filter on ``branch_id IN (...)`` instead of
+    joining through ``branch__edu_center__user``.
+    """
+    user = getattr(request, "user", None)
+    if not user or not user.is_authenticated or user.role not in SCOPED_ROLES:
+        return None
+
+    scope = getattr(request, "_edu_scope", None)
+    if scope is None:
+        state = get_state(user.pk)
+        scope = request._edu_scope = Scope(
+            state.get("center_ids", []), state.get("branch_ids", [])
+        )
+    return scope
@@ -1,15 +1,91 @@
 from decimal import Decimal, InvalidOperation
+from django.db import models, transaction
 from django.db.models import DecimalField
 from dateutil.relativedelta import relativedelta
-from django.db.models import Count, Sum, F, Value
+from django.db.models import Count, Sum, F, Q, Value
+from django.utils import timezone
 
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
 
-from main.models import (Branch, Category, Course, Day, EducationCenter,
-                         EduType, Enrollment, Event, Level, Like, Teacher,
-                         View, Banner)
+from main.models import (DAY_MASK_LABELS, Branch, Category, Course, Day,
+                         EducationCenter, EduType, Enrollment, Event, Level,
+                         Like, Teacher, View, Banner, refresh_day_masks)
+from main import lookups
+from main.thumbnails import srcset
 from accounts.models import CenterPayment, MonthlyCenterReport, PaidAmountLog
+from api.media import get_media_resolver
+from api.scopes import get_scope
+from api.sparse import SparseFieldsMixin
+
+
+class ScopedBranchDefault:
+    """
+    Default for the hidden ``branch`` field of BRANCH admins: their first
+    branch, fetched only when a write is validated.
+    """
+    requires_context = True
+
+    def __call__(self, serializer_field):
+        scope = get_scope(serializer_field.context["request"])
+        return Branch.objects.get(pk=scope.branch_ids[0])
+
+
+class LookupRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key of a ``main.lookups`` table, validated against the
+    in-process copy instead of a ``SELECT`` per value.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        obj = lookups.get(self.get_queryset().model, pk)
+        if obj is None:
+            self.fail("does_not_exist", pk_value=data)
+        return obj
+
+
+class MediaImageField(serializers.ImageField):
+    """
+    ``ImageField`` whose URLs come from the request's ``MediaResolver``.
+    """
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        if not getattr(self, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+            return value.name
+        return get_media_resolver(self.context).file_url(value)
+
+
+MEDIA_FIELD_MAPPING = {
+    **serializers.ModelSerializer.serializer_field_mapping,
+    models.ImageField: MediaImageField,
+}
+
+
+class SrcsetField(serializers.Field):
+    """
+    Read-only ``{"webp": {"64w": url, ...}, "jpeg": {...}}`` map of an image
+    field's thumbnails, ``None`` until ``main.thumbnails`` has built them.
+    """
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs["read_only"] = True
+        kwargs.setdefault("source", "*")
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        if instance is None:
+            return None
+        return srcset(instance, self.image_field, get_media_resolver(self.context).url)
 
 
 class DynamicBranchSerializerMixin:
@@ -22,25 +98,27 @@ class DynamicBranchSerializerMixin:
 
         if user.role == "EDU_CENTER":
             self.fields["branch"] = serializers.PrimaryKeyRelatedField(
-                queryset=Branch.objects.filter(edu_center__user=user),
+                queryset=Branch.objects.filter(id__in=get_scope(request).branch_ids),
                 required=True,
             )
         elif user.role == "BRANCH":
-            branch = user.branches.first()
-            if not branch:
+            if not get_scope(request).branch_ids:
                 raise serializers.ValidationError(
                     "Sizga biriktirilgan filial topilmadi.")
-            self.fields["branch"] = serializers.HiddenField(default=branch)
+            self.fields["branch"] = serializers.HiddenField(default=ScopedBranchDefault())
         else:
             self.fields["branch"] = serializers.PrimaryKeyRelatedField(
                 queryset=Branch.objects.none(), required=False
             )
 
 
-class EducationCenterSerializer(serializers.ModelSerializer):
+class EducationCenterSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    serializer_field_mapping = MEDIA_FIELD_MAPPING
     likes_count = serializers.IntegerField(read_only=True)
     views_count = serializers.IntegerField(read_only=True)
     categories = serializers.SerializerMethodField()
+    logo_srcset = SrcsetField("logo")
+    cover_srcset = SrcsetField("cover")
 
     class Meta:
         model = EducationCenter
@@ -55,7 +133,9 @@ class EducationCenterSerializer(serializers.ModelSerializer):
             "edu_type",
             "categories",
             "logo",
+            "logo_srcset",
             "cover",
+            "cover_srcset",
             "instagram_link",
             "telegram_link",
             "facebook_link",
@@ -63,6 +143,14 @@ class EducationCenterSerializer(serializers.ModelSerializer):
             "likes_count",
             "views_count",
         ]
+        sparse_paths = {
+            "edu_type": (),
+            "categories": (),
+            "logo_srcset": ("logo", "image_variants"),
+            "cover_srcset": ("cover", "image_variants"),
+            "likes_count": (),
+            "views_count": (),
+        }
 
     def get_categories(self, obj):
         cats = set()
@@ -95,7 +183,7 @@ class EduTypeSerializer(serializers.ModelSerializer):
 
 
 class LevelSerializer(serializers.ModelSerializer):
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = LookupRelatedField(
         source="category",
         queryset=Category.objects.all(),
         write_only=True
@@ -107,12 +195,13 @@ class LevelSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "category_id", "category"]
 
     def get_category(self, obj):
-        if not obj.category:
+        category = lookups.get(Category, obj.category_id)
+        if not category:
             return None
         return {
-            "id":         obj.category.id,
-            "name":       obj.category.name,
-            "icon_class": obj.category.icon_class,
+            "id":         category.id,
+            "name":       category.name,
+            "icon_class": category.icon_class,
         }
 
 
@@ -157,7 +246,20 @@ class CourseEnrollmentStudentSerializer(serializers.ModelSerializer):
         fields = ["id", "full_name", "phone_number", "status"]
 
 
-class CourseSerializer(serializers.ModelSerializer):
+DAY_ABBR_TO_VALUE = {
+    label[:3].capitalize(): value for value, label in Day.DayChoices.choices
+}
+
+
+def parse_days_csv(days_csv):
+    """
+    Turn "Mon,Wed" into ``Day.name`` values, skipping unknown abbreviations.
+    """
+    abbrs = [d.strip() for d in days_csv.split(",") if d.strip()]
+    return [DAY_ABBR_TO_VALUE[a] for a in abbrs if a in DAY_ABBR_TO_VALUE]
+
+
+class CourseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     days = serializers.CharField(
         required=False,
         help_text='Comma-separated days, e.g. "Sun,Sat,Fri"'
@@ -167,12 +269,12 @@ class CourseSerializer(serializers.ModelSerializer):
     branch_id = serializers.PrimaryKeyRelatedField(
         source="branch",   queryset=Branch.objects.all())
     branch_name = serializers.CharField(source="branch.name",          read_only=True)
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = LookupRelatedField(
         source="category", queryset=Category.objects.all())
-    category_name = serializers.CharField(source="category.name",        read_only=True)
-    level_id = serializers.PrimaryKeyRelatedField(
+    category_name = serializers.SerializerMethodField()
+    level_id = LookupRelatedField(
         source="level",    queryset=Level.objects.all())
-    level_name = serializers.CharField(source="level.name",           read_only=True)
+    level_name = serializers.SerializerMethodField()
     teacher_id = serializers.PrimaryKeyRelatedField(
         source="teacher",  queryset=Teacher.objects.all())
     teacher_name = serializers.CharField(source="teacher.full_name",    read_only=True)
@@ -188,7 +290,9 @@ class CourseSerializer(serializers.ModelSerializer):
 
     # ─── Media & map fields ───────────────────────────────────────────────
     edu_center_logo = serializers.SerializerMethodField()
+    edu_center_logo_srcset = SrcsetField("logo", source="branch.edu_center")
     cover = serializers.SerializerMethodField()
+    cover_srcset = SrcsetField("cover", source="branch.edu_center")
     latitude = serializers.SerializerMethodField()
     longitude = serializers.SerializerMethodField()
     phone_number = serializers.CharField(
@@ -225,7 +329,7 @@ class CourseSerializer(serializers.ModelSerializer):
             "final_price", "available_places", "duration_months", "work_time",
 
             # media & mapping
-            "edu_center_logo", "cover",
+            "edu_center_logo", "edu_center_logo_srcset", "cover", "cover_srcset",
             "latitude", "longitude",
             "phone_number", "telegram_link",
             "google_map", "yandex_map",
@@ -240,42 +344,55 @@ class CourseSerializer(serializers.ModelSerializer):
             "latitude", "longitude", "phone_number", "telegram_link",
             "google_map", "yandex_map", "students"
         ]
-
-    def _abbr_to_value(self):
-        return {
-            label[:3].capitalize(): value
-            for value, label in Day.DayChoices.choices
+        sparse_paths = {
+            "days": ("day_mask",),
+            "category_name": ("category_id",),
+            "level_name": ("level_id",),
+            "final_price": ("price", "discount"),
+            "available_places": ("total_places", "booked_places"),
+            "duration_months": ("start_date", "end_date"),
+            "edu_center_logo": ("branch__edu_center__logo",),
+            "edu_center_logo_srcset": (
+                "branch__edu_center__logo", "branch__edu_center__image_variants"),
+            "cover": ("branch__edu_center__cover",),
+            "cover_srcset": (
+                "branch__edu_center__cover", "branch__edu_center__image_variants"),
+            "latitude": ("branch__latitude",),
+            "longitude": ("branch__longitude",),
+            "google_map": ("branch__latitude", "branch__longitude"),
+            "yandex_map": ("branch__latitude", "branch__longitude"),
+            "students": (),
         }
 
     def create(self, validated_data):
         days_csv = validated_data.pop("days", None)
         course = super().create(validated_data)
         if isinstance(days_csv, str):
-            mapping = self._abbr_to_value()
-            abbrs = [d.strip() for d in days_csv.split(",") if d.strip()]
-            vals = [mapping[a] for a in abbrs if a in mapping]
-            course.days.set(Day.objects.filter(name__in=vals))
+            course.days.set(lookups.day_ids(parse_days_csv(days_csv)))
         return course
 
     def update(self, instance, validated_data):
         days_csv = validated_data.pop("days", None)
         course = super().update(instance, validated_data)
         if isinstance(days_csv, str):
-            mapping = self._abbr_to_value()
-            abbrs = [d.strip() for d in days_csv.split(",") if d.strip()]
-            vals = [mapping[a] for a in abbrs if a in mapping]
-            course.days.set(Day.objects.filter(name__in=vals))
+            course.days.set(lookups.day_ids(parse_days_csv(days_csv)))
         return course
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        data["days"] = [
-            d.get_name_display()[:3].capitalize()
-            for d in instance.days.all()
-        ]
+        if "days" in self.fields:
+            data["days"] = list(DAY_MASK_LABELS[instance.day_mask])
         return data
 
     # ─── other SerializerMethodFields ───────────────────────────────────
+    def get_category_name(self, obj):
+        category = lookups.get(Category, obj.category_id)
+        return category.name if category else None
+
+    def get_level_name(self, obj):
+        level = lookups.get(Level, obj.level_id)
+        return level.name if level else None
+
     def get_duration_months(self, obj):
         if obj.start_date and obj.end_date:
             d = relativedelta(obj.end_date, obj.start_date)
@@ -283,14 +400,12 @@ class CourseSerializer(serializers.ModelSerializer):
         return None
 
     def get_edu_center_logo(self, obj):
-        req = self.context.get("request")
         logo = getattr(obj.branch.edu_center, "logo", None)
-        return req.build_absolute_uri(logo.url) if logo and req else getattr(logo, "url", None)
+        return get_media_resolver(self.context).file_url(logo)
 
     def get_cover(self, obj):
-        req = self.context.get("request")
         cov = getattr(obj.branch.edu_center, "cover", None)
-        return req.build_absolute_uri(cov.url) if cov and req else getattr(cov, "url", None)
+        return get_media_resolver(self.context).file_url(cov)
 
     def get_latitude(self, obj):
         return float(obj.branch.latitude) if obj.branch and obj.branch.latitude else None
@@ -311,13 +426,167 @@ class CourseSerializer(serializers.ModelSerializer):
         return None
 
 
-class EventSerializer(DynamicBranchSerializerMixin, serializers.ModelSerializer):
+BULK_COURSES_MAX = 500
+
+
+class CourseBulkItemSerializer(serializers.ModelSerializer):
+    """
+    One row of a bulk course upload. Foreign keys are plain IDs here and are
+    checked for the whole batch at once by ``CourseBulkSerializer``.
+    """
+    id = serializers.IntegerField(required=False)
+    branch_id = serializers.IntegerField()
+    category_id = serializers.IntegerField()
+    level_id = serializers.IntegerField()
+    teacher_id = serializers.IntegerField()
+    days = serializers.CharField(
+        required=False,
+        help_text='Comma-separated days, e.g. "Sun,Sat,Fri"'
+    )
+
+    class Meta:
+        model = Course
+        fields = [
+            "id", "name", "is_archived",
+            "branch_id", "category_id", "level_id", "teacher_id",
+            "days",
+            "start_date", "end_date", "total_places",
+            "price", "discount", "start_time", "end_time", "intensive",
+        ]
+        # (name, branch) uniqueness is checked batch-wide, not per row.
+        validators = []
+
+
+class CourseBulkSerializer(serializers.Serializer):
+    """
+    Create (no ``id``) or fully replace (with ``id``) up to
+    ``BULK_COURSES_MAX`` courses in one transaction.
+
+    Errors come back per row, aligned with the input list.
+    """
+    courses = CourseBulkItemSerializer(
+        many=True, allow_empty=False, max_length=BULK_COURSES_MAX
+    )
+
+    SCALAR_FIELDS = [
+        "name", "is_archived", "branch_id", "category_id", "level_id", "teacher_id",
+        "start_date", "end_date", "total_places", "price", "discount",
+        "start_time", "end_time", "intensive",
+    ]
+
+    def validate_courses(self, rows):
+        scope = get_scope(self.context["request"])
+        branch_ids = set(scope.branch_ids) if scope else set()
+
+        def ids(key):
+            return {row[key] for row in rows if row.get(key) is not None}
+
+        categories = lookups.existing_ids(Category, ids("category_id"))
+        levels = lookups.existing_ids(Level, ids("level_id"))
+        teachers = set(Teacher.objects.filter(id__in=ids("teacher_id"))
+                       .values_list("id", flat=True))
+        updatable = set(Course.objects.filter(id__in=ids("id"), branch_id__in=branch_ids)
+                        .values_list("id", flat=True))
+        taken = {
+            (name, branch_id): pk
+            for pk, name, branch_id in Course.objects.filter(
+                branch_id__in=ids("branch_id") & branch_ids,
+                name__in={row["name"] for row in rows},
+            ).values_list("id", "name", "branch_id")
+        }
+
+        errors, seen, failed = [], set(), False
+        for row in rows:
+            row_errors = {}
+            if row["branch_id"] not in branch_ids:
+                row_errors["branch_id"] = ["You may only add courses to your own branches."]
+            if row["category_id"] not in categories:
+                row_errors["category_id"] = ["Category not found."]
+            if row["level_id"] not in levels:
+                row_errors["level_id"] = ["Level not found."]
+            if row["teacher_id"] not in teachers:
+                row_errors["teacher_id"] = ["Teacher not found."]
+            if "id" in row and row["id"] not in updatable:
+                row_errors["id"] = ["Course not found."]
+
+            key = (row["name"], row["branch_id"])
+            if key in seen or taken.get(key, row.get("id")) != row.get("id"):
+                row_errors["name"] = ["A course with this name already exists in the branch."]
+            seen.add(key)
+
+            errors.append(row_errors)
+            failed = failed or bool(row_errors)
+
+        if failed:
+            raise serializers.ValidationError(errors)
+        return rows
+
+    def create(self, validated_data):
+        rows = validated_data["courses"]
+        day_ids = {}
+        for pk, day in lookups.get_table(Day).items():
+            day_ids.setdefault(day.name, []).append(pk)
+
+        with transaction.atomic():
+            new = [row for row in rows if "id" not in row]
+            existing = [row for row in rows if "id" in row]
+
+            # Bulk writes send no post_save, so bump the centers' watermarks
+            # here: those of the target branches and of the branches the
+            # updated courses are moved out of.
+            now = timezone.now()
+            EducationCenter.objects.filter(
+                Q(branches__id__in={row["branch_id"] for row in rows})
+                | Q(branches__courses__id__in=[row["id"] for row in existing])
+            ).update(updated_at=now)
+
+            created = Course.objects.bulk_create(
+                [Course(**{f: row.get(f) for f in self.SCALAR_FIELDS if f in row})
+                 for row in new]
+            )
+            # bulk_update() skips auto_now, so stamp updated_at by hand.
+            updated = [
+                Course(id=row["id"], updated_at=now,
+                       **{f: row.get(f) for f in self.SCALAR_FIELDS if f in row})
+                for row in existing
+            ]
+            Course.objects.bulk_update(updated, self.SCALAR_FIELDS + ["updated_at"])
+
+            # Replace the days of rows that sent them via bulk through rows.
+            Through = Course.days.through
+            with_days = [
+                (course, row) for course, row in zip(created + updated, new + existing)
+                if isinstance(row.get("days"), str)
+            ]
+            Through.objects.filter(
+                course_id__in=[row["id"] for _, row in with_days if "id" in row]
+            ).delete()
+            Through.objects.bulk_create([
+                Through(course_id=course.id, day_id=day_id)
+                for course, row in with_days
+                for value in set(parse_days_csv(row["days"]))
+                for day_id in day_ids.get(value, [])
+            ])
+            # bulk_create skips m2m_changed, so sync day_mask explicitly.
+            refresh_day_masks([course.id for course, _ in with_days])
+
+        return {
+            "created": [course.id for course in created],
+            "updated": [course.id for course in updated],
+        }
+
+
+class EventSerializer(SparseFieldsMixin, DynamicBranchSerializerMixin,
+                      serializers.ModelSerializer):
+    serializer_field_mapping = MEDIA_FIELD_MAPPING
     edu_center_name = serializers.SerializerMethodField(read_only=True)
     edu_center_logo = serializers.SerializerMethodField(read_only=True)
     category_names = serializers.SerializerMethodField(read_only=True)
     phone_number = serializers.SerializerMethodField(read_only=True)
     telegram_link = serializers.SerializerMethodField(read_only=True)
     branch_name = serializers.SerializerMethodField(read_only=True)
+    picture_srcset = SrcsetField("picture")
+    edu_center_logo_srcset = SrcsetField("logo", source="edu_center")
 
     class Meta:
         model = Event
@@ -325,6 +594,7 @@ class EventSerializer(DynamicBranchSerializerMixin, serializers.ModelSerializer)
             "id",
             "name",
             "picture",
+            "picture_srcset",
             "date",
             "start_time",
             "requirements",
@@ -335,10 +605,21 @@ class EventSerializer(DynamicBranchSerializerMixin, serializers.ModelSerializer)
             "phone_number",
             "edu_center_name",
             "edu_center_logo",
+            "edu_center_logo_srcset",
             "category_names",
             "is_archived",
             "telegram_link",
         ]
+        sparse_paths = {
+            "picture_srcset": ("picture", "image_variants"),
+            "branch_name": ("branch__name",),
+            "phone_number": ("branch__phone_number",),
+            "telegram_link": ("branch__telegram_link",),
+            "edu_center_name": ("branch__edu_center__name",),
+            "edu_center_logo": ("branch__edu_center__logo",),
+            "edu_center_logo_srcset": ("edu_center__logo", "edu_center__image_variants"),
+            "category_names": (),
+        }
 
     def get_edu_center_name(self, obj):
         return (
@@ -362,11 +643,9 @@ class EventSerializer(DynamicBranchSerializerMixin, serializers.ModelSerializer)
 
     def get_edu_center_logo(self, obj):
         ec = getattr(obj.branch, "edu_center", None)
-        if not ec or not ec.logo:
+        if not ec:
             return None
-        request = self.context.get("request")
-        url = ec.logo.url
-        return request.build_absolute_uri(url) if request else url
+        return get_media_resolver(self.context).file_url(ec.logo)
 
     def get_category_names(self, obj):
         return [cat.name for cat in obj.categories.all()]
@@ -421,7 +700,21 @@ class EnrollmentStatusStatsSerializer(serializers.Serializer):
     canceled = StatItemSerializer()
 
 
-class AppliedStudentSerializer(serializers.ModelSerializer):
+class TimetableSlotSerializer(serializers.Serializer):
+    course_id = serializers.IntegerField()
+    course_name = serializers.CharField()
+    status = serializers.CharField()
+    start_time = serializers.TimeField(format="%H:%M")
+    end_time = serializers.TimeField(format="%H:%M")
+    conflicts_with = serializers.ListField(child=serializers.IntegerField())
+
+
+class TimetableDaySerializer(serializers.Serializer):
+    day = serializers.CharField()
+    slots = TimetableSlotSerializer(many=True)
+
+
+class AppliedStudentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     full_name = serializers.CharField(source="user.full_name",       read_only=True)
     phone_number = serializers.CharField(source="user.phone_number",    read_only=True)
     course_id = serializers.IntegerField(source="course.id",         read_only=True)
@@ -449,6 +742,7 @@ class AppliedStudentSerializer(serializers.ModelSerializer):
             "branch_name",
         ]
         read_only_fields = fields
+        sparse_paths = {"branch_name": ("course__branch__name",)}
 
     def get_branch_name(self, obj):
         branch = obj.course.branch
@@ -463,9 +757,17 @@ class CancelEnrollmentSerializer(serializers.Serializer):
 
 
 class BannerSerializer(serializers.ModelSerializer):
+    serializer_field_mapping = MEDIA_FIELD_MAPPING
+    image_uz_srcset = SrcsetField("image_uz")
+    image_en_srcset = SrcsetField("image_en")
+    image_ru_srcset = SrcsetField("image_ru")
+
     class Meta:
         model = Banner
-        fields = ["id", "image_uz", "image_en", "image_ru"]
+        fields = [
+            "id", "image_uz", "image_en", "image_ru",
+            "image_uz_srcset", "image_en_srcset", "image_ru_srcset",
+        ]
         read_only_fields = ["id"]
 
 
@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from api.scopes import invalidate_state
+from main.models import Branch, EducationCenter
+
+
+def _center_owners(**lookup):
+    return set(EducationCenter.objects.filter(**lookup).values_list("user_id", flat=True))
+
+
+@receiver([post_save, post_delete], sender=get_user_model())
+def user_changed(sender, instance, **kwargs):
+    invalidate_state(instance.pk)
+
+
+# Reassigning a center or moving a branch changes the previous owner's scope
+# too, so the owner before the save is recorded first.
+@receiver(pre_save, sender=EducationCenter)
+@receiver(pre_save, sender=Branch)
+def remember_owner(sender, instance, **kwargs):
+    if instance._state.adding:
+        instance._previous_owner_ids = set()
+    elif sender is EducationCenter:
+        instance._previous_owner_ids = _center_owners(pk=instance.pk)
+    else:
+        instance._previous_owner_ids = _center_owners(branches=instance.pk)
+
+
+@receiver([post_save, post_delete], sender=EducationCenter)
+@receiver([post_save, post_delete], sender=Branch)
+def ownership_changed(sender, instance, **kwargs):
+    owners = instance.__dict__.pop("_previous_owner_ids", set())
+    if sender is EducationCenter:
+        owners.add(instance.user_id)
+    else:
+        owners |= _center_owners(pk=instance.edu_center_id)
+    for user_id in owners - {None}:
+        invalidate_state(user_id)
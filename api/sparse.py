@@ -0,0 +1,118 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+SPARSE_ACTIONS = ("list", "retrieve")
+
+
+def _names(value):
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+def sparse_field_names(request, names):
+    """
+    ``names`` narrowed by the request's ``?fields=a,b`` and ``?omit=c``, in
+    their original order. Unknown names are ignored.
+    """
+    params = getattr(request, "query_params", None) or {}
+    only, omit = _names(params.get("fields")), _names(params.get("omit"))
+    return [
+        name for name in names
+        if (not only or name in only) and name not in omit
+    ]
+
+
+def is_sparse_request(request):
+    params = getattr(request, "query_params", None) or {}
+    return request.method in ("GET", "HEAD") and ("fields" in params or "omit" in params)
+
+
+class SparseFieldsMixin:
+    """
+    Render only the fields picked with ``?fields=`` / ``?omit=`` on reads.
+
+    Only the top-level serializer of a response is trimmed; writes always
+    see every field. ``Meta.sparse_paths`` lists the ORM paths read by
+    fields whose ``source`` is not a plain model path (method fields,
+    properties, prefetched relations), for ``sparse_queryset``.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if request is None or parent is not None or not is_sparse_request(request):
+            return fields
+        return {name: fields[name] for name in sparse_field_names(request, fields)}
+
+
+def _column(model, path):
+    """
+    ``path`` if it names a column of ``model`` or of a to-one relation,
+    else ``None``.
+    """
+    parts = path.split("__")
+    for i, part in enumerate(parts):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if field.many_to_many or field.one_to_many:
+            return None
+        if field.is_relation and i < len(parts) - 1:
+            model = field.related_model
+    return path
+
+
+def sparse_queryset(queryset, serializer):
+    """
+    ``queryset`` loading only the columns and to-one relations that
+    ``serializer``'s fields read, through ``only()`` and ``select_related``.
+
+    Returned unchanged when a field's needs cannot be worked out, so a
+    trimmed response never costs a query per row.
+    """
+    declared = getattr(serializer.Meta, "sparse_paths", {})
+    columns = set()
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in declared:
+            columns.update(declared[name])
+            continue
+        column = None
+        if field.source != "*":
+            column = _column(queryset.model, field.source.replace(".", "__"))
+        if column is None:
+            return queryset
+        columns.add(column)
+
+    related = {
+        "__".join(path.split("__")[:i])
+        for path in columns
+        for i in range(1, path.count("__") + 1)
+    }
+    queryset = queryset.select_related(None)
+    if related:  # select_related() without arguments follows every FK
+        queryset = queryset.select_related(*related)
+    return queryset.only(*columns)
+
+
+class SparseQuerysetMixin:
+    """
+    View helpers for serializers using ``SparseFieldsMixin``.
+    """
+
+    def wants(self, *names):
+        """
+        Whether this response renders any of the serializer fields ``names``.
+        """
+        if not is_sparse_request(self.request):
+            return True
+        return bool(sparse_field_names(self.request, names))
+
+    def sparse_queryset(self, queryset):
+        if self.action not in SPARSE_ACTIONS or not is_sparse_request(self.request):
+            return queryset
+        return sparse_queryset(queryset, self.get_serializer())
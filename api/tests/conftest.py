@@ -0,0 +1,50 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from main.models import Branch, Category, Course, EducationCenter, Level, Teacher
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def make_center():
+    """
+    Create a center admin named ``username`` with a center, a branch and a
+    teacher; returns ``(user, center, branch)``.
+    """
+    def make(username):
+        user = get_user_model().objects.create_user(
+            username=username, full_name=username, password="Test1234!",
+            role="EDU_CENTER",
+        )
+        center = EducationCenter.objects.create(
+            name=username, user=user, country="Uzbekistan", region="Tashkent",
+            city="Tashkent",
+        )
+        branch = Branch.objects.create(name=f"{username} main", edu_center=center)
+        Teacher.objects.create(
+            full_name=f"{username} teacher", gender="MALE", branch=branch
+        )
+        return user, center, branch
+    return make
+
+
+@pytest.fixture
+def course():
+    center = EducationCenter.objects.create(
+        name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent"
+    )
+    branch = Branch.objects.create(name="Main", edu_center=center)
+    category = Category.objects.create(name="English")
+    return Course.objects.create(
+        name="IELTS", branch=branch, category=category,
+        level=Level.objects.create(category=category, name="Beginner"),
+        teacher=Teacher.objects.create(full_name="Aziza", gender="female", branch=branch),
+        total_places=10, price=100, start_time="10:00", end_time="12:00",
+    )
@@ -0,0 +1,130 @@
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from main.models import Branch, Category, Course, EducationCenter, Enrollment, Like
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+def revalidate(client, url, response):
+    return client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_unchanged_list_is_not_modified_without_serializing(
+        self, client, course, django_assert_num_queries
+    ):
+        first = client.get("/api/courses/")
+        assert first.status_code == 200
+        center = EducationCenter.objects.get()
+        assert first["Last-Modified"] == http_date(int(center.updated_at.timestamp()))
+        assert "no-cache" in first["Cache-Control"]
+
+        with django_assert_num_queries(1):
+            second = revalidate(client, "/api/courses/", first)
+
+        assert second.status_code == 304
+        assert second["ETag"] == first["ETag"]
+        assert not second.content
+
+    def test_etag_depends_on_query_string(self, client, course):
+        first = client.get("/api/courses/")
+        assert revalidate(client, "/api/courses/?page=1", first).status_code == 200
+
+    @pytest.mark.parametrize("change", [
+        lambda course: Course.objects.get(pk=course.pk).save(),
+        lambda course: course.teacher.save(),
+        lambda course: Enrollment.objects.create(
+            user=User.objects.create_user(
+                full_name="Student", phone_number="+998901112233", password="x"
+            ),
+            course=course,
+        ),
+        lambda course: Branch.objects.get(pk=course.branch_id).save(),
+        lambda course: course.delete(),
+    ], ids=["course", "teacher", "enrollment", "branch", "delete"])
+    def test_changes_invalidate_course_list(self, client, course, change):
+        first = client.get("/api/courses/")
+        change(course)
+        assert revalidate(client, "/api/courses/", first).status_code == 200
+
+    def test_category_rename_invalidates_course_list(
+        self, client, course, django_capture_on_commit_callbacks
+    ):
+        first = client.get("/api/courses/")
+        with django_capture_on_commit_callbacks(execute=True):
+            Category.objects.filter(pk=course.category_id).first().save()
+        assert revalidate(client, "/api/courses/", first).status_code == 200
+
+    def test_detail_honours_if_modified_since(self, client, course):
+        url = f"/api/courses/{course.pk}/"
+        first = client.get(url)
+
+        again = client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        assert again.status_code == 304
+        assert client.get("/api/courses/999/").status_code == 404
+
+    def test_like_invalidates_center_at_most_once_a_minute(self, client, course):
+        url = "/api/edu-centers/"
+        center = EducationCenter.objects.filter(pk=course.branch.edu_center_id)
+        center.update(updated_at=timezone.now() - timedelta(minutes=5))
+        first = client.get(url)
+        assert revalidate(client, url, first).status_code == 304
+
+        def like(phone):
+            Like.objects.create(
+                user=User.objects.create_user(
+                    full_name="Student", phone_number=phone, password="x"
+                ),
+                content_type=ContentType.objects.get_for_model(EducationCenter),
+                object_id=course.branch.edu_center_id,
+            )
+
+        like("+998901112244")
+        second = revalidate(client, url, first)
+        assert second.status_code == 200
+        stamp = center.get().updated_at
+
+        like("+998901112255")
+        assert center.get().updated_at == stamp
+        assert revalidate(client, url, second).status_code == 304
+
+    def test_course_rows_date_center_list(self, client, course):
+        url = "/api/edu-centers/"
+        EducationCenter.objects.update(updated_at=timezone.now() - timedelta(minutes=5))
+        first = client.get(url)
+        assert revalidate(client, url, first).status_code == 304
+
+        # No signal runs, so only the course's own updated_at moves.
+        Course.objects.filter(pk=course.pk).update(
+            category=Category.objects.create(name="Math"), updated_at=timezone.now()
+        )
+
+        assert revalidate(client, url, first).status_code == 200
+
+    def test_only_rendered_student_fields_invalidate_courses(self, client, course):
+        student = User.objects.create_user(
+            full_name="Student", phone_number="+998901112266", password="x"
+        )
+        Enrollment.objects.create(user=student, course=course)
+        first = client.get("/api/courses/")
+
+        student.last_login = timezone.now()
+        student.save(update_fields=["last_login"])
+        student.birth_date = date(2000, 1, 1)
+        student.save()
+        assert revalidate(client, "/api/courses/", first).status_code == 304
+
+        student.full_name = "Renamed Student"
+        student.save()
+        assert revalidate(client, "/api/courses/", first).status_code == 200
@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from main.models import Branch, Category, Course, Day, EducationCenter, Level
+
+
+@pytest.fixture
+def center(make_center):
+    user, _, branch = make_center("center")
+    category = Category.objects.create(name="English")
+    level = Level.objects.create(category=category, name="Beginner")
+    teacher = branch.teachers.get()
+    for value, _ in Day.DayChoices.choices:
+        Day.objects.create(name=value)
+    client = APIClient()
+    client.force_authenticate(user)
+    return client, branch, category, level, teacher
+
+
+def row(branch, category, level, teacher, **extra):
+    return {
+        "branch_id": branch.id, "category_id": category.id, "level_id": level.id,
+        "teacher_id": teacher.id, "total_places": 20, "price": "300.00",
+        "start_time": "10:00:00", "end_time": "12:00:00", "days": "Mon,Wed",
+        **extra,
+    }
+
+
+@pytest.mark.django_db
+class TestCourseBulk:
+    def test_creates_courses_and_days_in_constant_queries(
+        self, center, django_assert_max_num_queries
+    ):
+        client, *refs = center
+        courses = [row(*refs, name=f"Course {i}") for i in range(200)]
+
+        with django_assert_max_num_queries(20):
+            response = client.post("/api/courses/bulk/", {"courses": courses}, format="json")
+
+        assert response.status_code == 201, response.data
+        assert len(response.data["created"]) == 200
+        course = Course.objects.get(name="Course 7")
+        assert sorted(course.days.values_list("name", flat=True)) == ["MONDAY", "WEDNESDAY"]
+
+    def test_replaces_existing_course_by_id(self, center):
+        client, *refs = center
+        created = client.post(
+            "/api/courses/bulk/", {"courses": [row(*refs, name="Old")]}, format="json"
+        ).data["created"]
+
+        response = client.post(
+            "/api/courses/bulk/",
+            {"courses": [row(*refs, id=created[0], name="New", days="Fri")]},
+            format="json",
+        )
+
+        assert response.status_code == 201, response.data
+        course = Course.objects.get(pk=created[0])
+        assert course.name == "New"
+        assert list(course.days.values_list("name", flat=True)) == ["FRIDAY"]
+
+    def test_reports_errors_per_row_and_saves_nothing(self, center):
+        client, branch, category, level, teacher = center
+        other = Branch.objects.create(
+            name="Elsewhere",
+            edu_center=EducationCenter.objects.create(
+                name="Other", country="Uzbekistan", region="Tashkent", city="Tashkent"
+            ),
+        )
+        courses = [
+            row(branch, category, level, teacher, name="Fine"),
+            row(other, category, level, teacher, name="Foreign branch"),
+            row(branch, category, level, teacher, name="Fine"),
+        ]
+
+        response = client.post("/api/courses/bulk/", {"courses": courses}, format="json")
+
+        assert response.status_code == 400
+        errors = response.data["courses"]
+        assert errors[0] == {}
+        assert "branch_id" in errors[1]
+        assert "name" in errors[2]
+        assert not Course.objects.exists()
+
+    def test_bulk_writes_invalidate_center_list(self, center):
+        client, branch, *refs = center
+        centers = EducationCenter.objects.filter(pk=branch.edu_center_id)
+        centers.update(updated_at=timezone.now() - timedelta(minutes=5))
+        url = "/api/edu-centers/"
+        first = client.get(url)
+        assert client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+
+        response = client.post(
+            "/api/courses/bulk/", {"courses": [row(branch, *refs, name="New")]},
+            format="json",
+        )
+
+        assert response.status_code == 201, response.data
+        assert client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
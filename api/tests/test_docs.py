@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+
+from api import docs
+
+LOAD_APP = (
+    "import sys\n"
+    "from educompass.wsgi import application\n"
+    "import educompass.urls\n"
+    "from educompass.celery import app\n"
+    "app.loader.import_default_modules()\n"
+    "print(sorted({m.split('.')[0] for m in sys.modules} & {'drf_yasg', 'debug_toolbar'}))\n"
+)
+
+
+def test_production_profile_never_imports_dev_apps():
+    env = dict(os.environ, SETTINGS_PROFILE="production", DEBUG="false")
+    env.pop("API_DOCS", None)
+    result = subprocess.run(
+        [sys.executable, "-c", LOAD_APP], env=env, capture_output=True, text=True,
+        cwd=settings.BASE_DIR, check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.skipif(not settings.API_DOCS, reason="API docs are off")
+def test_docs_profile_uses_drf_yasg():
+    from drf_yasg import utils
+
+    assert docs.swagger_auto_schema is utils.swagger_auto_schema
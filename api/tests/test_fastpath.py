@@ -0,0 +1,133 @@
+"""
+Golden tests: the serializer-free list path must render exactly what the
+serializers render, for every field and with sparse fieldsets.
+"""
+from datetime import date, timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from main.models import (Branch, Category, Course, Day, EducationCenter, Enrollment,
+                         Event, Level, Teacher)
+from main.views import CourseViewSet, EventViewSet
+
+THUMBNAILS = {
+    "logo": {
+        "source": "education_centers/logos/c.png",
+        "hash": "ab12",
+        "widths": {"64": {"webp": "thumbnails/ab/ab12-64.webp",
+                          "jpeg": "thumbnails/ab/ab12-64.jpeg"}},
+    },
+}
+
+
+@pytest.fixture
+def catalog():
+    center = EducationCenter.objects.create(
+        name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent",
+        logo="education_centers/logos/c.png", telegram_link="https://t.me/compass",
+        image_variants=THUMBNAILS,
+    )
+    plain = EducationCenter.objects.create(
+        name="Bare", country="Uzbekistan", region="Samarkand", city="Samarkand"
+    )
+    mapped = Branch.objects.create(
+        name="Chilonzor", edu_center=center, latitude="41.2856000", longitude="69.2034000",
+        phone_number="+998901234567", work_time="09:00-18:00",
+        telegram_link="https://t.me/chilonzor",
+    )
+    unmapped = Branch.objects.create(name="", edu_center=plain)
+    english = Category.objects.create(name="English")
+    math = Category.objects.create(name="Math")
+    level = Level.objects.create(category=english, name="Beginner")
+    teacher = Teacher.objects.create(full_name="Aziza", gender="female", branch=mapped)
+
+    ielts = Course.objects.create(
+        name="IELTS", branch=mapped, category=english, level=level, teacher=teacher,
+        total_places=10, booked_places=12, price="1250000.50", discount="0",
+        start_time="09:00", end_time="10:30:15", intensive=True,
+        start_date=date(2026, 11, 1), end_date=date(2027, 2, 15),
+    )
+    ielts.days.set(Day.objects.bulk_create([Day(name="MONDAY"), Day(name="FRIDAY")]))
+    Course.objects.create(
+        name="Algebra", branch=unmapped, category=math,
+        level=Level.objects.create(category=math, name="Olympiad"),
+        total_places=5, price="100", discount="250", start_time="14:00", end_time="15:00",
+        start_date=date(2026, 12, 1),
+    )
+    users = get_user_model().objects
+    for i, status in enumerate(["PENDING", "CONFIRMED", "CANCELED"]):
+        Enrollment.objects.create(
+            user=users.create_user(full_name=f"Student {i}", phone_number=f"+99890000000{i}"),
+            course=ielts, status=status,
+        )
+
+    soon = date.today() + timedelta(days=5)
+    open_day = Event.objects.create(
+        name="Open day", picture="events/open.jpg", branch=mapped, edu_center=center,
+        date=soon, start_time="10:00", requirements="PAID", price="50000",
+        description="Come in", link="https://compass.uz",
+    )
+    open_day.categories.set([math, english])
+    Event.objects.create(
+        name="Olympiad", picture="events/olympiad.jpg", branch=unmapped, edu_center=plain,
+        date=soon + timedelta(days=1), start_time="09:30", requirements="FREE",
+        description="",
+    )
+    return center
+
+
+def both_paths(monkeypatch, viewset, url, params=None):
+    client = APIClient()
+    fast = client.get(url, params)
+    monkeypatch.setattr(viewset, "row_format", None)
+    slow = client.get(url, params)
+    monkeypatch.undo()
+    assert fast.status_code == slow.status_code == 200
+    return fast.json(), slow.json()
+
+
+@pytest.mark.django_db
+class TestFastListPath:
+    @pytest.mark.parametrize("params", [
+        None,
+        {"size": 1, "page": 2},
+        {"fields": "id,final_price,days,students,cover_srcset"},
+        {"omit": "students,edu_center_logo_srcset"},
+    ])
+    def test_courses_match_serializer(self, monkeypatch, catalog, params):
+        fast, slow = both_paths(monkeypatch, CourseViewSet, "/api/courses/", params)
+        assert fast == slow
+        assert fast["items"]
+
+    @pytest.mark.parametrize("params", [
+        None,
+        {"upcoming": "true"},
+        {"fields": "name,category_names,branch_name,edu_center_logo_srcset"},
+    ])
+    def test_events_match_serializer(self, monkeypatch, catalog, params):
+        fast, slow = both_paths(monkeypatch, EventViewSet, "/api/events/", params)
+        assert fast == slow
+        assert fast["items"]
+
+    def test_golden_course_row(self, monkeypatch, catalog):
+        fast, _ = both_paths(monkeypatch, CourseViewSet, "/api/courses/")
+        ielts = fast["items"][0]
+
+        assert ielts["final_price"] == "1250000.50"
+        assert ielts["available_places"] == 0
+        assert ielts["duration_months"] == 4
+        assert ielts["days"] == ["Mon", "Fri"]
+        assert ielts["end_time"] == "10:30:15"
+        assert ielts["edu_center_logo_srcset"]["webp"] == {
+            "64w": "http://testserver/media/thumbnails/ab/ab12-64.webp"
+        }
+        assert [s["status"] for s in ielts["students"]] == ["CANCELED", "CONFIRMED", "PENDING"]
+
+    def test_course_list_query_count(self, catalog, django_assert_max_num_queries):
+        client = APIClient()
+        client.get("/api/courses/")  # warm the lookup tables
+        # watermark, count, page, students
+        with django_assert_max_num_queries(4):
+            client.get("/api/courses/")
@@ -0,0 +1,87 @@
+import json
+import logging
+
+import pytest
+from rest_framework.serializers import BaseSerializer
+from rest_framework.test import APIClient
+
+from accounts.models import CenterPayment, User
+from api.instrumentation import query_signature
+from main.models import EducationCenter
+
+# Captured at import, before any sampled request patches it.
+SERIALIZER_DATA = BaseSerializer.__dict__["data"]
+
+
+@pytest.fixture
+def log(caplog, monkeypatch):
+    # The logger does not propagate to the root logger caplog listens on.
+    monkeypatch.setattr(logging.getLogger("api.instrumentation"), "propagate", True)
+    caplog.set_level(logging.INFO, logger="api.instrumentation")
+    return caplog
+
+
+@pytest.fixture
+def accountant():
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(
+        full_name="Accountant", phone_number="+998990000001", role="ACCOUNTANT"
+    ))
+    return client
+
+
+@pytest.fixture
+def payments():
+    for i in range(6):
+        CenterPayment.objects.create(edu_center=EducationCenter.objects.create(
+            name=f"Center {i}", country="Uzbekistan", region="Tashkent", city="Tashkent"
+        ))
+
+
+def test_signature_ignores_values_and_in_list_length():
+    assert (
+        query_signature('SELECT * FROM "t" WHERE "id" IN (%s, %s) LIMIT 10')
+        == query_signature('SELECT  * FROM "t"\nWHERE "id" IN (%s) LIMIT 20')
+    )
+    assert query_signature('SELECT * FROM "t1"') != query_signature('SELECT * FROM "t2"')
+
+
+@pytest.mark.django_db
+class TestRequestInstrumentation:
+    def test_sampled_request_reports_timings(self, settings, log, accountant, payments):
+        settings.INSTRUMENTATION_SAMPLE_RATE = 1
+        response = accountant.get("/api/center-payments/")
+
+        assert response.status_code == 200
+        timing = response["Server-Timing"]
+        assert timing.startswith("db;dur=") and "serialize;dur=" in timing
+
+        (record,) = log.records
+        line = json.loads(record.getMessage())
+        assert line["view"] == "center-payments-list"
+        assert line["response_bytes"] == len(response.content)
+        assert line["queries"] > 12
+        assert line["serialize_ms"] > 0
+        # One aggregate per center in CenterPaymentSerializer.get_debt.
+        assert record.levelno == logging.WARNING
+        assert max(d["count"] for d in line["duplicate_queries"]) >= 6
+
+    def test_request_without_duplicates_logs_info(self, settings, log):
+        settings.INSTRUMENTATION_SAMPLE_RATE = 1
+        APIClient().get("/api/courses/")
+
+        line = json.loads(log.records[0].getMessage())
+        assert line["view"] == "courses-list"
+        assert line["duplicate_queries"] == []
+        assert log.records[0].levelno == logging.INFO
+
+    def test_unsampled_request_is_untouched(
+        self, settings, log, accountant, payments, monkeypatch
+    ):
+        monkeypatch.setattr(BaseSerializer, "data", SERIALIZER_DATA)
+        settings.INSTRUMENTATION_SAMPLE_RATE = 0
+        response = accountant.get("/api/center-payments/")
+
+        assert "Server-Timing" not in response
+        assert not log.records
+        assert BaseSerializer.__dict__["data"] is SERIALIZER_DATA
@@ -0,0 +1,44 @@
+import pytest
+from django.core.files.storage import default_storage
+from rest_framework.test import APIClient, APIRequestFactory
+
+from api.media import MediaResolver, get_media_resolver
+from main.models import EducationCenter
+
+
+class TestMediaResolver:
+    def test_base_and_urls_are_computed_once_per_request(self, monkeypatch):
+        calls = []
+        storage_url = default_storage.url
+        monkeypatch.setattr(
+            default_storage, "url", lambda name: calls.append(name) or storage_url(name)
+        )
+        request = APIRequestFactory().get("/api/courses/", HTTP_HOST="api.example.com")
+        context = {"request": request}
+
+        resolver = get_media_resolver(context)
+        urls = [resolver.url("logos/a.png") for _ in range(100)]
+
+        assert get_media_resolver(context) is resolver
+        assert set(urls) == {"http://api.example.com/media/logos/a.png"}
+        assert calls == ["logos/a.png"]
+
+    def test_media_host_overrides_the_request_host(self, settings):
+        settings.MEDIA_HOST = "https://cdn.example.com/"
+        request = APIRequestFactory().get("/", HTTP_HOST="api.example.com")
+
+        assert MediaResolver(request).url("a.png") == "https://cdn.example.com/media/a.png"
+        assert MediaResolver(request).url("") is None
+
+
+@pytest.mark.django_db
+def test_course_listing_links_logos_through_the_media_host(settings, course):
+    settings.MEDIA_HOST = "https://cdn.example.com"
+    EducationCenter.objects.update(logo="education_centers/logos/compass.png")
+
+    course = APIClient().get("/api/courses/").data["items"][0]
+
+    assert course["edu_center_logo"] == (
+        "https://cdn.example.com/media/education_centers/logos/compass.png"
+    )
+    assert course["cover"] is None
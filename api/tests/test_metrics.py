@@ -0,0 +1,67 @@
+import pytest
+from django.core.cache import cache
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from main.models import Category
+from main.tasks import archive_past_events_task, export_monthly_applications_task
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    def test_requests_are_observed_per_view(self):
+        Category.objects.create(name="English")
+        labels = {"view": "category-list", "method": "GET", "status": "2xx"}
+        before = sample("educompass_http_request_duration_seconds_count", **labels)
+        queries = sample("educompass_http_request_db_queries_sum", view="category-list")
+
+        APIClient().get("/api/categories/")
+        APIClient().get("/api/categories/")
+
+        assert sample("educompass_http_request_duration_seconds_count", **labels) == before + 2
+        # Only the first request reads the categories; the second is cached.
+        assert sample("educompass_http_request_db_queries_sum", view="category-list") > queries
+
+    def test_cache_reads_are_counted(self):
+        hits = sample("educompass_cache_requests_total", result="hit")
+        misses = sample("educompass_cache_requests_total", result="miss")
+
+        assert cache.get("metrics:test") is None
+        cache.set("metrics:test", 0)
+        assert cache.get("metrics:test") == 0
+
+        assert sample("educompass_cache_requests_total", result="miss") == misses + 1
+        assert sample("educompass_cache_requests_total", result="hit") == hits + 1
+
+    def test_celery_tasks_are_timed_by_state(self):
+        task = export_monthly_applications_task.name
+        runs = sample("educompass_celery_task_duration_seconds_count", task=task)
+        failures = sample("educompass_celery_tasks_total", task=task, state="FAILURE")
+
+        export_monthly_applications_task.apply(args=["not-a-date"])
+        archive_past_events_task.apply()
+
+        assert sample("educompass_celery_task_duration_seconds_count", task=task) == runs + 1
+        assert sample("educompass_celery_tasks_total", task=task, state="FAILURE") == failures + 1
+        assert sample("educompass_celery_tasks_total",
+                      task=archive_past_events_task.name, state="SUCCESS") >= 1
+
+    def test_exposition(self):
+        APIClient().get("/api/categories/")
+        response = APIClient().get("/metrics")
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        body = response.content.decode()
+        assert 'educompass_http_request_duration_seconds_bucket{' in body
+        assert 'view="category-list"' in body
+
+    def test_token_is_required_when_set(self, settings):
+        settings.METRICS_TOKEN = "s3cret"
+        assert APIClient().get("/metrics").status_code == 401
+        response = APIClient().get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret")
+        assert response.status_code == 200
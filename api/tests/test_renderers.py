@@ -0,0 +1,59 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from zoneinfo import ZoneInfo
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import ORJSONParser, ORJSONRenderer
+
+pytest.importorskip("orjson")
+
+PAYLOAD = {
+    "price": Decimal("120000.50"),
+    "discount": Decimal("0"),
+    "day": date(2026, 10, 19),
+    "starts": time(9, 30),
+    "ends": time(18, 0, 0, 250000),
+    "utc": datetime(2026, 10, 19, 4, 30, tzinfo=timezone.utc),
+    "local": datetime(2026, 10, 19, 9, 30, 0, 123456, tzinfo=ZoneInfo("Asia/Tashkent")),
+    "naive": datetime(2026, 10, 19, 9, 30),
+    "duration": timedelta(hours=2),
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "label": gettext_lazy("Pending"),
+    "text": "Oʻzbekcha matn\u2028yangi qator",
+    1: ["int keys", None, True, 1.5],
+}
+
+
+class TestORJSONRenderer:
+    def test_output_matches_drf_renderer(self):
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+    def test_indent_falls_back_to_drf(self):
+        context = {"indent": 4}
+        assert (
+            ORJSONRenderer().render(PAYLOAD, renderer_context=context)
+            == JSONRenderer().render(PAYLOAD, renderer_context=context)
+        )
+
+    def test_none_renders_empty(self):
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestORJSONParser:
+    def test_parses_like_drf(self):
+        body = '{"name": "Oʻzbek", "price": "10.50", "days": [1, 2]}'.encode()
+        assert (
+            ORJSONParser().parse(BytesIO(body))
+            == JSONParser().parse(BytesIO(body))
+        )
+
+    def test_invalid_json_is_a_parse_error(self):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(BytesIO(b"{nope"))
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from api.checks import shared_cache_check
+from api.scopes import LOCAL_STATE_TIMEOUT
+from main.models import Branch, EducationCenter
+
+
+@pytest.mark.django_db
+class TestScopeResolution:
+    def test_center_sees_only_its_own_teachers_without_joins(self, make_center):
+        user, _, _ = make_center("alpha")
+        make_center("beta")
+        client = APIClient()
+        client.force_authenticate(user)
+
+        client.get("/api/teachers/")
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/teachers/")
+
+        assert [t["full_name"] for t in response.data] == ["alpha teacher"]
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        assert "main_educationcenter" not in sql
+
+    def test_new_branch_invalidates_cached_scope(self, make_center):
+        user, center, _ = make_center("alpha")
+        client = APIClient()
+        client.force_authenticate(user)
+        assert len(client.get("/api/branches/").data) == 1
+
+        Branch.objects.create(name="alpha second", edu_center=center)
+
+        assert len(client.get("/api/branches/").data) == 2
+
+    def test_reassigned_center_drops_out_of_previous_owners_scope(self, make_center):
+        alpha, center, _ = make_center("alpha")
+        beta, _, _ = make_center("beta")
+        client = APIClient()
+        client.force_authenticate(alpha)
+        assert len(client.get("/api/teachers/").data) == 1
+
+        center.user = beta
+        center.save()
+
+        assert client.get("/api/teachers/").data == []
+
+    def test_moved_branch_drops_out_of_previous_owners_scope(self, make_center):
+        alpha, _, branch = make_center("alpha")
+        _, beta_center, _ = make_center("beta")
+        client = APIClient()
+        client.force_authenticate(alpha)
+        assert len(client.get("/api/teachers/").data) == 1
+
+        branch.edu_center = beta_center
+        branch.save()
+
+        assert client.get("/api/teachers/").data == []
+
+    def test_process_local_scope_expires_quickly(self, make_center, monkeypatch, settings):
+        alpha, center, _ = make_center("alpha")
+        beta, _, _ = make_center("beta")
+        client = APIClient()
+        client.force_authenticate(alpha)
+        assert len(client.get("/api/teachers/").data) == 1
+
+        # Reassigned by another worker: this process's cache is not told.
+        EducationCenter.objects.filter(pk=center.pk).update(user=beta)
+        assert len(client.get("/api/teachers/").data) == 1
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + LOCAL_STATE_TIMEOUT + 1)
+        assert client.get("/api/teachers/").data == []
+
+        settings.DEBUG = False
+        assert [w.id for w in shared_cache_check(None)] == ["api.W001"]
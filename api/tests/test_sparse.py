@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from main.models import (Branch, Category, Course, EducationCenter, Event, Level,
+                         Teacher)
+
+
+@pytest.fixture
+def catalog():
+    center = EducationCenter.objects.create(
+        name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent"
+    )
+    branch = Branch.objects.create(
+        name="Main", edu_center=center, latitude="41.3", longitude="69.2"
+    )
+    category = Category.objects.create(name="English")
+    level = Level.objects.create(category=category, name="Beginner")
+    teacher = Teacher.objects.create(full_name="Aziza", gender="female", branch=branch)
+    for i in range(3):
+        Course.objects.create(
+            name=f"IELTS {i}", branch=branch, category=category, level=level,
+            teacher=teacher, total_places=10, price=100, discount=10,
+            start_time="10:00", end_time="12:00",
+        )
+    event = Event.objects.create(
+        name="Open day", picture="events/open.jpg", branch=branch, edu_center=center,
+        date=timezone.localdate() + timedelta(days=3), start_time="10:00",
+        requirements="FREE", description="Come in",
+    )
+    event.categories.add(category)
+    return center
+
+
+def get(url, params):
+    client = APIClient()
+    client.get(url)  # warm the lookup tables
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url, params)
+    assert response.status_code == 200
+    return response.data, [q["sql"] for q in ctx.captured_queries]
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    def test_fields_trims_courses_and_their_query(self, catalog):
+        data, queries = get("/api/courses/", {"fields": "id,name,final_price,category_name"})
+
+        assert [set(c) for c in data["items"]] == [
+            {"id", "name", "final_price", "category_name"}
+        ] * 3
+        assert data["items"][0]["final_price"] == "90.00"
+        assert data["items"][0]["category_name"] == "English"
+        page = queries[-1]
+        assert "main_branch" not in page and "main_teacher" not in page
+        assert '"main_course"."total_places"' not in page
+        assert not any("main_enrollment" in q and "IN (" in q for q in queries)
+
+    def test_related_fields_are_joined_not_queried_per_row(self, catalog):
+        data, queries = get(
+            "/api/courses/", {"fields": "name,teacher_name,google_map,cover,days"}
+        )
+
+        assert data["items"][0]["teacher_name"] == "Aziza"
+        assert data["items"][0]["google_map"].endswith("destination=41.3000000,69.2000000")
+        assert data["items"][0]["days"] == []
+        assert "main_teacher" in queries[-1] and "main_educationcenter" in queries[-1]
+        assert len(queries) == 3  # watermark, count and page
+
+    def test_omit_drops_fields(self, catalog):
+        data, queries = get("/api/courses/", {"omit": "students,google_map,yandex_map"})
+
+        item = data["items"][0]
+        assert "students" not in item and "google_map" not in item
+        assert "teacher_name" in item and "days" in item
+        assert len(queries) == 3
+
+    def test_events_skip_categories_when_omitted(self, catalog):
+        data, queries = get("/api/events/", {"fields": "id,name,edu_center_name"})
+
+        assert data["items"] == [
+            {"id": Event.objects.get().pk, "name": "Open day", "edu_center_name": "Compass"}
+        ]
+        assert not any("main_event_categories" in q for q in queries)
+
+    def test_centers_skip_unrendered_counts(self, catalog):
+        data, queries = get("/api/edu-centers/", {"fields": "id,name,likes_count"})
+
+        assert data["items"] == [{"id": catalog.pk, "name": "Compass", "likes_count": 0}]
+        # Only the ETag aggregate reads branches, to date their courses.
+        queries = [q for q in queries if "MAX(" not in q]
+        assert not any("main_view" in q for q in queries)
+        assert not any("main_branch" in q for q in queries)
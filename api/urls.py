@@ -14,7 +14,7 @@ from main.views import (AppliedStudentViewSet, CategoryViewSet,
                         MonthlyCenterReportViewSet, PaidAmountLogViewSet, EduCenterReportView, EduCenterReportExportView)
 from quiz.views import (
     QuizFilterSchemaView,
-    LevelProgressView, PackViewSet
+    LevelProgressView, PackViewSet, LevelLeaderboardView
 )
 
 router = routers.DefaultRouter()
@@ -81,6 +81,8 @@ urlpatterns = (
         ),
         path("levels/<int:level_id>/progress/",
              LevelProgressView.as_view(),  name="level-progress"),
+        path("levels/<int:level_id>/leaderboard/",
+             LevelLeaderboardView.as_view(), name="level-leaderboard"),
         path("edu-center/reports/", EduCenterReportView.as_view(), name="edu-center-report-detail"),
     path("edu-center/reports/export/", EduCenterReportExportView.as_view(), name="edu-center-report-export"),
 
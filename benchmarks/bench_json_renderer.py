@@ -0,0 +1,60 @@
+"""
+Rendering one 100-course catalog page: DRF's stdlib ``JSONRenderer``
+against ``api.renderers.ORJSONRenderer``. Serialization happens once up
+front, so only the JSON encoding is timed.
+"""
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from api.renderers import ORJSONRenderer
+from api.serializers import CourseSerializer
+from main.models import Branch, Category, Course, EducationCenter, Level, Teacher
+
+pytest.importorskip("orjson")
+
+PAGE_SIZE = 100
+
+
+@pytest.fixture
+def page():
+    center = EducationCenter.objects.create(
+        name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent"
+    )
+    branch = Branch.objects.create(
+        name="Chilonzor", edu_center=center, latitude="41.2856", longitude="69.2034",
+        phone_number="+998901234567", work_time="09:00-18:00",
+    )
+    category = Category.objects.create(name="English")
+    level = Level.objects.create(category=category, name="Intermediate")
+    teacher = Teacher.objects.create(full_name="Aziza Karimova", gender="female", branch=branch)
+    Course.objects.bulk_create(
+        Course(
+            name=f"IELTS {i}", branch=branch, category=category, level=level,
+            teacher=teacher, total_places=20, booked_places=i % 20,
+            price="1250000.00", discount="150000.00", start_time="09:00",
+            end_time="11:00", start_date="2026-11-01", end_date="2027-02-01",
+            day_mask=21,
+        )
+        for i in range(PAGE_SIZE)
+    )
+    request = APIRequestFactory().get("/api/courses/")
+    courses = Course.objects.select_related("branch__edu_center", "teacher")
+    return {
+        "items": CourseSerializer(courses, many=True, context={"request": request}).data,
+        "page": 1, "count": PAGE_SIZE, "total": 1, "size": PAGE_SIZE,
+    }
+
+
+@pytest.mark.django_db
+def test_json_renderer(page, bench):
+    stdlib, fast = JSONRenderer(), ORJSONRenderer()
+    assert fast.render(page) == stdlib.render(page)
+
+    stdlib_stats = bench(lambda: stdlib.render(page), rounds=200)
+    fast_stats = bench(lambda: fast.render(page), rounds=200)
+    print(f"\n{PAGE_SIZE}-course page, {len(stdlib.render(page))} bytes")
+    print(f"  JSONRenderer:   {stdlib_stats}")
+    print(f"  ORJSONRenderer: {fast_stats}")
+
+    assert fast_stats["p50_ms"] < stdlib_stats["p50_ms"]
@@ -0,0 +1,73 @@
+"""
+Pack listing for a learner with 10k attempts: the annotated queryset
+(``Count('questions')`` plus an ``EXISTS`` subquery per pack) against cached
+level metadata merged with one attempted-pack-ID lookup.
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Exists, OuterRef
+
+from main.models import Category, Level
+from quiz.models import Pack, Question, TestAttempt
+from quiz.packs import list_level_packs
+from quiz.serializers import PackSerializer
+
+ATTEMPTS_PER_USER = 10_000
+PACKS = 20
+QUESTIONS_PER_PACK = 40
+
+
+@pytest.fixture
+def seeded():
+    level = Level.objects.create(
+        category=Category.objects.create(name="English"), name="Beginner"
+    )
+    packs = Pack.objects.bulk_create(
+        Pack(level=level, title=f"Pack {i}") for i in range(PACKS)
+    )
+    Question.objects.bulk_create(
+        Question(pack=pack, text=f"Q{n}", position=n)
+        for pack in packs
+        for n in range(QUESTIONS_PER_PACK)
+    )
+    user = get_user_model().objects.create_user(
+        full_name="Bench Student", phone_number="+998900000000", password="x"
+    )
+    # The learner has attempted every pack but the last, many times over.
+    TestAttempt.objects.bulk_create(
+        (
+            TestAttempt(
+                user=user, pack=packs[i % (PACKS - 1)],
+                correct_count=10, total_questions=20, percent=50,
+            )
+            for i in range(ATTEMPTS_PER_USER)
+        ),
+        batch_size=2000,
+    )
+    return level, user
+
+
+def annotated_list(level, user):
+    qs = Pack.objects.filter(level=level).annotate(
+        question_count=Count("questions"),
+        used=Exists(TestAttempt.objects.filter(user=user, pack=OuterRef("pk"))),
+    ).order_by("id")
+    return PackSerializer(qs, many=True).data
+
+
+def cached_list(level, user):
+    return PackSerializer(list_level_packs(level.id, user), many=True).data
+
+
+@pytest.mark.django_db
+def test_pack_listing(seeded, bench):
+    level, user = seeded
+    assert annotated_list(level, user) == cached_list(level, user)
+
+    annotated = bench(lambda: annotated_list(level, user))
+    cached = bench(lambda: cached_list(level, user))
+    print(f"\npack listing @ {ATTEMPTS_PER_USER} attempts/user")
+    print(f"  annotated queryset: {annotated}")
+    print(f"  cached + id set:    {cached}")
+
+    assert cached["queries"] <= annotated["queries"]
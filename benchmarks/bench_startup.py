@@ -0,0 +1,74 @@
+"""
+Cold start of a web worker (WSGI application plus URLconf) and a Celery
+worker (app plus task modules), per settings profile, measured in fresh
+interpreters with ``python -X importtime``. Autoscaled pods pay this on
+every start::
+
+    CI=true pytest benchmarks/bench_startup.py -s
+"""
+import os
+import statistics
+import subprocess
+import sys
+from collections import Counter
+
+import pytest
+
+ENTRY_POINTS = {
+    "web": "from educompass.wsgi import application; import educompass.urls",
+    "worker": "from educompass.celery import app; app.loader.import_default_modules()",
+}
+DEV_ONLY = ("debug_toolbar", "drf_yasg")
+ROUNDS = 5
+
+
+def import_profile(code, profile):
+    """
+    Run ``code`` in a new interpreter; returns ``{module: (self_us,
+    cumulative_us)}`` from its ``-X importtime`` report.
+    """
+    env = dict(os.environ, SETTINGS_PROFILE=profile, DEBUG=str(profile == "development"))
+    env.pop("API_DOCS", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def summarize(code, profile):
+    runs = [import_profile(code, profile) for _ in range(ROUNDS)]
+    totals = sorted(sum(self_us for self_us, _ in run.values()) / 1000 for run in runs)
+    slowest = Counter()
+    for run in runs:
+        for name, (self_us, _) in run.items():
+            slowest[name.split(".")[0]] += self_us / ROUNDS / 1000
+    return {
+        "modules": set(runs[-1]),
+        "p50_ms": round(statistics.median(totals), 1),
+        "max_ms": round(totals[-1], 1),
+        "top": [(name, round(ms, 1)) for name, ms in slowest.most_common(8)],
+    }
+
+
+@pytest.mark.parametrize("entry_point", ENTRY_POINTS)
+def test_cold_start(entry_point):
+    code = ENTRY_POINTS[entry_point]
+    production = summarize(code, "production")
+    development = summarize(code, "development")
+
+    print(f"\n{entry_point} cold start, {ROUNDS} fresh interpreters")
+    for name, stats in (("production", production), ("development", development)):
+        print(f"  {name}: {len(stats['modules'])} modules, "
+              f"p50 {stats['p50_ms']} ms, max {stats['max_ms']} ms")
+        print(f"    slowest packages (self ms): {stats['top']}")
+
+    leaked = sorted(m for m in production["modules"] if m.startswith(DEV_ONLY))
+    assert not leaked
+    assert len(production["modules"]) < len(development["modules"])
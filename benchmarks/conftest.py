@@ -0,0 +1,54 @@
+"""
+Benchmarks are opt-in: file names start with ``bench_`` so the default
+``pytest`` run skips them. Run one explicitly, with ``-s`` to see results::
+
+    CI=true pytest benchmarks/bench_pack_listing.py -s
+"""
+import statistics
+import time
+import tracemalloc
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def bench():
+    """
+    Time ``fn`` over ``rounds`` calls after ``warmup`` calls. Returns the
+    query count and peak traced memory (KiB) of one warm call, and p50/p95
+    latency in milliseconds.
+    """
+    def run(fn, rounds=30, warmup=2):
+        for _ in range(warmup):
+            fn()
+        with CaptureQueriesContext(connection) as ctx:
+            fn()
+        # Count now: each request through the test client clears the log.
+        queries = len(ctx.captured_queries)
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return {
+            "queries": queries,
+            "p50_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(timings[int(0.95 * (len(timings) - 1))], 3),
+            "alloc_kib": round(peak / 1024, 1),
+        }
+    return run
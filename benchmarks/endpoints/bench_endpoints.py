@@ -0,0 +1,210 @@
+"""
+Query count, p50/p95 latency and peak allocations of every route in
+``api/urls.py`` against a seeded SQLite database (see ``seeding.py``).
+A full-scale run takes about three minutes, half a minute of it seeding;
+``BENCH_SCALE=0.05`` gives a quick smoke run, not compared against the
+baseline since that is recorded per scale::
+
+    CI=true pytest benchmarks/endpoints/bench_endpoints.py -s
+    CI=true BENCH_UPDATE_BASELINE=1 pytest benchmarks/endpoints/bench_endpoints.py -s
+
+A query count above ``baseline.json`` fails the endpoint. Latency is only
+asserted with ``BENCH_TOLERANCE`` set, e.g. ``0.25`` to fail anything more
+than 25% slower at p50, as it depends on the machine the baseline came from.
+"""
+import os
+from dataclasses import dataclass, field
+
+import pytest
+from django.urls import reverse
+
+from api import urls
+
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "20"))
+TOLERANCE = os.getenv("BENCH_TOLERANCE")
+
+
+@dataclass
+class Case:
+    name: str
+    url_name: str
+    role: str = "anon"
+    kwargs: dict = field(default_factory=dict)  # URL kwargs: names of seeded IDs
+    query: dict = None
+    method: str = "get"
+    data: dict = None
+    status: int = 200
+    rounds: int = ROUNDS
+
+    def path(self, ids):
+        return reverse(self.url_name, kwargs={k: ids[v] for k, v in self.kwargs.items()})
+
+
+CASES = [
+    Case("api-root", "api-root"),
+    # Lookups
+    Case("edu-types", "edutype-list"),
+    Case("edu-type", "edutype-detail", kwargs={"pk": "edu_type"}),
+    Case("categories", "category-list"),
+    Case("category", "category-detail", kwargs={"pk": "category"}),
+    Case("levels", "level-list"),
+    Case("level", "level-detail", kwargs={"pk": "level"}),
+    Case("days", "day-list"),
+    Case("day", "day-detail", kwargs={"pk": "day"}),
+    Case("banners", "banner-list"),
+    Case("banner", "banner-detail", kwargs={"pk": "banner"}),
+    # Catalog
+    Case("courses", "courses-list"),
+    Case("courses:search", "courses-list", query={"search": "Center 1"}),
+    Case("courses:sparse", "courses-list", query={"fields": "id,name,final_price"}),
+    Case("courses:center", "courses-list", role="center"),
+    Case("course", "courses-detail", kwargs={"pk": "course"}),
+    Case("course:stats", "courses-stats", role="center", kwargs={"pk": "course"}),
+    Case("courses:mine", "courses-my_courses", role="student"),
+    Case("courses:timetable", "courses-my_timetable", role="student"),
+    Case("courses:recommended", "courses-recommended", role="student"),
+    Case("course-filters", "course-filter-schema"),
+    Case("events", "event-list"),
+    Case("events:upcoming", "event-list", query={"upcoming": "true"}),
+    Case("event", "event-detail", kwargs={"pk": "event"}),
+    Case("event-filters", "event-filter-schema"),
+    Case("edu-centers", "edu-centers-list"),
+    Case("edu-centers:no-counters", "edu-centers-list",
+         query={"omit": "likes_count,views_count"}),
+    Case("edu-center", "edu-centers-detail", kwargs={"pk": "center"}),
+    Case("branches", "branches-list"),
+    Case("branch", "branches-detail", kwargs={"pk": "branch"}),
+    Case("teachers", "teachers-list"),
+    Case("teacher", "teachers-detail", kwargs={"pk": "teacher"}),
+    Case("likes", "edu-center-likes-list", role="student", kwargs={"edu_center_pk": "center"}),
+    Case("likes:toggle", "edu-center-likes-list", role="student",
+         kwargs={"edu_center_pk": "center"}, method="post"),
+    Case("like", "edu-center-likes-detail", role="student",
+         kwargs={"edu_center_pk": "center", "pk": "like"}),
+    Case("views", "edu-center-views-list", role="student", kwargs={"edu_center_pk": "center"}),
+    Case("views:create", "edu-center-views-list", role="student",
+         kwargs={"edu_center_pk": "center"}, method="post", data={"user": 1}, status=201),
+    Case("view", "edu-center-views-detail", role="student",
+         kwargs={"edu_center_pk": "center", "pk": "view"}),
+    # Center administration
+    Case("applied-students", "applied-students-list", role="center"),
+    Case("applied-students:pending", "applied-students-list", role="center",
+         query={"status": "PENDING", "ordering": "user__full_name"}),
+    Case("applied-student", "applied-students-detail", role="center",
+         kwargs={"pk": "enrollment"}),
+    Case("applied-students:stats", "applied-students-stats", role="center"),
+    Case("applied-student:confirm", "applied-students-confirm", role="center",
+         kwargs={"pk": "enrollment"}, method="post", rounds=5),
+    Case("applied-student:cancel", "applied-students-cancel", role="center",
+         kwargs={"pk": "enrollment"}, method="post", data={"reason": "Group is full"},
+         rounds=5),
+    Case("center-report", "edu-center-report-detail", role="center"),
+    Case("center-report:month", "edu-center-report-detail", role="center",
+         query={"month": "month"}),
+    Case("center-report:export", "edu-center-report-export", role="center",
+         query={"month": "month"}, rounds=5),
+    # Accounting
+    Case("center-payments", "center-payments-list", role="accountant", rounds=5),
+    Case("center-payment", "center-payments-detail", role="accountant",
+         kwargs={"pk": "payment"}),
+    Case("center-payment:add", "center-payments-add-payment", role="accountant",
+         kwargs={"pk": "payment"}, method="post", data={"amount": "1000.00"}, status=201),
+    Case("paid-logs", "paid-logs-list", role="accountant"),
+    Case("paid-log", "paid-logs-detail", role="accountant", kwargs={"pk": "paid_log"}),
+    Case("monthly-reports", "monthly-reports-list", role="accountant"),
+    Case("monthly-reports:current", "monthly-reports-current", role="accountant"),
+    Case("monthly-report", "monthly-reports-detail", role="accountant",
+         kwargs={"pk": "report"}),
+    # Quiz
+    Case("quiz-filters", "quiz-filter-schema"),
+    Case("packs", "level-packs-list", role="student", kwargs={"level_id": "level"}),
+    Case("pack", "level-packs-detail", role="student",
+         kwargs={"level_id": "level", "pk": "pack"}),
+    Case("pack:questions", "level-packs-questions", role="student",
+         kwargs={"level_id": "level", "pk": "pack"}),
+    Case("pack:submit", "level-packs-submit", role="student",
+         kwargs={"level_id": "level", "pk": "pack"}, method="post",
+         data={"answers": [{"question": 1, "answer": 1}, {"question": 2, "answer": 6}]}),
+    Case("pack:stats", "level-packs-stats", kwargs={"level_id": "level", "pk": "pack"}),
+    Case("level-progress", "level-progress", role="student", kwargs={"level_id": "level"}),
+    Case("leaderboard", "level-leaderboard", kwargs={"level_id": "level"}),
+    # Accounts
+    Case("me", "auth_current_user", role="student"),
+    Case("login", "auth_login", method="post", rounds=5,
+         data={"username": "+998900000001", "password": "bench-password"}),
+]
+
+# Routes without a case, and why.
+SKIPPED = {
+    "edu-center-create": "creates a center and its admin; not repeatable",
+    "auth_register": "creates a user per call; phone numbers are unique",
+    "auth_logout": "blacklists the refresh token, so only the first call succeeds",
+    "token_refresh": "refresh tokens rotate and are blacklisted after one use",
+    "courses-bulk": "write path sized by the payload, not by the data set",
+    "courses-apply": "one enrollment per user and course; repeats return 400",
+}
+
+# Cases that currently error out; strict, so a fix shows up as XPASS.
+BROKEN = {
+    "paid-logs": "center-payments/<pk>/ is routed first and swallows paid-logs/",
+    "paid-log": "queryset defers center_payment__edu_center yet select_relates it",
+    "monthly-reports": "queryset calls .only() on the debt property",
+    "monthly-reports:current": "queryset calls .only() on the debt property",
+    "monthly-report": "queryset calls .only() on the debt property",
+    "center-report:export": "queryset defers course__branch__edu_center yet select_relates it",
+}
+
+
+# Cases too slow to run by default (``BENCH_SLOW=1`` runs them anyway).
+SLOW = {
+    "edu-centers": "likes and views are counted in one GROUP BY, joining every like "
+                   "with every view of a center: minutes per call at full scale",
+}
+
+
+def test_every_route_is_covered():
+    names = {pattern.name for pattern in urls.urlpatterns}
+    covered = {case.url_name for case in CASES} | set(SKIPPED)
+    assert names - covered == set(), "add a Case or a SKIPPED entry"
+    assert covered - names == set(), "stale Case or SKIPPED entry"
+
+
+def marks(case):
+    if case.name in BROKEN:
+        return [pytest.mark.xfail(reason=BROKEN[case.name], strict=True)]
+    if case.name in SLOW:
+        return [pytest.mark.skipif(not os.getenv("BENCH_SLOW"), reason=SLOW[case.name])]
+    return []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("case", [
+    pytest.param(case, id=case.name, marks=marks(case)) for case in CASES
+])
+def test_endpoint(case, seeded, clients, bench, baseline, results):
+    ids, _ = seeded
+    client = clients[case.role]
+    path = case.path(ids)
+    query = {k: ids.get(v, v) for k, v in (case.query or {}).items()}
+    if case.method == "get":
+        def call():
+            return client.get(path, query)
+    else:
+        def call():
+            return getattr(client, case.method)(path, case.data, format="json")
+
+    response = call()
+    assert response.status_code == case.status, response.content[:500]
+
+    stats = results[case.name] = bench(call, rounds=case.rounds)
+    before = (baseline or {}).get(case.name)
+    if before is None:
+        return
+    assert stats["queries"] <= before["queries"], (
+        f"{case.name}: {stats['queries']} queries, baseline {before['queries']}"
+    )
+    if TOLERANCE is not None:
+        limit = before["p50_ms"] * (1 + float(TOLERANCE))
+        assert stats["p50_ms"] <= limit, (
+            f"{case.name}: p50 {stats['p50_ms']} ms, baseline {before['p50_ms']} ms"
+        )
@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from rest_framework.test import APIClient
+
+from seeding import SCALE, seed
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """
+    Seed the test database once; each benchmark runs in a transaction that
+    is rolled back, so writes never leak between endpoints.
+    """
+    with django_db_blocker.unblock():
+        return seed()
+
+
+@pytest.fixture(scope="session")
+def seeded(django_db_setup):
+    return django_db_setup
+
+
+@pytest.fixture(scope="session")
+def clients(seeded):
+    _, users = seeded
+    clients = {"anon": APIClient()}
+    for role, user in users.items():
+        clients[role] = APIClient()
+        clients[role].force_authenticate(user)
+    return clients
+
+
+@pytest.fixture(scope="session")
+def baseline():
+    """
+    Stored results, or ``None`` when missing or recorded at another scale.
+    """
+    if not BASELINE.exists():
+        return None
+    stored = json.loads(BASELINE.read_text())
+    return stored["results"] if stored.get("scale") == SCALE else None
+
+
+@pytest.fixture(scope="session")
+def results(baseline):
+    """
+    Collects each endpoint's numbers; prints them against the baseline at
+    the end and rewrites the baseline with ``BENCH_UPDATE_BASELINE=1``.
+    """
+    collected = {}
+    yield collected
+
+    print(f"\n{'endpoint':<44} {'queries':>11} {'p50 ms':>17} {'p95 ms':>9} {'alloc KiB':>10}")
+    for name, stats in sorted(collected.items()):
+        before = (baseline or {}).get(name, {})
+        queries = f"{stats['queries']}"
+        if before and before["queries"] != stats["queries"]:
+            queries = f"{before['queries']}->{stats['queries']}"
+        p50 = f"{stats['p50_ms']:.2f}"
+        if before:
+            p50 += f" ({stats['p50_ms'] / before['p50_ms'] - 1:+.0%})" if before["p50_ms"] else ""
+        print(f"{name:<44} {queries:>11} {p50:>17} {stats['p95_ms']:>9.2f} "
+              f"{stats['alloc_kib']:>10.1f}")
+
+    if os.getenv("BENCH_UPDATE_BASELINE") == "1":
+        BASELINE.write_text(json.dumps(
+            {"scale": SCALE, "results": dict(sorted({**(baseline or {}), **collected}.items()))},
+            indent=2,
+        ) + "\n")
+        print(f"Baseline written to {BASELINE}")
@@ -0,0 +1,298 @@
+"""
+Bulk seeding for the endpoint benchmarks.
+
+Rows go in through one ``executemany`` per table with precomputed primary
+keys, so a million enrollments take seconds instead of the minutes that
+``save()`` or ``bulk_create`` would need. Nothing runs model ``save()`` or
+signals: derived columns (``day_mask``, timestamps, JSON defaults) are
+written directly. Volumes scale with ``BENCH_SCALE`` (default ``1``: 10k
+courses, 100k students, 1M enrollments, 100k views).
+"""
+import os
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.utils import timezone
+
+from accounts.models import CenterPayment, MonthlyCenterReport, PaidAmountLog, User
+from main.models import (DAY_BITS, Banner, Branch, Category, Course, Day, EducationCenter,
+                         EduType, Enrollment, Event, Level, Like, Teacher,
+                         UserRecommendation, View)
+from quiz.models import Answer, Pack, Question, TestAttempt, UserLevelProgress
+
+SCALE = float(os.getenv("BENCH_SCALE", "1"))
+PASSWORD = "bench-password"
+
+
+def scaled(n, minimum=1):
+    return max(int(n * SCALE), minimum)
+
+
+CENTERS = scaled(200, 2)
+BRANCHES_PER_CENTER = 3
+TEACHERS_PER_BRANCH = 2
+COURSES = scaled(10_000, 20)
+STUDENTS = scaled(100_000, 20)
+ENROLLMENTS_PER_STUDENT = 10
+VIEWS = scaled(100_000)
+LIKES = scaled(20_000)
+EVENTS = scaled(2_000, 10)
+CATEGORIES = 10
+LEVELS_PER_CATEGORY = 4
+PACKS_PER_LEVEL = 2
+QUESTIONS_PER_PACK = 20
+ANSWERS_PER_QUESTION = 4
+ATTEMPTS = scaled(20_000)
+BANNERS = 5
+
+BRANCHES = CENTERS * BRANCHES_PER_CENTER
+LEVELS = CATEGORIES * LEVELS_PER_CATEGORY
+PACKS = LEVELS * PACKS_PER_LEVEL
+
+WEEKDAYS = list(DAY_BITS)  # "MONDAY" ... "SUNDAY"; Day ids follow this order
+SCHEDULES = [("MONDAY", "WEDNESDAY", "FRIDAY"), ("TUESDAY", "THURSDAY"),
+             ("SATURDAY", "SUNDAY"), ("MONDAY", "THURSDAY")]
+
+
+def insert(model, fields, rows):
+    """
+    ``INSERT`` ``rows`` (tuples in ``fields`` order, already adapted for the
+    database) into ``model``'s table. Columns left out get their default,
+    ``now`` for ``auto_now`` fields.
+    """
+    opts = model._meta
+    now = timezone.now()
+    fill = []
+    for field in opts.concrete_fields:
+        if field.attname in fields or field.name in fields:
+            continue
+        auto = getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        fill.append((field.column, field.get_db_prep_save(
+            now if auto else field.get_default(), connection
+        )))
+
+    columns = [opts.get_field(name).column for name in fields] + [c for c, _ in fill]
+    extra = tuple(value for _, value in fill)
+    qn = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        qn(opts.db_table), ", ".join(map(qn, columns)), ", ".join(["%s"] * len(columns))
+    )
+    with connection.cursor() as cursor:
+        batch = []
+        for row in rows:
+            batch.append(tuple(row) + extra)
+            if len(batch) == 50_000:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+
+
+def m2m(model, field, pairs):
+    through = model._meta.get_field(field).remote_field.through
+    source, target = (f.attname for f in through._meta.concrete_fields[1:3])
+    insert(through, [source, target], pairs)
+
+
+def _datetimes(days):
+    """
+    One adapted timestamp per day over the last ``days`` days.
+    """
+    now = timezone.now()
+    return [
+        connection.ops.adapt_datetimefield_value(now - timedelta(days=d, minutes=d * 7))
+        for d in range(days)
+    ]
+
+
+def phone(n):
+    return f"+99890{n:07d}"
+
+
+def center_of(branch_id):
+    return (branch_id - 1) // BRANCHES_PER_CENTER + 1
+
+
+def seed():
+    """
+    Fill an empty database and return the IDs and users the benchmarks use.
+    """
+    today = date.today()
+    stamps = _datetimes(365)
+    password = make_password(PASSWORD)
+
+    # Lookups.
+    insert(EduType, ["id", "name"], ((i, f"Type {i}") for i in range(1, 6)))
+    insert(Day, ["id", "name"], enumerate(WEEKDAYS, start=1))
+    insert(Category, ["id", "name"], ((i, f"Category {i:02d}") for i in range(1, CATEGORIES + 1)))
+    insert(Level, ["id", "category", "name"], (
+        (i, (i - 1) // LEVELS_PER_CATEGORY + 1, f"Level {i}") for i in range(1, LEVELS + 1)
+    ))
+
+    # Centers, branches, teachers.
+    insert(EducationCenter, ["id", "name", "country", "region", "city", "logo", "cover",
+                             "telegram_link", "order"], (
+        (i, f"Center {i}", "Uzbekistan", "Tashkent", "Tashkent",
+         f"education_centers/logos/{i}.png", f"education_centers/covers/{i}.jpg",
+         f"https://t.me/center{i}", i)
+        for i in range(1, CENTERS + 1)
+    ))
+    m2m(EducationCenter, "edu_type", ((i, i % 5 + 1) for i in range(1, CENTERS + 1)))
+    m2m(EducationCenter, "categories", (
+        (i, (i + k) % CATEGORIES + 1) for i in range(1, CENTERS + 1) for k in range(2)
+    ))
+    insert(Branch, ["id", "name", "edu_center", "latitude", "longitude", "phone_number",
+                    "work_time", "telegram_link"], (
+        (b, f"Branch {b}", center_of(b), f"{41 + b % 100 / 1000:.7f}",
+         f"{69 + b % 100 / 1000:.7f}", f"+99871{b:07d}", "09:00-18:00",
+         f"https://t.me/branch{b}")
+        for b in range(1, BRANCHES + 1)
+    ))
+    insert(Teacher, ["id", "full_name", "gender", "branch"], (
+        (t, f"Teacher {t}", ("MALE", "FEMALE")[t % 2], (t - 1) // TEACHERS_PER_BRANCH + 1)
+        for t in range(1, BRANCHES * TEACHERS_PER_BRANCH + 1)
+    ))
+
+    # Courses: spread round-robin over branches, two teachers per branch.
+    def course_row(c):
+        branch = (c - 1) % BRANCHES + 1
+        category = c % CATEGORIES + 1
+        schedule = SCHEDULES[c % len(SCHEDULES)]
+        start = today + timedelta(days=c % 90 - 30)
+        return (
+            c, f"Course {c}", branch, category,
+            (category - 1) * LEVELS_PER_CATEGORY + c % LEVELS_PER_CATEGORY + 1,
+            (branch - 1) * TEACHERS_PER_BRANCH + c % TEACHERS_PER_BRANCH + 1,
+            start.isoformat(), (start + timedelta(days=120)).isoformat(),
+            c % 15, 20 + c % 20, f"{500_000 + c % 20 * 50_000}.00", f"{c % 4 * 25_000}.00",
+            time(8 + c % 10).isoformat(), time(10 + c % 10).isoformat(), c % 7 == 0,
+            sum(DAY_BITS[day] for day in schedule),
+        )
+    insert(Course, ["id", "name", "branch", "category", "level", "teacher", "start_date",
+                    "end_date", "booked_places", "total_places", "price", "discount",
+                    "start_time", "end_time", "intensive", "day_mask"],
+           (course_row(c) for c in range(1, COURSES + 1)))
+    m2m(Course, "days", (
+        (c, WEEKDAYS.index(day) + 1)
+        for c in range(1, COURSES + 1) for day in SCHEDULES[c % len(SCHEDULES)]
+    ))
+
+    # Students, and ten distinct courses each.
+    insert(User, ["id", "username", "full_name", "phone_number", "password", "role"], (
+        (u, phone(u), f"Student {u}", phone(u), password, "STUDENT")
+        for u in range(1, STUDENTS + 1)
+    ))
+    statuses = [choice.value for choice in Enrollment.Status]
+    insert(Enrollment, ["id", "user", "course", "status", "applied_at"], (
+        ((u - 1) * ENROLLMENTS_PER_STUDENT + k + 1, u, (u * 7 + k * 997) % COURSES + 1,
+         statuses[(u + k) % len(statuses)], stamps[(u * 31 + k) % len(stamps)])
+        for u in range(1, STUDENTS + 1) for k in range(ENROLLMENTS_PER_STUDENT)
+    ))
+    insert(UserRecommendation, ["user", "course", "score"], (
+        (1, (c * 37) % COURSES + 1, 1 - c / 100) for c in range(20)
+    ))
+
+    # Engagement with centers.
+    center_type = ContentType.objects.get_for_model(EducationCenter).id
+    insert(View, ["user", "content_type", "object_id", "viewed_at"], (
+        (i % STUDENTS + 1, center_type, i % CENTERS + 1, stamps[i % len(stamps)])
+        for i in range(VIEWS)
+    ))
+    insert(Like, ["user", "content_type", "object_id", "liked_at"], (
+        (i % STUDENTS + 1, center_type, i % CENTERS + 1, stamps[i % len(stamps)])
+        for i in range(LIKES)
+    ))
+
+    # Events, half of them in the past.
+    insert(Event, ["id", "name", "picture", "branch", "edu_center", "date", "start_time",
+                   "requirements", "price", "description", "link"], (
+        (e, f"Event {e}", f"events/{e}.jpg", (e - 1) % BRANCHES + 1,
+         center_of((e - 1) % BRANCHES + 1),
+         (today + timedelta(days=e % 60 - 30)).isoformat(), time(10 + e % 8).isoformat(),
+         ("FREE", "PAID")[e % 2], None if e % 2 == 0 else "50000.00",
+         f"Open lesson number {e}", f"https://example.com/events/{e}")
+        for e in range(1, EVENTS + 1)
+    ))
+    m2m(Event, "categories", (
+        (e, (e + k) % CATEGORIES + 1) for e in range(1, EVENTS + 1) for k in range(2)
+    ))
+    insert(Banner, ["id", "image_uz", "image_en", "image_ru"], (
+        (b, f"banners/uz/{b}.jpg", f"banners/en/{b}.jpg", f"banners/ru/{b}.jpg")
+        for b in range(1, BANNERS + 1)
+    ))
+
+    # Quiz: packs of 20 questions with one correct answer out of four.
+    insert(Pack, ["id", "level", "title"], (
+        (p, (p - 1) // PACKS_PER_LEVEL + 1, f"Pack {p}") for p in range(1, PACKS + 1)
+    ))
+    insert(Question, ["id", "pack", "text", "position"], (
+        (q, (q - 1) // QUESTIONS_PER_PACK + 1, f"Question {q}", (q - 1) % QUESTIONS_PER_PACK + 1)
+        for q in range(1, PACKS * QUESTIONS_PER_PACK + 1)
+    ))
+    insert(Answer, ["id", "question", "text", "correct"], (
+        (a, (a - 1) // ANSWERS_PER_QUESTION + 1, f"Answer {a}", a % ANSWERS_PER_QUESTION == 1)
+        for a in range(1, PACKS * QUESTIONS_PER_PACK * ANSWERS_PER_QUESTION + 1)
+    ))
+    insert(TestAttempt, ["user", "pack", "correct_count", "total_questions", "percent"], (
+        (i % STUDENTS + 1, i % PACKS + 1, i % 21, 20, i % 21 * 5) for i in range(ATTEMPTS)
+    ))
+    insert(UserLevelProgress, ["user", "level", "total_tests", "passed_tests"], (
+        (u, level, 5 + u % 10, u % 6)
+        for u in range(1, min(ATTEMPTS, STUDENTS) + 1)
+        for level in {1, u % LEVELS + 1}
+    ))
+
+    # Accounting.
+    insert(CenterPayment, ["id", "edu_center"], ((i, i) for i in range(1, CENTERS + 1)))
+    insert(PaidAmountLog, ["center_payment", "amount", "created_at"], (
+        (i % CENTERS + 1, f"{100_000 + i % 10 * 10_000}.00", stamps[i % len(stamps)])
+        for i in range(CENTERS * 5)
+    ))
+    months = {(d.year, d.month) for d in (today - timedelta(days=30 * n) for n in range(12))}
+    insert(MonthlyCenterReport, ["edu_center", "year", "month", "total_applications",
+                                 "payable_amount", "paid_amount"], (
+        (i, year, month, 25, "750000.00", "300000.00")
+        for i in range(1, CENTERS + 1)
+        for year, month in months
+    ))
+
+    # Named users for each role; the center admin owns center 1.
+    manager = User.objects
+    users = {
+        "student": manager.get(pk=1),
+        "center": manager.create_user(
+            username="center-admin", full_name="Center Admin", password=PASSWORD,
+            role="EDU_CENTER",
+        ),
+        "accountant": manager.create_user(
+            full_name="Accountant", phone_number="+998990000001", password=PASSWORD,
+            role="ACCOUNTANT",
+        ),
+        "superuser": manager.create_superuser("root", "Root", password=PASSWORD),
+    }
+    EducationCenter.objects.filter(pk=1).update(user=users["center"])
+
+    center_course = Course.objects.filter(branch__edu_center_id=1).order_by("id").first()
+    ids = {
+        "center": 1,
+        "branch": 1,
+        "teacher": 1,
+        "course": center_course.id,
+        "event": 1,
+        "category": 1,
+        "level": 1,
+        "edu_type": 1,
+        "day": 1,
+        "pack": 1,
+        "banner": 1,
+        "payment": 1,
+        "paid_log": PaidAmountLog.objects.order_by("id").values_list("id", flat=True)[0],
+        "report": MonthlyCenterReport.objects.order_by("id").values_list("id", flat=True)[0],
+        "enrollment": center_course.enrollments.order_by("id").values_list("id", flat=True)[0],
+        "like": Like.objects.filter(object_id=1).values_list("id", flat=True)[0],
+        "view": View.objects.filter(object_id=1).values_list("id", flat=True)[0],
+        "month": datetime.now().strftime("%Y-%m"),
+    }
+    return ids, users
@@ -8,6 +8,4 @@ app = Celery("educompass", include=["main.tasks"])
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
-logging.getLogger("celery.beat").info(
-    f"Loaded beat_schedule: {app.conf.beat_schedule!r}")
-print("⏰ Loaded beat_schedule:", app.conf.beat_schedule, flush=True)
+logging.getLogger("celery.beat").info("Loaded beat_schedule: %r", app.conf.beat_schedule)
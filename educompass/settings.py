@@ -16,6 +16,7 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -33,6 +34,14 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
+# "development" adds the debug toolbar and the Swagger/ReDoc docs;
+# "production" leaves them out, so workers start without importing them.
+# API_DOCS=true keeps the docs in production.
+SETTINGS_PROFILE = os.getenv("SETTINGS_PROFILE", "development" if DEBUG else "production")
+if SETTINGS_PROFILE not in ("development", "production"):
+    raise ImproperlyConfigured(f"Unknown SETTINGS_PROFILE {SETTINGS_PROFILE!r}")
+API_DOCS = os.getenv("API_DOCS", str(SETTINGS_PROFILE == "development")).lower() == "true"
+
 ALLOWED_HOSTS = ["*"]
 
 
@@ -50,9 +59,7 @@ INSTALLED_APPS = [
     "rest_framework",
     "djoser",
     "rest_framework_simplejwt.token_blacklist",
-    "debug_toolbar",
     "corsheaders",
-    "drf_yasg",
     'django_quill',
     "modeltranslation",
     # local apps
@@ -64,6 +71,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so the time and queries of every other middleware are included.
+    "api.metrics.MetricsMiddleware",
+    "api.instrumentation.RequestInstrumentationMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -72,9 +82,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
 ]
 
+if SETTINGS_PROFILE == "development":
+    INSTALLED_APPS.append("debug_toolbar")
+    MIDDLEWARE.append("debug_toolbar.middleware.DebugToolbarMiddleware")
+if API_DOCS:
+    INSTALLED_APPS.append("drf_yasg")
+
 
 LANGUAGES = [
     ("uz", "Uzbek"),
@@ -145,6 +160,26 @@ if os.getenv("CI", "false").lower() == "true":
         }
     }
 
+# Cache
+# Local memory by default; set CACHE_URL (e.g. redis://localhost:6379/2) to
+# share cached aggregates across gunicorn workers and Celery. Required with
+# more than one worker: without it, other workers see lookup table edits
+# (main.lookups) only after a minute and ownership changes (api.scopes) after
+# a few seconds (check api.W001).
+
+# Django's backends plus hit/miss counters for /metrics (api.caches).
+CACHES = {
+    "default": {
+        "BACKEND": "api.caches.LocMemCache",
+    }
+}
+
+if os.getenv("CACHE_URL"):
+    CACHES["default"] = {
+        "BACKEND": "api.caches.RedisCache",
+        "LOCATION": os.getenv("CACHE_URL"),
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -183,6 +218,9 @@ STATIC_URL = "static/"
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+# Optional CDN origin for media links, e.g. https://cdn.educompass.uz; when
+# unset, API responses use the request's own scheme and host.
+MEDIA_HOST = os.getenv("MEDIA_HOST", "")
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -192,20 +230,42 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
+    # orjson-backed JSON; both fall back to the stdlib when orjson is missing.
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ScopedJWTAuthentication",
     ],
 }
 
 APPEND_SLASH = True
 
+# Share of requests profiled by api.instrumentation (query count, DB and
+# serializer time, response size): 0 disables it, 1 profiles everything.
+INSTRUMENTATION_SAMPLE_RATE = float(os.getenv("INSTRUMENTATION_SAMPLE_RATE", "0.01"))
+# Identical queries in one request from which it is logged as a likely N+1.
+INSTRUMENTATION_DUPLICATE_THRESHOLD = int(os.getenv("INSTRUMENTATION_DUPLICATE_THRESHOLD", "5"))
+
+# Bearer token required to scrape /metrics; empty leaves it open (e.g. when
+# only reachable inside the cluster). See api.metrics for multi-process setup.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "AUTH_HEADER_TYPES": ("JWT",),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.tokens.ScopedTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.tokens.ScopedTokenRefreshSerializer",
 }
 
 
@@ -232,6 +292,8 @@ DJOSER = {
 }
 
 CELERY_BROKER_URL = "redis://localhost:6379/1"
+# Chords (the per-center export fan-out) need a result backend.
+CELERY_RESULT_BACKEND = "redis://localhost:6379/1"
 
 SWAGGER_USE_COMPAT_RENDERERS = False
 
@@ -240,6 +302,22 @@ CELERY_BEAT_SCHEDULE = {
         "task": "main.tasks.export_monthly_applications_task",
         "schedule": crontab(minute=0, hour=6, day_of_month="1"),
     },
+    "reconcile_monthly_reports": {
+        "task": "main.tasks.reconcile_monthly_reports_task",
+        "schedule": crontab(minute=0, hour=2),
+    },
+    "archive_past_events": {
+        "task": "main.tasks.archive_past_events_task",
+        "schedule": crontab(minute=5, hour=0),
+    },
+    "archive_finished_courses": {
+        "task": "main.tasks.archive_finished_courses_task",
+        "schedule": crontab(minute=10, hour=0),
+    },
+    "build_recommendations": {
+        "task": "main.tasks.build_recommendations_task",
+        "schedule": crontab(minute=30, hour=3),
+    },
 }
 CELERY_TIMEZONE = "Asia/Tashkent"
 
@@ -258,6 +336,11 @@ LOGGING = {
         },
     },
     "loggers": {
+        "api.instrumentation": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "celery.beat": {
             "handlers": ["console"],
             "level": "INFO",
@@ -0,0 +1,132 @@
+import json
+import os
+
+from django.conf import settings
+from django.utils import timezone
+
+from main.models import EducationCenter, Enrollment
+
+CHARGE_PERCENT = 3
+
+HEADERS = [
+    "full_name",
+    "phone_number",
+    "course_name",
+    "branch_name",
+    "applied_at",
+    "course_price",
+    "charge_percent",
+    "charge",
+]
+
+
+def export_dir():
+    path = os.path.join(settings.MEDIA_ROOT, "exports")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def applications(day):
+    """
+    Enrollments applied on ``day``, with everything the sheets print.
+    """
+    return Enrollment.objects.select_related(
+        "user",
+        "course__branch__edu_center",
+        "course__branch",
+    ).filter(applied_at__date=day)
+
+
+def centers_with_applications(day):
+    return sorted(set(
+        applications(day).values_list("course__branch__edu_center_id", flat=True)
+    ))
+
+
+def _write_sheet(ws, enrolls):
+    ws.append(HEADERS)
+    total_charge = 0
+    for e in enrolls:
+        price = float(e.course.price)
+        charge = round(price * CHARGE_PERCENT / 100, 2)
+        total_charge += charge
+        ws.append([
+            e.user.full_name,
+            e.user.phone_number,
+            e.course.name,
+            e.course.branch.name if e.course.branch else "",
+            timezone.localtime(e.applied_at).isoformat(),
+            price,
+            CHARGE_PERCENT,
+            charge,
+        ])
+    # Total satri
+    ws.append([""] * (len(HEADERS) - 2) + ["Total", total_charge])
+    # ustunlarni kengaytirish
+    from openpyxl.utils import get_column_letter
+
+    for i in range(1, len(HEADERS) + 1):
+        ws.column_dimensions[get_column_letter(i)].auto_size = True
+    return total_charge
+
+
+def export_center_applications(center_id, day):
+    """
+    Write one workbook for a center's applications on ``day``: an "All"
+    sheet plus one sheet per branch. Safe to rerun; the file is replaced.
+    """
+    # openpyxl is slow to import; only the export task needs it.
+    import openpyxl
+
+    center = EducationCenter.objects.get(pk=center_id)
+    enrolls = list(applications(day).filter(course__branch__edu_center_id=center_id))
+
+    wb = openpyxl.Workbook()
+    ws_all = wb.active
+    ws_all.title = "All"
+    total_charge = _write_sheet(ws_all, enrolls)
+
+    # keyin har filial uchun alohida varaqlar
+    branches = {}
+    for e in enrolls:
+        branches.setdefault(e.course.branch, []).append(e)
+    for branch, blist in branches.items():
+        _write_sheet(wb.create_sheet(title=branch.name[:31]), blist)  # sheet name limit 31
+
+    fname = f"{center.id}-{center.name.replace(' ', '_')}-{day.isoformat()}-applications.xlsx"
+    path = os.path.join(export_dir(), fname)
+    wb.save(path)
+    return {
+        "center_id": center.id,
+        "center_name": center.name,
+        "path": path,
+        "rows": len(enrolls),
+        "charge": round(total_charge, 2),
+    }
+
+
+def manifest_path(day):
+    return os.path.join(export_dir(), f"{day.isoformat()}-manifest.json")
+
+
+def write_manifest(day, results):
+    """
+    Merge per-center ``results`` into the day's manifest, replacing earlier
+    entries of the same centers, so a rerun of failed centers only adds to it.
+    """
+    path = manifest_path(day)
+    centers = {}
+    if os.path.exists(path):
+        with open(path) as fh:
+            centers = {c["center_id"]: c for c in json.load(fh)["centers"]}
+    centers.update({r["center_id"]: r for r in results})
+
+    manifest = {
+        "date": day.isoformat(),
+        "generated_at": timezone.now().isoformat(),
+        "centers": sorted(centers.values(), key=lambda c: c["center_id"]),
+        "failed": sorted(c["center_id"] for c in centers.values() if c.get("error")),
+    }
+    with open(path, "w") as fh:
+        json.dump(manifest, fh, indent=2)
+    return manifest
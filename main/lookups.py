@@ -0,0 +1,113 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from api.caches import is_cache_shared
+
+from .models import Category, Day, EduType, Level
+
+# Small reference tables held in process memory, loaded whole.
+LOOKUP_QUERYSETS = {
+    Day: Day.objects.order_by("id"),
+    EduType: EduType.objects.order_by("id"),
+    Category: Category.objects.prefetch_related("levels"),
+    Level: Level.objects.select_related("category"),
+}
+
+# model -> (version, {pk: instance})
+_tables = {}
+
+# Seconds a version token lives in a process-local cache (no CACHE_URL).
+# invalidate() then only reaches the worker that made the write, so the
+# others reload when their token expires instead of never.
+LOCAL_VERSION_TIMEOUT = 60
+
+
+def version_key(model):
+    return f"main:lookup-version:{model._meta.label_lower}"
+
+
+def version_timeout():
+    return None if is_cache_shared() else LOCAL_VERSION_TIMEOUT
+
+
+def get_version(model):
+    """
+    The shared version token of ``model``'s table. A missing key (first use,
+    cache flush, eviction, expiry) gets a fresh token, so no process keeps a
+    stale copy.
+    """
+    key = version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, version_timeout())
+        version = cache.get(key)
+    return version
+
+
+def get_table(model):
+    """
+    All rows of a lookup model as ``{pk: instance}``, in queryset order.
+
+    Costs one cache read per call; the database is only queried after a
+    write elsewhere has bumped the version. Instances are shared between
+    requests and must be treated as read-only.
+    """
+    version = get_version(model)
+    entry = _tables.get(model)
+    if entry is None or entry[0] != version:
+        entry = (version, {obj.pk: obj for obj in LOOKUP_QUERYSETS[model].all()})
+        _tables[model] = entry
+    return entry[1]
+
+
+def get(model, pk):
+    """
+    The ``model`` row with ``pk``, or ``None``. Misses fall back to the
+    database in case the row was added inside the current transaction.
+    """
+    if pk is None:
+        return None
+    obj = get_table(model).get(pk)
+    if obj is None:
+        obj = LOOKUP_QUERYSETS[model].filter(pk=pk).first()
+        if obj is not None:
+            _tables.pop(model, None)
+    return obj
+
+
+def existing_ids(model, ids):
+    """
+    The subset of ``ids`` that exist, with one query for any misses.
+    """
+    ids = set(ids)
+    found = ids & get_table(model).keys()
+    missing = ids - found
+    if missing:
+        extra = set(model.objects.filter(pk__in=missing).values_list("pk", flat=True))
+        if extra:
+            _tables.pop(model, None)
+        found |= extra
+    return found
+
+
+def day_ids(names):
+    """
+    IDs of the ``Day`` rows whose ``name`` is in ``names``.
+    """
+    names = set(names)
+    return [pk for pk, day in get_table(Day).items() if day.name in names]
+
+
+def invalidate(*models):
+    """
+    Bump the version of ``models`` once the surrounding transaction commits,
+    so every process reloads its copy on the next read.
+    """
+    def bump():
+        for model in models:
+            _tables.pop(model, None)
+            cache.set(version_key(model), uuid4().hex, version_timeout())
+
+    transaction.on_commit(bump)
@@ -0,0 +1,23 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from main.recommendations import TOP_K, build_recommendations
+
+
+class Command(BaseCommand):
+    help = "Rebuild stored course recommendations per course and per user"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top-k", type=int, default=TOP_K,
+            help=f"Recommendations kept per course and per user (default {TOP_K})",
+        )
+
+    def handle(self, *args, **options):
+        started = perf_counter()
+        course_rows, user_rows = build_recommendations(options["top_k"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Stored {course_rows} course and {user_rows} user recommendations "
+            f"in {perf_counter() - started:.1f}s"
+        ))
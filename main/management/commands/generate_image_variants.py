@@ -0,0 +1,18 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from main.thumbnails import THUMBNAIL_WIDTHS, generate_image_variants, stale_fields
+
+
+class Command(BaseCommand):
+    help = "Generate missing or outdated thumbnail variants for all uploaded images"
+
+    def handle(self, *args, **options):
+        built = 0
+        for label in THUMBNAIL_WIDTHS:
+            for instance in apps.get_model(label).objects.iterator():
+                if stale_fields(instance):
+                    fields = generate_image_variants(label, instance.pk)
+                    built += len(fields)
+                    self.stdout.write(f"{label} #{instance.pk}: {', '.join(fields)}")
+        self.stdout.write(self.style.SUCCESS(f"Updated {built} image fields"))
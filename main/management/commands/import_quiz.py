@@ -0,0 +1,284 @@
+import csv
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.db.models import Q
+
+from main.models import Level
+from quiz.importers import BULK_BATCH_SIZE, bulk_add_questions
+from quiz.models import Pack
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import quiz packs, questions and answers from a JSON or CSV "
+        "question bank. The bank is read a pack at a time and written in "
+        "batches of about --batch-size questions, each in its own "
+        "transaction; an invalid record stops the import, keeping the "
+        "batches already written.\n\n"
+        "JSON: [{\"level\": 3, \"pack\": \"Pack 1\", \"description\": \"...\", "
+        "\"questions\": [{\"text\": \"...\", \"answers\": "
+        "[{\"text\": \"...\", \"correct\": true}, ...]}]}]\n"
+        "JSON Lines (.jsonl): one pack object as above per line, read a line "
+        "at a time; preferred for large banks.\n"
+        "CSV columns: level, pack, question, answers, correct[, description] "
+        "where answers are separated by '|' and correct is the 1-based "
+        "number of the right answer; keep the rows of a pack together.\n"
+        "level is a Level ID or a unique level name. Questions are appended "
+        "to an existing pack with the same level and title."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to a .json, .jsonl or .csv question bank")
+        parser.add_argument(
+            "--format",
+            choices=["json", "jsonl", "csv"],
+            help="Input format (default: taken from the file extension)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help=f"Rows per INSERT statement (default: {BULK_BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        readers = {"json": self.read_json, "jsonl": self.read_jsonl, "csv": self.read_csv}
+        if fmt not in readers:
+            raise CommandError("Cannot infer format; pass --format json|jsonl|csv.")
+
+        self.levels = {}
+        started = time.perf_counter()
+        pack_ids, total_rows = set(), 0
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as fh:
+                for batch in self.batches(readers[fmt](fh), options["batch_size"]):
+                    for pack, rows in self.write_batch(batch, options["batch_size"]):
+                        pack_ids.add(pack.pk)
+                        total_rows += rows
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {len(pack_ids)} packs, {total_rows} rows "
+            f"in {time.perf_counter() - started:.2f}s "
+            f"({self.rate(total_rows, started)} rows/s)."
+        ))
+
+    @staticmethod
+    def rate(rows, started):
+        elapsed = time.perf_counter() - started
+        return f"{rows / elapsed:.0f}" if elapsed else "∞"
+
+    @staticmethod
+    def batches(packs, size):
+        """
+        Group the ``(key, bank)`` pairs of a reader into lists holding at
+        least ``size`` questions each (the last one may hold fewer).
+        """
+        batch, questions = [], 0
+        for key, bank in packs:
+            batch.append((key, bank))
+            questions += len(bank["questions"])
+            if questions >= size:
+                yield batch
+                batch, questions = [], 0
+        if batch:
+            yield batch
+
+    def write_batch(self, batch, batch_size):
+        """
+        Write one batch in a transaction: its existing packs are read in one
+        query and the missing ones created with one ``bulk_create``. Returns
+        ``(pack, rows inserted)`` per pack.
+        """
+        self.levels.update(
+            self.resolve_levels({level for (level, _), _ in batch} - self.levels.keys())
+        )
+        banks = {}
+        for (level_key, title), bank in batch:
+            level = self.levels[level_key]
+            merged = banks.setdefault((level.pk, title), {
+                "level": level, "description": bank["description"], "questions": [],
+            })
+            merged["questions"].extend(bank["questions"])
+
+        written = []
+        with transaction.atomic():
+            packs = self.existing_packs(banks)
+            created = banks.keys() - packs.keys()
+            missing = [
+                Pack(level=banks[key]["level"], title=key[1],
+                     description=banks[key]["description"])
+                for key in created
+            ]
+            # bulk_create skips post_save; bulk_add_questions() below drops
+            # the cached pack list of each level instead.
+            Pack.objects.bulk_create(missing, batch_size=batch_size)
+            connection = connections[router.db_for_write(Pack)]
+            if connection.features.can_return_rows_from_bulk_insert:
+                packs.update({(pack.level_id, pack.title): pack for pack in missing})
+            elif missing:
+                packs = self.existing_packs(banks)
+
+            for key, bank in banks.items():
+                pack = packs[key]
+                pack_started = time.perf_counter()
+                rows = int(key in created) + bulk_add_questions(
+                    pack, bank["questions"], batch_size=batch_size
+                )
+                self.stdout.write(self.style.SUCCESS(
+                    f"[{bank['level'].name}] {pack.title}: "
+                    f"{len(bank['questions'])} questions, "
+                    f"{rows} rows ({self.rate(rows, pack_started)} rows/s)"
+                ))
+                written.append((pack, rows))
+        return written
+
+    @staticmethod
+    def existing_packs(banks):
+        """
+        Map each ``(level_id, title)`` in ``banks`` to its oldest pack in one query.
+        """
+        query = Q(pk__in=[])
+        for level_id, title in banks:
+            query |= Q(level_id=level_id, title=title)
+        packs = {}
+        for pack in Pack.objects.filter(query).order_by("pk"):
+            packs.setdefault((pack.level_id, pack.title), pack)
+        return packs
+
+    # ─── Parsing ────────────────────────────────────────────────────────────
+    # Readers are generators of ``((level, pack), bank)`` pairs, one per pack
+    # (CSV: per run of rows with the same pack), so only the batch being
+    # written is held in memory.
+
+    def add_question(self, packs, where, level, title, description, text, options):
+        """
+        Validate one question and group it under its ``(level, pack)`` key.
+        """
+        if level in (None, "") or not str(title or "").strip():
+            raise CommandError(f"{where}: level and pack are required.")
+        if not str(text or "").strip():
+            raise CommandError(f"{where}: question text is empty.")
+        if len(options) < 2:
+            raise CommandError(f"{where}: a question needs at least 2 answers.")
+        if not any(correct for _, correct in options):
+            raise CommandError(f"{where}: no answer is marked correct.")
+
+        key = (str(level).strip(), str(title).strip())
+        bank = packs.setdefault(key, {"description": description or "", "questions": []})
+        bank["questions"].append((str(text).strip(), options))
+
+    def read_json(self, fh):
+        try:
+            data = json.load(fh)
+        except ValueError as exc:
+            raise CommandError(f"Invalid JSON: {exc}")
+        if not isinstance(data, list):
+            raise CommandError("JSON root must be a list of packs.")
+
+        for p_idx, item in enumerate(data, start=1):
+            packs = {}
+            self.add_pack(packs, f"pack #{p_idx}", item)
+            yield from packs.items()
+
+    def read_jsonl(self, fh):
+        for line, text in enumerate(fh, start=1):
+            if not text.strip():
+                continue
+            try:
+                item = json.loads(text)
+            except ValueError as exc:
+                raise CommandError(f"line {line}: invalid JSON: {exc}")
+            packs = {}
+            self.add_pack(packs, f"line {line}", item)
+            yield from packs.items()
+
+    def add_pack(self, packs, where, item):
+        """
+        Validate the shape of one JSON pack object and add its questions.
+        """
+        if not isinstance(item, dict):
+            raise CommandError(f"{where}: a pack must be an object.")
+        questions = item.get("questions") or []
+        if not isinstance(questions, list):
+            raise CommandError(f"{where}: questions must be a list.")
+        for q_idx, q in enumerate(questions, start=1):
+            at = f"{where} question #{q_idx}"
+            if not isinstance(q, dict):
+                raise CommandError(f"{at}: a question must be an object.")
+            answers = q.get("answers") or []
+            if not isinstance(answers, list) or not all(
+                isinstance(a, dict) for a in answers
+            ):
+                raise CommandError(f"{at}: answers must be a list of objects.")
+            options = [
+                (str(a.get("text", "")).strip(), bool(a.get("correct"))) for a in answers
+            ]
+            self.add_question(
+                packs, at, item.get("level"), item.get("pack"), item.get("description"),
+                q.get("text"), options,
+            )
+
+    def read_csv(self, fh):
+        reader = csv.DictReader(fh)
+        missing = {"level", "pack", "question", "answers", "correct"} - set(
+            reader.fieldnames or []
+        )
+        if missing:
+            raise CommandError(f"CSV is missing columns: {', '.join(sorted(missing))}")
+
+        packs = {}
+        for line, row in enumerate(reader, start=2):
+            answers = [a.strip() for a in row["answers"].split("|") if a.strip()]
+            try:
+                correct = int(row["correct"]) - 1
+            except (TypeError, ValueError):
+                raise CommandError(f"line {line}: correct must be an answer number.")
+            if not 0 <= correct < len(answers):
+                raise CommandError(f"line {line}: correct is out of range.")
+            self.add_question(
+                packs, f"line {line}",
+                row["level"], row["pack"], row.get("description"),
+                row["question"], [(a, i == correct) for i, a in enumerate(answers)],
+            )
+            if len(packs) > 1:
+                # A row of another pack completes the previous one.
+                key = next(iter(packs))
+                yield key, packs.pop(key)
+        yield from packs.items()
+
+    def resolve_levels(self, keys):
+        """
+        Map each level key (ID or case-insensitive name) to a Level in one query.
+        """
+        ids = [int(k) for k in keys if k.isdigit()]
+        names = {k.lower() for k in keys if not k.isdigit()}
+
+        query = Q(pk__in=ids)
+        for name in names:
+            query |= Q(name__iexact=name)
+        by_id, by_name = {}, {}
+        for level in Level.objects.filter(query):
+            by_id[level.pk] = level
+            by_name.setdefault(level.name.lower(), []).append(level)
+
+        resolved = {}
+        for key in keys:
+            if key.isdigit():
+                level = by_id.get(int(key))
+            else:
+                found = by_name.get(key.lower(), [])
+                if len(found) > 1:
+                    raise CommandError(f"Level name {key!r} is ambiguous; use its ID.")
+                level = found[0] if found else None
+            if level is None:
+                raise CommandError(f"Level {key!r} not found.")
+            resolved[key] = level
+        return resolved
@@ -0,0 +1,23 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from accounts.reports import reconcile_monthly_reports
+
+
+class Command(BaseCommand):
+    help = "Recompute MonthlyCenterReport application counts and payable amounts from enrollments"
+
+    def handle(self, *args, **options):
+        started = perf_counter()
+        diffs = reconcile_monthly_reports()
+        for d in diffs:
+            action = "created" if d["created"] else "fixed"
+            self.stdout.write(
+                f"{action} center {d['edu_center_id']} {d['year']}-{d['month']:02d}: "
+                f"applications {d['total_applications'][0]} -> {d['total_applications'][1]}, "
+                f"payable {d['payable_amount'][0]} -> {d['payable_amount'][1]}"
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f"Corrected {len(diffs)} reports in {perf_counter() - started:.2f}s"
+        ))
@@ -1,8 +1,10 @@
 import random
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils.crypto import get_random_string
 from main.models import Level
-from quiz.models import Pack, Question, Answer
+from quiz.importers import bulk_add_questions
+from quiz.models import Pack
 
 
 class Command(BaseCommand):
@@ -64,23 +66,19 @@ class Command(BaseCommand):
         random.shuffle(pool)
         selected = pool[:count]
 
-        # 4) Create questions, round-robin assign to packs
+        # 4) Round-robin assign to packs, then bulk insert each pack
+        per_pack = {pack.id: [] for pack in packs}
         for idx, (text, options, correct_idx) in enumerate(selected):
-            pack = packs[idx % 2]
-            position = Question.objects.filter(pack=pack).count() + 1
-            q = Question.objects.create(
-                pack=pack,
-                text=text,
-                position=position
-            )
-            for opt_idx, opt in enumerate(options):
-                Answer.objects.create(
-                    question=q,
-                    text=opt,
-                    correct=(opt_idx == correct_idx)
-                )
+            per_pack[packs[idx % 2].id].append((
+                text,
+                [(opt, opt_idx == correct_idx) for opt_idx, opt in enumerate(options)],
+            ))
+
+        for pack in packs:
+            with transaction.atomic():
+                rows = bulk_add_questions(pack, per_pack[pack.id])
             self.stdout.write(self.style.SUCCESS(
-                f"[{pack.title}] Created Q#{q.id}: \"{text[:30]}…\""
+                f"[{pack.title}] Created {len(per_pack[pack.id])} questions ({rows} rows)"
             ))
 
         self.stdout.write(self.style.SUCCESS(
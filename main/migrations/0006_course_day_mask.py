@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0005_alter_category_options_remove_category_icon_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="day_mask",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+    ]
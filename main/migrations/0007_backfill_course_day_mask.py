@@ -0,0 +1,30 @@
+from django.db import migrations
+
+WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+
+
+def backfill(apps, schema_editor):
+    Course = apps.get_model("main", "Course")
+    bits = {name: 1 << i for i, name in enumerate(WEEKDAYS)}
+
+    masks = {}
+    rows = Course.days.through.objects.values_list("course_id", "day__name")
+    for course_id, name in rows.iterator():
+        masks[course_id] = masks.get(course_id, 0) | bits.get(name, 0)
+
+    by_mask = {}
+    for course_id, mask in masks.items():
+        by_mask.setdefault(mask, []).append(course_id)
+    for mask, ids in by_mask.items():
+        Course.objects.filter(pk__in=ids).update(day_mask=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0006_course_day_mask"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0008_recommendations"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["date", "start_time"],
+                name="main_event_upcoming_idx",
+            ),
+        ),
+    ]
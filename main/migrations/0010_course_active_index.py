@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-19 03:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0009_event_upcoming_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                condition=models.Q(("is_archived", False)),
+                fields=["start_date"],
+                name="main_course_active_idx",
+            ),
+        ),
+    ]
@@ -63,6 +63,29 @@ class Day(models.Model):
         return self.get_name_display()
 
 
+# One bit per weekday for ``Course.day_mask``: Monday = 1 ... Sunday = 64.
+DAY_BITS = {value: 1 << i for i, value in enumerate(Day.DayChoices.values)}
+# "Mon", "Wed", ... for every possible mask, so rendering days is an index.
+DAY_MASK_LABELS = [
+    tuple(
+        label[:3]
+        for i, label in enumerate(Day.DayChoices.labels)
+        if mask & (1 << i)
+    )
+    for mask in range(1 << len(DAY_BITS))
+]
+
+
+def day_mask(names):
+    """
+    Bitmask of the ``Day.name`` values in ``names``.
+    """
+    mask = 0
+    for name in names:
+        mask |= DAY_BITS.get(name, 0)
+    return mask
+
+
 class Like(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
@@ -125,8 +148,12 @@ class EducationCenter(models.Model):
     website_link = models.URLField(max_length=255, blank=True, null=True)
     active = models.BooleanField(default=True)
     order = models.IntegerField(default=0)
+    # Resized copies per image field, filled by main.thumbnails.
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     likes = GenericRelation(Like)
     views = GenericRelation(View)
+    # Bumped on every write that changes the API payload (conditional GET).
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name}"
@@ -176,6 +203,8 @@ class Branch(models.Model):
         help_text="Ish vaqti, masalan: 09:00-18:00",
     )
     telegram_link = models.URLField(max_length=255, blank=True, null=True)
+    # Bumped on every write that changes the API payload (conditional GET).
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name} ({self.edu_center.name})"
@@ -201,6 +230,20 @@ class Event(models.Model):
     description = models.TextField()
     link = models.URLField(max_length=255, blank=True, null=True)
     is_archived = models.BooleanField(default=False)
+    # Resized copies per image field, filled by main.thumbnails.
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    # Bumped on every write that changes the API payload (conditional GET).
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Serves the live listing; archived events are never scanned.
+            models.Index(
+                fields=["date", "start_time"],
+                condition=models.Q(is_archived=False),
+                name="main_event_upcoming_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.edu_center.name}"
@@ -227,6 +270,10 @@ class Course(models.Model):
     end_time = models.TimeField()
     intensive = models.BooleanField(default=False)
     is_archived = models.BooleanField(default=False)
+    # Denormalized ``days`` (see ``DAY_BITS``), kept in sync by ``refresh_day_masks``.
+    day_mask = models.PositiveSmallIntegerField(default=0, editable=False)
+    # Bumped on every write that changes the API payload (conditional GET).
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name} ({self.branch.name} / {self.branch.edu_center.name})"
@@ -242,6 +289,34 @@ class Course(models.Model):
     class Meta:
         ordering = ["start_date"]
         unique_together = ("name", "branch")
+        indexes = [
+            # The public catalog only lists active courses, in this order.
+            models.Index(
+                fields=["start_date"],
+                condition=models.Q(is_archived=False),
+                name="main_course_active_idx",
+            ),
+        ]
+
+
+def refresh_day_masks(course_ids):
+    """
+    Recompute ``day_mask`` of ``course_ids`` from their ``days`` rows.
+    Returns ``{course_id: mask}``.
+    """
+    masks = dict.fromkeys(course_ids, 0)
+    rows = Course.days.through.objects.filter(course_id__in=masks).values_list(
+        "course_id", "day__name"
+    )
+    for course_id, name in rows:
+        masks[course_id] |= DAY_BITS.get(name, 0)
+
+    by_mask = {}
+    for course_id, mask in masks.items():
+        by_mask.setdefault(mask, []).append(course_id)
+    for mask, ids in by_mask.items():
+        Course.objects.filter(pk__in=ids).update(day_mask=mask, updated_at=timezone.now())
+    return masks
 
 
 class Banner(models.Model):
@@ -249,6 +324,8 @@ class Banner(models.Model):
     image_uz = models.ImageField(upload_to="banners/uz/")
     image_en = models.ImageField(upload_to="banners/en/")
     image_ru = models.ImageField(upload_to="banners/ru/")
+    # Resized copies per image field, filled by main.thumbnails.
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self):
         return f"Banner #{self.pk}"
@@ -291,6 +368,39 @@ class Enrollment(models.Model):
         return f"{self.user} → {self.course.name} ({self.status})"
 
 
+class CourseRecommendation(models.Model):
+    """
+    Top courses co-enrolled with ``course``, rebuilt offline by
+    ``main.recommendations.build_recommendations``.
+    """
+    course = models.ForeignKey(
+        Course, on_delete=models.CASCADE, related_name="recommendations"
+    )
+    recommended = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ("course", "recommended")
+        ordering = ["course", "-score"]
+
+
+class UserRecommendation(models.Model):
+    """
+    Top courses for ``user``, rebuilt offline with ``CourseRecommendation``.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="course_recommendations"
+    )
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ("user", "course")
+        ordering = ["user", "-score"]
+
+
 # Quiz model
 
 
@@ -0,0 +1,209 @@
+from collections import Counter, defaultdict
+from heapq import nlargest
+from math import log1p, sqrt
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from quiz.models import UserLevelProgress
+
+from .models import (Course, CourseRecommendation, EducationCenter, Enrollment,
+                     Like, UserRecommendation, View)
+
+TOP_K = 20
+# Users with more enrollments than this only pair their latest ones.
+MAX_ITEMS_PER_USER = 50
+
+# Per-user score components on top of item-item similarity.
+LIKED_CENTER_BOOST = 0.5
+VIEWED_CENTER_BOOST = 0.2
+LEVEL_BOOST = 0.5
+POPULARITY_WEIGHT = 0.1
+
+POPULAR_KEY = "main:popular-courses"
+POPULAR_TIMEOUT = 60 * 60 * 24
+
+
+# ─── Offline build (Celery) ─────────────────────────────────────────────────
+
+
+def _course_similarity(baskets):
+    """
+    Cosine similarity between courses from co-enrollment counts, kept as a
+    sparse ``{course: Counter({other: score})}``.
+    """
+    counts = Counter()
+    pairs = defaultdict(Counter)
+    for courses in baskets.values():
+        counts.update(courses)
+        for a in courses:
+            for b in courses:
+                if a != b:
+                    pairs[a][b] += 1
+    return {
+        a: Counter({b: n / sqrt(counts[a] * counts[b]) for b, n in others.items()})
+        for a, others in pairs.items()
+    }
+
+
+def _center_affinity(model, center_ids):
+    """
+    ``{user_id: {center_id, ...}}`` from likes or views of education centers.
+    """
+    ct = ContentType.objects.get_for_model(EducationCenter)
+    out = defaultdict(set)
+    rows = model.objects.filter(content_type=ct, object_id__in=center_ids)
+    for user_id, center_id in rows.values_list("user_id", "object_id").iterator():
+        out[user_id].add(center_id)
+    return out
+
+
+def build_recommendations(top_k=TOP_K):
+    """
+    Rebuild ``CourseRecommendation`` and ``UserRecommendation``.
+
+    Course neighbours are the ``top_k`` most co-enrolled courses. A user's
+    score for a course sums its similarity to the user's enrollments, plus
+    boosts for centers the user liked or viewed and for the user's current
+    quiz level (the one with most passed tests), plus a small popularity
+    prior. Enrolled and archived courses are never recommended.
+
+    Returns ``(course_rows, user_rows)``.
+    """
+    courses = {
+        pk: (center_id, level_id)
+        for pk, center_id, level_id in Course.objects.filter(is_archived=False)
+        .values_list("id", "branch__edu_center_id", "level_id")
+    }
+
+    enrolled = defaultdict(list)
+    rows = (
+        Enrollment.objects.exclude(status=Enrollment.Status.CANCELED)
+        .order_by("user_id", "-applied_at")
+        .values_list("user_id", "course_id")
+    )
+    for user_id, course_id in rows.iterator():
+        enrolled[user_id].append(course_id)
+    baskets = {
+        user_id: set(ids[:MAX_ITEMS_PER_USER]) & courses.keys()
+        for user_id, ids in enrolled.items()
+    }
+    similarity = _course_similarity(baskets)
+
+    popularity = Counter()
+    for ids in baskets.values():
+        popularity.update(ids)
+    top_count = max(popularity.values(), default=0)
+    prior = {c: POPULARITY_WEIGHT * log1p(n) / log1p(top_count) for c, n in popularity.items()}
+    popular = [c for c, _ in popularity.most_common(top_k)]
+
+    center_ids = {center_id for center_id, _ in courses.values()}
+    by_center = defaultdict(list)
+    by_level = defaultdict(list)
+    for pk in sorted(courses, key=lambda c: -popularity[c]):
+        center_id, level_id = courses[pk]
+        by_center[center_id].append(pk)
+        by_level[level_id].append(pk)
+    liked = _center_affinity(Like, center_ids)
+    viewed = _center_affinity(View, center_ids)
+
+    levels = {}
+    progress = UserLevelProgress.objects.order_by("user_id", "passed_tests", "total_tests")
+    for user_id, level_id in progress.values_list("user_id", "level_id").iterator():
+        levels[user_id] = level_id  # last row per user has the most passed tests
+
+    course_rows = [
+        CourseRecommendation(course_id=a, recommended_id=b, score=score)
+        for a, others in similarity.items()
+        for b, score in others.most_common(top_k)
+    ]
+
+    user_rows = []
+    for user_id in baskets.keys() | liked.keys() | viewed.keys() | levels.keys():
+        mine = baskets.get(user_id, set())
+        scores = Counter()
+        for course_id in mine:
+            scores.update(similarity.get(course_id, {}))
+        for center_id in liked.get(user_id, ()):
+            for course_id in by_center[center_id][:top_k]:
+                scores[course_id] += LIKED_CENTER_BOOST
+        for center_id in viewed.get(user_id, ()):
+            for course_id in by_center[center_id][:top_k]:
+                scores[course_id] += VIEWED_CENTER_BOOST
+        level_id = levels.get(user_id)
+        for course_id in by_level.get(level_id, [])[:top_k]:
+            scores.setdefault(course_id, 0)
+
+        def ranked():
+            for course_id, score in scores.items():
+                if course_id in mine:
+                    continue
+                score += prior.get(course_id, 0)
+                if courses[course_id][1] == level_id:
+                    score *= 1 + LEVEL_BOOST
+                yield score, course_id
+
+        best = nlargest(top_k, ranked())
+        user_rows.extend(
+            UserRecommendation(user_id=user_id, course_id=course_id, score=score)
+            for score, course_id in best
+        )
+
+    with transaction.atomic():
+        CourseRecommendation.objects.all().delete()
+        CourseRecommendation.objects.bulk_create(course_rows, batch_size=1000)
+        UserRecommendation.objects.all().delete()
+        UserRecommendation.objects.bulk_create(user_rows, batch_size=1000)
+    cache.set(POPULAR_KEY, popular, POPULAR_TIMEOUT)
+    return len(course_rows), len(user_rows)
+
+
+# ─── Reads ──────────────────────────────────────────────────────────────────
+
+
+def popular_course_ids(limit=TOP_K):
+    """
+    Most enrolled active courses, as stored by the last build.
+    """
+    ids = cache.get(POPULAR_KEY)
+    if ids is None:
+        ids = list(
+            Course.objects.filter(is_archived=False)
+            .annotate(n=Count("enrollments", filter=~Q(enrollments__status="CANCELED")))
+            .order_by("-n", "id")
+            .values_list("id", flat=True)[:TOP_K]
+        )
+        cache.set(POPULAR_KEY, ids, POPULAR_TIMEOUT)
+    return ids[:limit]
+
+
+def recommended_course_ids(user, limit=TOP_K):
+    """
+    Stored recommendations for ``user``, best first. Users added since the
+    last build get the neighbours of their latest enrollment, then the
+    popular list.
+    """
+    ids = list(
+        UserRecommendation.objects.filter(user=user)
+        .order_by("-score")
+        .values_list("course_id", flat=True)[:limit]
+    )
+    if ids:
+        return ids
+
+    latest = (
+        Enrollment.objects.filter(user=user)
+        .order_by("-applied_at")
+        .values_list("course_id", flat=True)
+        .first()
+    )
+    if latest is not None:
+        ids = list(
+            CourseRecommendation.objects.filter(course_id=latest)
+            .exclude(recommended__enrollments__user=user)
+            .order_by("-score")
+            .values_list("recommended_id", flat=True)[:limit]
+        )
+    return ids or popular_course_ids(limit)
@@ -0,0 +1,158 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import (m2m_changed, post_delete, post_save, pre_delete,
+                                      pre_save)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from main.lookups import invalidate
+from main.models import (Banner, Branch, Category, Course, Day, EducationCenter,
+                         EduType, Enrollment, Event, Level, Like, Teacher, View,
+                         refresh_day_masks)
+from main.tasks import generate_image_variants_task
+from main.thumbnails import stale_fields
+
+
+@receiver([post_save, post_delete], sender=Day)
+@receiver([post_save, post_delete], sender=EduType)
+def lookup_changed(sender, **kwargs):
+    invalidate(sender)
+
+
+# Categories carry their prefetched levels and levels their category.
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Level)
+def category_or_level_changed(sender, **kwargs):
+    invalidate(Category, Level)
+
+
+@receiver(m2m_changed, sender=Course.days.through)
+def course_days_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # ``day.courses`` changed: ``pk_set`` holds the courses, except on
+        # clear, where they are captured before the rows go away.
+        if action == "pre_clear":
+            instance._cleared_course_ids = list(
+                instance.courses.values_list("pk", flat=True)
+            )
+        elif action == "post_clear":
+            refresh_day_masks(instance.__dict__.pop("_cleared_course_ids", []))
+        elif action in ("post_add", "post_remove"):
+            refresh_day_masks(pk_set)
+    elif action in ("post_add", "post_remove", "post_clear"):
+        instance.day_mask = refresh_day_masks([instance.pk])[instance.pk]
+
+
+# Deleting a day cascades its through rows without m2m_changed; renaming
+# one changes its bit. Either way the courses it was on are recomputed.
+@receiver(pre_delete, sender=Day)
+def day_deleting(sender, instance, **kwargs):
+    instance._deleted_course_ids = list(instance.courses.values_list("pk", flat=True))
+
+
+@receiver([post_save, post_delete], sender=Day)
+def day_changed(sender, instance, created=False, **kwargs):
+    if "_deleted_course_ids" in instance.__dict__:
+        refresh_day_masks(instance.__dict__.pop("_deleted_course_ids"))
+    elif not created:
+        refresh_day_masks(list(instance.courses.values_list("pk", flat=True)))
+
+
+@receiver(post_save, sender=EducationCenter)
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Banner)
+def image_uploaded(sender, instance, **kwargs):
+    if stale_fields(instance):
+        label, pk = sender._meta.label_lower, instance.pk
+        transaction.on_commit(
+            lambda: generate_image_variants_task.delay(label, pk), robust=True
+        )
+
+
+# ─── updated_at watermarks ──────────────────────────────────────────────────
+# Payloads embed related rows (enrollment counts, teacher names, likes...),
+# so changes to those bump ``updated_at`` of the rows that render them.
+
+
+# Like/view counters only move a center's watermark this often: they are
+# written on the hottest path, and counts up to a minute old are fine.
+COUNTER_TOUCH_INTERVAL = timedelta(seconds=60)
+
+# User fields that course payloads render for enrolled students.
+STUDENT_FIELDS = ("full_name", "phone_number")
+
+
+def _touch(queryset):
+    queryset.update(updated_at=timezone.now())
+
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=Branch)
+def center_content_changed(sender, instance, **kwargs):
+    # Center payloads list the categories of their courses.
+    if sender is Branch:
+        _touch(EducationCenter.objects.filter(pk=instance.edu_center_id))
+    else:
+        _touch(EducationCenter.objects.filter(branches=instance.branch_id))
+
+
+@receiver([post_save, post_delete], sender=Like)
+@receiver([post_save, post_delete], sender=View)
+def center_counter_changed(sender, instance, **kwargs):
+    if instance.content_type.model_class() is EducationCenter:
+        # Matches no row, so writes and locks nothing, inside the interval.
+        _touch(EducationCenter.objects.filter(
+            pk=instance.object_id,
+            updated_at__lt=timezone.now() - COUNTER_TOUCH_INTERVAL,
+        ))
+
+
+@receiver([post_save, post_delete], sender=Enrollment)
+def enrollment_changed(sender, instance, **kwargs):
+    _touch(Course.objects.filter(pk=instance.course_id))
+
+
+# pre_delete: SET_NULL has already cleared ``course.teacher`` by post_delete.
+@receiver([post_save, pre_delete], sender=Teacher)
+def teacher_changed(sender, instance, **kwargs):
+    _touch(Course.objects.filter(teacher=instance))
+
+
+@receiver(pre_save, sender=get_user_model())
+def remember_student_fields(sender, instance, update_fields=None, **kwargs):
+    # Logins save only last_login; skip the lookup when nothing rendered can change.
+    if instance._state.adding or (
+        update_fields is not None and not set(update_fields) & set(STUDENT_FIELDS)
+    ):
+        instance._student_fields_before = None
+        return
+    instance._student_fields_before = (
+        sender.objects.filter(pk=instance.pk).values_list(*STUDENT_FIELDS).first()
+    )
+
+
+@receiver(post_save, sender=get_user_model())
+def student_changed(sender, instance, **kwargs):
+    # Course payloads list their students' names and phone numbers.
+    before = instance.__dict__.pop("_student_fields_before", None)
+    if before is not None and before != tuple(getattr(instance, f) for f in STUDENT_FIELDS):
+        _touch(Course.objects.filter(enrollments__user=instance))
+
+
+@receiver(m2m_changed, sender=Event.categories.through)
+def event_categories_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        if action == "pre_clear":
+            _touch(instance.events.all())
+        elif action in ("post_add", "post_remove"):
+            _touch(Event.objects.filter(pk__in=pk_set))
+    elif action in ("post_add", "post_remove", "post_clear"):
+        _touch(Event.objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, sender=EducationCenter.edu_type.through)
+def center_edu_types_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and not reverse:
+        _touch(EducationCenter.objects.filter(pk=instance.pk))
@@ -1,23 +1,127 @@
-from celery import shared_task
+from celery import chord, shared_task
+from datetime import date
 from django.core import management
 from django.utils import timezone
 from io import StringIO
 import logging
+from PIL import Image, UnidentifiedImageError
+
+from main.models import Course, Event
+from main.thumbnails import generate_image_variants
+from main.exports import (centers_with_applications, export_center_applications,
+                          write_manifest)
 
 logger = logging.getLogger(__name__)
 
 
+EXPORT_MAX_RETRIES = 3
+
+
+@shared_task
+def export_monthly_applications_task(day=None, center_ids=None):
+    """
+    Fan the month's application export out as one task per center, then
+    collect the results into the day's manifest with a chord.
+
+    ``day`` (ISO date) defaults to the first of the current month and
+    ``center_ids`` to every center with applications that day; pass the
+    manifest's ``failed`` list to rerun just those centers.
+    """
+    first = date.fromisoformat(day) if day else timezone.localdate().replace(day=1)
+    logger.info(f"Running export_monthly_applications_task for {first}")
+    if center_ids is None:
+        center_ids = centers_with_applications(first)
+    if not center_ids:
+        return f"No applications on {first}"
+
+    header = [export_center_applications_task.s(cid, first.isoformat()) for cid in center_ids]
+    result = chord(header)(write_export_manifest_task.s(first.isoformat()))
+    return f"Exporting {len(center_ids)} centers for {first} ({result.id})"
+
+
+@shared_task(bind=True, acks_late=True, max_retries=EXPORT_MAX_RETRIES)
+def export_center_applications_task(self, center_id, day):
+    """
+    Export one center, retrying on its own with backoff. After the last
+    retry the error is returned instead of raised, so the chord still
+    writes a manifest for the other centers.
+    """
+    try:
+        return export_center_applications(center_id, date.fromisoformat(day))
+    except Exception as exc:
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=exc, countdown=30 * 2 ** self.request.retries)
+        logger.exception(f"Export of center {center_id} for {day} failed")
+        return {"center_id": center_id, "error": repr(exc)}
+
+
+@shared_task
+def write_export_manifest_task(results, day):
+    manifest = write_manifest(date.fromisoformat(day), results)
+    logger.info(
+        f"Export manifest for {day}: {len(manifest['centers'])} centers, "
+        f"failed: {manifest['failed']}"
+    )
+    return manifest
+
+
+@shared_task
+def build_recommendations_task():
+    out = StringIO()
+    management.call_command("build_recommendations", stdout=out)
+    result = out.getvalue().strip()
+    logger.info(f"build_recommendations command output: {result}")
+    return result
+
+
 @shared_task
-def export_monthly_applications_task():
-    now = timezone.localtime()
-    logger.info(f"[{now.isoformat()}] Running export_monthly_applications_task")
+def reconcile_monthly_reports_task():
     out = StringIO()
-    management.call_command("export_monthly_applications", stdout=out)
+    management.call_command("reconcile_monthly_reports", stdout=out)
     result = out.getvalue().strip()
+    logger.info(f"reconcile_monthly_reports command output: {result}")
+    return result
+
+
+@shared_task
+def archive_past_events_task():
+    """
+    Archive every event dated before today in one UPDATE, keeping the live
+    listing (and its partial index) limited to current events.
+    """
+    archived = Event.objects.filter(
+        is_archived=False, date__lt=timezone.localdate()
+    ).update(is_archived=True, updated_at=timezone.now())
+    logger.info(f"Archived {archived} past events")
+    return archived
+
+
+@shared_task
+def archive_finished_courses_task():
+    """
+    Archive every course whose ``end_date`` has passed, in one UPDATE.
+    """
+    archived = Course.objects.filter(
+        is_archived=False, end_date__lt=timezone.localdate()
+    ).update(is_archived=True, updated_at=timezone.now())
+    logger.info(f"Archived {archived} finished courses")
+    return archived
 
-    logger.info(f"export_monthly_applications command output: {result}")
-    return result  
 
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, max_retries=3)
+def generate_image_variants_task(model_label, pk):
+    """
+    Build thumbnails for one object. Storage errors (``OSError``) are
+    retried; an unreadable or oversized upload is logged and skipped, since
+    it would fail the same way on every retry.
+    """
+    try:
+        return generate_image_variants(model_label, pk)
+    # UnidentifiedImageError subclasses OSError, so it is caught first.
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        logger.warning(f"Skipping thumbnails of unreadable image {model_label}:{pk}",
+                       exc_info=True)
+        return []
 
 
 @shared_task
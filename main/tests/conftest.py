@@ -0,0 +1,45 @@
+import pytest
+from django.core.cache import cache
+
+from main.models import Branch, Category, Course, EducationCenter, Level
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def branch():
+    return Branch.objects.create(
+        name="Main",
+        edu_center=EducationCenter.objects.create(
+            name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent"
+        ),
+    )
+
+
+@pytest.fixture
+def level():
+    return Level.objects.create(
+        category=Category.objects.create(name="English"), name="Beginner"
+    )
+
+
+@pytest.fixture
+def make_course(branch, level):
+    """
+    Create a course in ``branch`` at ``level``; keyword arguments override
+    the remaining defaults.
+    """
+    def make(name, **fields):
+        fields = {
+            "branch": branch, "level": level, "total_places": 10, "price": 100,
+            "start_time": "10:00", "end_time": "12:00", **fields,
+        }
+        return Course.objects.create(
+            name=name, category_id=fields["level"].category_id, **fields
+        )
+    return make
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from main.models import Course
+from main.tasks import archive_finished_courses_task
+
+
+@pytest.fixture
+def make_course(make_course):
+    def make(name, ends_in_days=None):
+        end_date = None
+        if ends_in_days is not None:
+            end_date = timezone.localdate() + timedelta(days=ends_in_days)
+        return make_course(name, end_date=end_date)
+    return make
+
+
+@pytest.mark.django_db
+class TestCourseArchival:
+    def test_task_archives_only_finished_courses(self, make_course):
+        finished = make_course("Finished", ends_in_days=-1)
+        make_course("Ends today", ends_in_days=0)
+        make_course("Open ended")
+
+        assert archive_finished_courses_task() == 1
+        assert list(Course.objects.filter(is_archived=True)) == [finished]
+
+    def test_listing_hides_archived_unless_asked(self, make_course):
+        make_course("Finished", ends_in_days=-1)
+        make_course("Running", ends_in_days=30)
+        archive_finished_courses_task()
+        client = APIClient()
+
+        active = client.get("/api/courses/").data["items"]
+        archived = client.get("/api/courses/", {"archived": "true"}).data["items"]
+
+        assert [c["name"] for c in active] == ["Running"]
+        assert [c["name"] for c in archived] == ["Finished"]
@@ -0,0 +1,71 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from main.models import DAY_BITS, DAY_MASK_LABELS, Day, day_mask
+
+
+@pytest.fixture
+def days():
+    return {value: Day.objects.create(name=value) for value in Day.DayChoices.values}
+
+
+@pytest.fixture
+def make_course(make_course, days):
+    def make(name, *day_names):
+        course = make_course(name)
+        course.days.set([days[d] for d in day_names])
+        return course
+    return make
+
+
+def test_mask_labels_cover_every_combination():
+    assert day_mask(["MONDAY", "SUNDAY"]) == DAY_BITS["MONDAY"] | DAY_BITS["SUNDAY"]
+    assert DAY_MASK_LABELS[day_mask(["MONDAY", "WEDNESDAY"])] == ("Mon", "Wed")
+    assert len(DAY_MASK_LABELS) == 128
+
+
+@pytest.mark.django_db
+class TestCourseDayMask:
+    def test_mask_follows_the_m2m(self, make_course, days):
+        course = make_course("A", "MONDAY", "WEDNESDAY")
+        assert course.day_mask == day_mask(["MONDAY", "WEDNESDAY"])
+
+        course.days.remove(days["MONDAY"])
+        days["FRIDAY"].courses.add(course)
+        course.refresh_from_db()
+        assert course.day_mask == day_mask(["WEDNESDAY", "FRIDAY"])
+
+        days["WEDNESDAY"].courses.clear()
+        course.refresh_from_db()
+        assert course.day_mask == DAY_BITS["FRIDAY"]
+
+    def test_deleting_or_renaming_a_day_updates_masks(self, make_course, days):
+        course = make_course("A", "MONDAY", "WEDNESDAY")
+        other = make_course("B", "FRIDAY")
+
+        days["MONDAY"].delete()
+        course.refresh_from_db()
+        assert course.day_mask == day_mask(["WEDNESDAY"])
+
+        days["WEDNESDAY"].name = "SATURDAY"
+        days["WEDNESDAY"].save()
+        course.refresh_from_db()
+        other.refresh_from_db()
+        assert course.day_mask == day_mask(["SATURDAY"])
+        assert other.day_mask == day_mask(["FRIDAY"])
+
+    def test_day_filter_is_a_bitwise_predicate(self, make_course):
+        make_course("Weekday", "MONDAY", "WEDNESDAY")
+        make_course("Weekend", "SATURDAY", "SUNDAY")
+        make_course("Both", "MONDAY", "SUNDAY")
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = APIClient().get("/api/courses/", {"day": "Mon,Tue"}).data["items"]
+
+        assert sorted(c["name"] for c in results) == ["Both", "Weekday"]
+        assert next(c for c in results if c["name"] == "Both")["days"] == ["Mon", "Sun"]
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        assert "main_day" not in sql
+        assert "SELECT DISTINCT" not in sql
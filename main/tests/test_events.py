@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from main.models import Event
+from main.tasks import archive_past_events_task
+
+
+@pytest.fixture
+def make_event(branch):
+    center = branch.edu_center
+    today = timezone.localdate()
+
+    def make(name, days, start_time="10:00"):
+        return Event.objects.create(
+            name=name, picture="events/open-day.jpg", branch=branch, edu_center=center,
+            date=today + timedelta(days=days), start_time=start_time,
+            requirements="FREE", description="",
+        )
+    return make
+
+
+@pytest.mark.django_db
+class TestUpcomingEvents:
+    def test_upcoming_lists_events_from_today_soonest_first(self, make_event):
+        make_event("Yesterday", -1)
+        make_event("Next week", 7)
+        make_event("Today late", 0, "18:00")
+        make_event("Today early", 0, "09:00")
+
+        response = APIClient().get("/api/events/", {"upcoming": "true"})
+
+        assert [e["name"] for e in response.data["items"]] == [
+            "Today early", "Today late", "Next week",
+        ]
+
+    def test_archive_task_hides_past_events(self, make_event):
+        past, current = make_event("Yesterday", -1), make_event("Today", 0)
+
+        assert archive_past_events_task() == 1
+
+        past.refresh_from_db()
+        current.refresh_from_db()
+        assert past.is_archived and not current.is_archived
+        names = [e["name"] for e in APIClient().get("/api/events/").data["items"]]
+        assert names == ["Today"]
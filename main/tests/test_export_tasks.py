@@ -0,0 +1,75 @@
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from educompass.celery import app
+from main.exports import manifest_path
+from main.models import Branch, Category, Course, EducationCenter, Enrollment, Level
+from main.tasks import (EXPORT_MAX_RETRIES, export_center_applications_task,
+                        export_monthly_applications_task)
+
+FIRST = date(2025, 5, 1)
+
+
+@pytest.fixture(autouse=True)
+def eager_celery(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    app.conf.task_always_eager = True
+    yield
+    app.conf.task_always_eager = False
+
+
+@pytest.fixture
+def centers():
+    category = Category.objects.create(name="English")
+    level = Level.objects.create(category=category, name="Beginner")
+    user = get_user_model().objects.create_user(
+        full_name="Student", phone_number="+998901234567", password="Test1234!"
+    )
+    ids = []
+    for name in ("Compass", "Polyglot"):
+        center = EducationCenter.objects.create(
+            name=name, country="Uzbekistan", region="Tashkent", city="Tashkent"
+        )
+        branch = Branch.objects.create(name=f"{name} Main", edu_center=center)
+        course = Course.objects.create(
+            name="General", branch=branch, category=category, level=level,
+            total_places=10, price=100, start_time="10:00", end_time="12:00",
+        )
+        Enrollment.objects.create(
+            user=user, course=course,
+            applied_at=datetime(2025, 5, 1, 9, tzinfo=timezone.utc),
+        )
+        ids.append(center.id)
+    return ids
+
+
+@pytest.mark.django_db
+class TestExportFanOut:
+    def test_each_center_is_exported_and_listed_in_the_manifest(self, centers):
+        export_monthly_applications_task.apply(kwargs={"day": FIRST.isoformat()})
+
+        with open(manifest_path(FIRST)) as fh:
+            manifest = json.load(fh)
+        assert [c["center_id"] for c in manifest["centers"]] == centers
+        assert all(c["rows"] == 1 for c in manifest["centers"])
+        assert manifest["failed"] == []
+
+    def test_center_gives_up_with_an_error_after_its_retries(self, centers):
+        result = export_center_applications_task.apply(
+            args=(0, FIRST.isoformat()), retries=EXPORT_MAX_RETRIES
+        ).get()
+
+        assert result["center_id"] == 0
+        assert "DoesNotExist" in result["error"]
+
+    def test_rerun_of_one_center_updates_the_manifest(self, centers):
+        export_monthly_applications_task.apply(kwargs={"day": FIRST.isoformat()})
+        export_monthly_applications_task.apply(
+            kwargs={"day": FIRST.isoformat(), "center_ids": centers[:1]}
+        )
+
+        with open(manifest_path(FIRST)) as fh:
+            assert len(json.load(fh)["centers"]) == 2
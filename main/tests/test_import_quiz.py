@@ -0,0 +1,129 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from quiz.models import Answer, Pack, Question
+
+
+@pytest.mark.django_db
+class TestImportQuiz:
+    def test_json_bank_is_bulk_inserted_with_positions(
+        self, level, tmp_path, django_assert_max_num_queries
+    ):
+        bank = [{
+            "level": level.id,
+            "pack": "Pack 1",
+            "questions": [
+                {
+                    "text": f"Question {i}",
+                    "answers": [
+                        {"text": "right", "correct": True},
+                        {"text": "wrong"},
+                    ],
+                }
+                for i in range(50)
+            ],
+        }]
+        path = tmp_path / "bank.json"
+        path.write_text(json.dumps(bank))
+
+        out = StringIO()
+        with django_assert_max_num_queries(10):
+            call_command("import_quiz", str(path), stdout=out)
+
+        pack = Pack.objects.get(level=level, title="Pack 1")
+        positions = list(pack.questions.values_list("position", flat=True))
+        assert positions == list(range(1, 51))
+        assert Answer.objects.filter(question__pack=pack).count() == 100
+        assert Answer.objects.filter(question__pack=pack, correct=True).count() == 50
+        assert "rows/s" in out.getvalue()
+
+    def test_csv_bank_appends_to_existing_pack(self, level, tmp_path):
+        pack = Pack.objects.create(level=level, title="Pack 1")
+        Question.objects.create(pack=pack, text="Existing", position=1)
+        path = tmp_path / "bank.csv"
+        path.write_text(
+            "level,pack,question,answers,correct\n"
+            "beginner,Pack 1,He ___ a doctor.,am|is|are,2\n"
+            "beginner,Pack 2,I am good ___ math.,in|of|at,3\n"
+        )
+
+        call_command("import_quiz", str(path), stdout=StringIO())
+
+        appended = Question.objects.get(pack=pack, text="He ___ a doctor.")
+        assert appended.position == 2
+        assert appended.answers.get(correct=True).text == "is"
+        assert Pack.objects.filter(level=level, title="Pack 2").exists()
+
+    def test_invalid_bank_writes_nothing(self, level, tmp_path):
+        path = tmp_path / "bank.csv"
+        path.write_text(
+            "level,pack,question,answers,correct\n"
+            f"{level.id},Pack 1,Fine question,a|b,1\n"
+            f"{level.id},Pack 1,Broken question,a|b,5\n"
+        )
+
+        with pytest.raises(CommandError, match="line 3"):
+            call_command("import_quiz", str(path), stdout=StringIO())
+        assert not Pack.objects.exists()
+
+    def test_packs_are_resolved_and_created_in_bulk(self, level, tmp_path):
+        Pack.objects.create(level=level, title="Pack 1")
+        path = tmp_path / "bank.csv"
+        path.write_text("level,pack,question,answers,correct\n" + "".join(
+            f"{level.id},Pack {i},Question {i},a|b,1\n" for i in range(1, 6)
+        ))
+
+        with CaptureQueriesContext(connection) as ctx:
+            call_command("import_quiz", str(path), stdout=StringIO())
+
+        # One SELECT for the existing packs, one INSERT for the missing ones.
+        assert len([q for q in ctx.captured_queries if '"quiz_pack"' in q["sql"]]) == 2
+        assert Pack.objects.filter(level=level).count() == 5
+        assert Question.objects.filter(pack__level=level).count() == 5
+
+    def test_batches_are_written_as_they_are_read(self, level, tmp_path):
+        path = tmp_path / "bank.csv"
+        path.write_text(
+            "level,pack,question,answers,correct\n"
+            f"{level.id},Pack 1,Fine question,a|b,1\n"
+            f"{level.id},Pack 2,Fine question,a|b,1\n"
+            f"{level.id},Pack 2,Broken question,a|b,5\n"
+        )
+
+        with pytest.raises(CommandError, match="line 4"):
+            call_command("import_quiz", str(path), "--batch-size", "1", stdout=StringIO())
+        assert list(Pack.objects.values_list("title", flat=True)) == ["Pack 1"]
+
+    def test_jsonl_bank_is_read_a_pack_per_line(self, level, tmp_path):
+        question = {"text": "He ___ a doctor.", "answers": [
+            {"text": "is", "correct": True}, {"text": "are"},
+        ]}
+        path = tmp_path / "bank.jsonl"
+        path.write_text("\n".join(
+            json.dumps({"level": level.id, "pack": f"Pack {i}", "questions": [question]})
+            for i in (1, 2)
+        ) + "\n\n")
+
+        call_command("import_quiz", str(path), stdout=StringIO())
+
+        assert Question.objects.filter(pack__level=level).count() == 2
+
+    @pytest.mark.parametrize("bank, where", [
+        ([["not", "a", "pack"]], "pack #1: a pack must be an object"),
+        ([{"level": 1, "pack": "P", "questions": "text"}], "pack #1: questions must"),
+        ([{"level": 1, "pack": "P", "questions": [3]}], "pack #1 question #1: a question"),
+        ([{"level": 1, "pack": "P", "questions": [
+            {"text": "Q", "answers": [{"text": "a", "correct": True}, "b"]},
+        ]}], "pack #1 question #1: answers must"),
+    ])
+    def test_malformed_json_names_the_record(self, level, tmp_path, bank, where):
+        path = tmp_path / "bank.json"
+        path.write_text(json.dumps(bank))
+
+        with pytest.raises(CommandError, match=where):
+            call_command("import_quiz", str(path), stdout=StringIO())
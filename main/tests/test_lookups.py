@@ -0,0 +1,68 @@
+import time
+
+import pytest
+from rest_framework.test import APIClient
+
+from main import lookups
+from main.models import Category, Day, Level
+
+
+@pytest.fixture
+def reference_data():
+    category = Category.objects.create(name="English")
+    Level.objects.create(category=category, name="Beginner")
+    Level.objects.create(category=category, name="Advanced")
+    for value, _ in Day.DayChoices.choices:
+        Day.objects.create(name=value)
+    return category
+
+
+@pytest.mark.django_db(transaction=True)
+class TestLookups:
+    def test_repeat_reads_skip_the_database(
+        self, reference_data, django_assert_num_queries
+    ):
+        client = APIClient()
+        client.get("/api/categories/")
+        client.get("/api/levels/")
+        client.get("/api/days/")
+        weekend = set(Day.objects.filter(name__in=["SATURDAY", "SUNDAY"])
+                      .values_list("id", flat=True))
+
+        with django_assert_num_queries(0):
+            categories = client.get("/api/categories/").json()
+            levels = client.get("/api/levels/").json()
+            assert set(lookups.day_ids(["SATURDAY", "SUNDAY"])) == weekend
+
+        assert [lvl["name"] for lvl in categories[0]["levels"]] == ["Advanced", "Beginner"]
+        assert levels[0]["category"]["name"] == "English"
+
+    def test_writes_bump_the_version(self, reference_data):
+        before = lookups.get_version(Category)
+        assert lookups.get(Category, reference_data.id).name == "English"
+
+        reference_data.name = "German"
+        reference_data.save()
+
+        assert lookups.get_version(Category) != before
+        assert lookups.get(Category, reference_data.id).name == "German"
+        assert lookups.get(Level, Level.objects.first().id).category.name == "German"
+
+    def test_rows_missing_from_the_table_fall_back_to_the_database(self, reference_data):
+        lookups.get_table(Category)
+        Category.objects.bulk_create([Category(name="Maths")])  # no signals
+        maths = Category.objects.get(name="Maths")
+
+        assert lookups.get(Category, maths.id).name == "Maths"
+        assert lookups.existing_ids(Category, [maths.id, 0]) == {maths.id}
+
+    def test_process_local_versions_expire(self, reference_data, monkeypatch):
+        assert lookups.get(Category, reference_data.id).name == "English"
+        # A write in another worker: the row changes, this process is not told.
+        Category.objects.filter(pk=reference_data.id).update(name="German")
+        assert lookups.get(Category, reference_data.id).name == "English"
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + lookups.LOCAL_VERSION_TIMEOUT + 1)
+
+        assert lookups.get(Category, reference_data.id).name == "German"
@@ -0,0 +1,99 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from main.models import (CourseRecommendation, Enrollment, Level,
+                         UserRecommendation)
+from quiz.models import UserLevelProgress
+
+
+@pytest.fixture
+def catalog(make_course, level):
+    advanced = Level.objects.create(category=level.category, name="Advanced")
+    return make_course, level, advanced
+
+
+@pytest.fixture
+def make_user():
+    counter = iter(range(100))
+
+    def make():
+        return get_user_model().objects.create_user(
+            full_name="Student", phone_number=f"+99890123{next(counter):04d}",
+            password="Test1234!",
+        )
+    return make
+
+
+@pytest.mark.django_db
+class TestRecommendations:
+    def test_co_enrolled_courses_are_recommended(self, catalog, make_user):
+        course, _, _ = catalog
+        grammar, speaking, writing = course("Grammar"), course("Speaking"), course("Writing")
+        for _ in range(3):
+            user = make_user()
+            Enrollment.objects.create(user=user, course=grammar)
+            Enrollment.objects.create(user=user, course=speaking)
+        other = make_user()
+        Enrollment.objects.create(user=other, course=writing)
+        newcomer = make_user()
+        Enrollment.objects.create(user=newcomer, course=grammar)
+
+        out = StringIO()
+        call_command("build_recommendations", stdout=out)
+
+        assert "course and" in out.getvalue()
+        assert list(
+            CourseRecommendation.objects.filter(course=grammar)
+            .values_list("recommended_id", flat=True)
+        ) == [speaking.id]
+        recommended = list(
+            UserRecommendation.objects.filter(user=newcomer).values_list("course_id", flat=True)
+        )
+        assert recommended[0] == speaking.id
+        assert grammar.id not in recommended
+
+    def test_quiz_level_boosts_matching_courses(self, catalog, make_user):
+        course, beginner, advanced = catalog
+        easy, hard = course("Easy"), course("Hard", level=advanced)
+        for c in (easy, hard):
+            Enrollment.objects.create(user=make_user(), course=c)
+        student = make_user()
+        UserLevelProgress.objects.create(user=student, level=advanced, total_tests=5, passed_tests=4)
+        UserLevelProgress.objects.create(user=student, level=beginner, total_tests=5, passed_tests=1)
+
+        call_command("build_recommendations", stdout=StringIO())
+
+        assert UserRecommendation.objects.filter(user=student).first().course_id == hard.id
+
+    def test_endpoint_reads_the_stored_rows(
+        self, catalog, make_user, django_assert_max_num_queries
+    ):
+        course, _, _ = catalog
+        first, second = course("First"), course("Second")
+        user = make_user()
+        UserRecommendation.objects.create(user=user, course=second, score=2)
+        UserRecommendation.objects.create(user=user, course=first, score=1)
+        client = APIClient()
+        client.force_authenticate(user)
+        client.get("/api/courses/recommended/")  # loads the lookup tables
+
+        with django_assert_max_num_queries(3):
+            response = client.get("/api/courses/recommended/")
+
+        assert [c["name"] for c in response.data] == ["Second", "First"]
+
+    def test_users_without_rows_get_popular_courses(self, catalog, make_user):
+        course, _, _ = catalog
+        course("Quiet")
+        busy = course("Busy")
+        Enrollment.objects.create(user=make_user(), course=busy)
+        client = APIClient()
+        client.force_authenticate(make_user())
+
+        response = client.get("/api/courses/recommended/")
+
+        assert [c["name"] for c in response.data] == ["Busy", "Quiet"]
@@ -0,0 +1,86 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from api.serializers import EducationCenterSerializer
+from main.models import EducationCenter
+from main.tasks import generate_image_variants_task
+from main.thumbnails import generate_image_variants, stale_fields
+
+
+def png(width, height):
+    out = BytesIO()
+    Image.new("RGBA", (width, height), (200, 30, 30, 128)).save(out, "PNG")
+    return SimpleUploadedFile("logo.png", out.getvalue(), content_type="image/png")
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.fixture
+def center(django_capture_on_commit_callbacks, monkeypatch):
+    queued = []
+    monkeypatch.setattr(generate_image_variants_task, "delay", lambda *a: queued.append(a))
+    with django_capture_on_commit_callbacks(execute=True):
+        center = EducationCenter.objects.create(
+            name="Compass", country="Uzbekistan", region="Tashkent", city="Tashkent",
+            logo=png(200, 100),
+        )
+    assert queued == [("main.educationcenter", center.pk)]
+    return center
+
+
+@pytest.mark.django_db
+class TestThumbnails:
+    def test_variants_are_sized_hashed_and_not_upscaled(self, center):
+        assert generate_image_variants("main.educationcenter", center.pk) == ["logo"]
+
+        center.refresh_from_db()
+        entry = center.image_variants["logo"]
+        assert entry["source"] == center.logo.name
+        assert sorted(entry["widths"], key=int) == ["64", "128"]
+        path = entry["widths"]["64"]["webp"]
+        assert entry["hash"] in path
+        with default_storage.open(path) as fh:
+            assert Image.open(fh).size == (64, 32)
+        assert stale_fields(center) == []
+        assert generate_image_variants("main.educationcenter", center.pk) == []
+
+    def test_serializer_exposes_srcset_once_built(self, center):
+        assert EducationCenterSerializer(center).data["logo_srcset"] is None
+
+        generate_image_variants("main.educationcenter", center.pk)
+        center.refresh_from_db()
+        data = EducationCenterSerializer(center).data
+
+        assert set(data["logo_srcset"]) == {"webp", "jpeg"}
+        assert data["logo_srcset"]["jpeg"]["128w"].endswith("-128.jpeg")
+        assert data["cover_srcset"] is None
+
+    def test_srcset_without_request_links_through_storage(self, center):
+        generate_image_variants("main.educationcenter", center.pk)
+        center.refresh_from_db()
+        path = center.image_variants["logo"]["widths"]["64"]["webp"]
+
+        data = EducationCenterSerializer(center, context={}).data
+
+        assert data["logo_srcset"]["webp"]["64w"] == default_storage.url(path)
+
+    def test_corrupt_upload_is_skipped_not_retried(self, center, monkeypatch):
+        with default_storage.open(center.logo.name, "wb") as fh:
+            fh.write(b"not an image")
+        retries = []
+        monkeypatch.setattr(generate_image_variants_task, "retry",
+                            lambda *a, **kw: retries.append(kw))
+
+        result = generate_image_variants_task.apply(("main.educationcenter", center.pk))
+
+        assert result.successful() and result.result == []
+        assert retries == []
+        center.refresh_from_db()
+        assert not center.image_variants
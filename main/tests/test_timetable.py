@@ -0,0 +1,110 @@
+from datetime import date, time
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from main.models import Enrollment, day_mask
+from main.timetable import Slot, WeeklyTimetable
+
+
+def slot(course_id, days, start, end, start_date=None, end_date=None):
+    return Slot(
+        course_id, f"Course {course_id}", "PENDING", time(*start), time(*end),
+        start_date, end_date, day_mask(days),
+    )
+
+
+class TestWeeklyTimetable:
+    def test_conflicts_need_a_shared_day_and_overlapping_times(self):
+        timetable = WeeklyTimetable([
+            slot(1, ["MONDAY", "WEDNESDAY"], (9, 0), (11, 0)),
+            slot(2, ["MONDAY"], (11, 0), (12, 0)),
+            slot(3, ["TUESDAY"], (8, 0), (20, 0)),
+            slot(4, ["WEDNESDAY"], (7, 0), (18, 0)),
+        ])
+
+        clashes = timetable.conflicts(slot(9, ["MONDAY"], (10, 30), (11, 30)))
+        assert [s.course_id for s in clashes] == [1, 2]
+        assert timetable.conflicts(slot(9, ["MONDAY"], (12, 0), (13, 0))) == []
+        # Course 4 started earliest but is still running: found via the max tree.
+        clashes = timetable.conflicts(slot(9, ["WEDNESDAY"], (17, 0), (17, 30)))
+        assert [s.course_id for s in clashes] == [4]
+
+    def test_one_long_slot_does_not_make_lookups_linear(self):
+        class CountingList(list):
+            reads = 0
+
+            def __getitem__(self, index):
+                CountingList.reads += 1
+                return super().__getitem__(index)
+
+        short = [
+            slot(i, ["MONDAY"], divmod(6 * 60 + 4 * i, 60), divmod(6 * 60 + 4 * i + 3, 60))
+            for i in range(2, 202)
+        ]
+        timetable = WeeklyTimetable([slot(1, ["MONDAY"], (6, 0), (22, 0)), *short])
+        starts, day, tree = timetable._days[0]
+        timetable._days[0] = (starts, day, CountingList(tree))
+
+        clashes = timetable.conflicts(slot(999, ["MONDAY"], (21, 0), (21, 30)))
+
+        assert [s.course_id for s in clashes] == [1]
+        # A tree walk touches a few nodes per level, not all 201 slots.
+        assert CountingList.reads < 60
+
+    def test_disjoint_date_ranges_do_not_conflict(self):
+        timetable = WeeklyTimetable([
+            slot(1, ["FRIDAY"], (9, 0), (11, 0), date(2025, 1, 1), date(2025, 3, 1)),
+        ])
+
+        later = slot(2, ["FRIDAY"], (9, 0), (11, 0), date(2025, 4, 1), None)
+        open_ended = slot(3, ["FRIDAY"], (10, 0), (12, 0))
+        assert timetable.conflicts(later) == []
+        assert [s.course_id for s in timetable.conflicts(open_ended)] == [1]
+
+
+@pytest.fixture
+def student_with_courses(make_course):
+    user = get_user_model().objects.create_user(
+        full_name="Test Student", phone_number="+998901234567", password="Test1234!"
+    )
+
+    def course(name, days, start, end):
+        return make_course(name, start_time=start, end_time=end, day_mask=day_mask(days))
+
+    morning = course("Morning", ["MONDAY", "THURSDAY"], "09:00", "11:00")
+    Enrollment.objects.create(user=user, course=morning)
+    late = course("Late", ["THURSDAY"], "10:00", "12:00")
+    client = APIClient()
+    client.force_authenticate(user)
+    return client, morning, late
+
+
+@pytest.mark.django_db
+class TestTimetableEndpoints:
+    def test_apply_warns_about_conflicts(self, student_with_courses):
+        client, morning, late = student_with_courses
+
+        response = client.post(f"/api/courses/{late.id}/apply/")
+
+        assert response.status_code == 201
+        assert response.data["conflicts"] == [
+            {"course_id": morning.id, "course_name": "Morning"}
+        ]
+
+    def test_my_timetable_groups_slots_by_day(
+        self, student_with_courses, django_assert_max_num_queries
+    ):
+        client, morning, late = student_with_courses
+        client.post(f"/api/courses/{late.id}/apply/")
+
+        with django_assert_max_num_queries(2):
+            days = client.get("/api/courses/my-timetable/").json()
+
+        assert [d["day"] for d in days] == ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        assert days[0]["slots"] == [{
+            "course_id": morning.id, "course_name": "Morning", "status": "PENDING",
+            "start_time": "09:00", "end_time": "11:00", "conflicts_with": [late.id],
+        }]
+        assert [s["course_name"] for s in days[3]["slots"]] == ["Morning", "Late"]
@@ -0,0 +1,150 @@
+import hashlib
+import posixpath
+from io import BytesIO
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+# Widths generated per image field; never upscaled past the original.
+THUMBNAIL_WIDTHS = {
+    "main.educationcenter": {
+        "logo": (64, 128, 256),
+        "cover": (480, 960, 1440),
+    },
+    "main.event": {
+        "picture": (320, 640, 1280),
+    },
+    "main.banner": {
+        "image_uz": (480, 960, 1440),
+        "image_en": (480, 960, 1440),
+        "image_ru": (480, 960, 1440),
+    },
+}
+
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+THUMBNAIL_DIR = "thumbnails"
+
+
+def stale_fields(instance):
+    """
+    Image fields of ``instance`` whose variants do not match the current file.
+    """
+    variants = instance.image_variants or {}
+    return [
+        field for field in THUMBNAIL_WIDTHS.get(instance._meta.label_lower, {})
+        if (getattr(instance, field).name or None) != variants.get(field, {}).get("source")
+    ]
+
+
+def _render(image, width, fmt):
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+    if fmt == "jpeg" and image.mode != "RGB":
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A") if "A" in image.mode else None)
+        image = background
+    out = BytesIO()
+    image.save(out, **FORMATS[fmt])
+    return out.getvalue()
+
+
+def build_variants(file, widths):
+    """
+    Write resized WebP and JPEG copies of ``file`` and return
+    ``{"hash": ..., "widths": {"64": {"webp": path, "jpeg": path}, ...}}``.
+
+    Paths are derived from a hash of the original bytes, so they can be
+    cached forever and unchanged uploads reuse the files already written.
+    """
+    file.open("rb")
+    try:
+        data = file.read()
+    finally:
+        file.close()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+
+    image = ImageOps.exif_transpose(Image.open(BytesIO(data)))
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.mode or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    # Always keep the smallest size, even for tiny originals.
+    sizes = [w for w in widths if w <= image.width] or [min(widths)]
+    out = {}
+    for width in sizes:
+        out[str(width)] = {}
+        for fmt in FORMATS:
+            path = posixpath.join(THUMBNAIL_DIR, digest[:2], f"{digest}-{width}.{fmt}")
+            if not default_storage.exists(path):
+                default_storage.save(path, ContentFile(_render(image, width, fmt)))
+            out[str(width)][fmt] = path
+    return {"hash": digest, "widths": out}
+
+
+def generate_image_variants(model_label, pk):
+    """
+    Bring ``image_variants`` of one object up to date with its image fields.
+    Returns the names of the fields that were (re)built or cleared.
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return []
+
+    fields = stale_fields(instance)
+    if not fields:
+        return []
+
+    variants = dict(instance.image_variants or {})
+    for field in fields:
+        file = getattr(instance, field)
+        if not file:
+            variants.pop(field, None)
+            continue
+        variants[field] = {
+            "source": file.name,
+            **build_variants(file, THUMBNAIL_WIDTHS[model_label][field]),
+        }
+    # update() skips post_save, which would otherwise queue this again.
+    changes = {"image_variants": variants}
+    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+        changes["updated_at"] = timezone.now()
+    model.objects.filter(pk=pk).update(**changes)
+    return fields
+
+
+def srcset(instance, field, resolve_url=default_storage.url):
+    """
+    ``{"webp": {"64w": url, ...}, "jpeg": {...}}`` for one image field, or
+    ``None`` while its variants have not been generated. ``resolve_url``
+    turns a storage path into the URL to publish.
+    """
+    return srcset_from(
+        getattr(instance, "image_variants", None),
+        field,
+        getattr(instance, field).name,
+        resolve_url,
+    )
+
+
+def srcset_from(variants, field, name, resolve_url=default_storage.url):
+    """
+    ``srcset`` from raw column values: the ``image_variants`` dict and the
+    current file name of ``field``.
+    """
+    entry = (variants or {}).get(field)
+    if not entry or entry.get("source") != (name or None):
+        return None
+    out = {fmt: {} for fmt in FORMATS}
+    for width, paths in entry["widths"].items():
+        for fmt, path in paths.items():
+            out[fmt][f"{width}w"] = resolve_url(path)
+    return out
@@ -0,0 +1,147 @@
+from bisect import bisect_left
+from collections import namedtuple
+
+from .models import DAY_MASK_LABELS, Enrollment
+
+WEEKDAYS = DAY_MASK_LABELS[(1 << 7) - 1]
+
+Slot = namedtuple(
+    "Slot",
+    ["course_id", "course_name", "status", "start_time", "end_time",
+     "start_date", "end_date", "day_mask"],
+)
+
+
+def _minutes(t):
+    return t.hour * 60 + t.minute
+
+
+def _dates_overlap(a, b):
+    return (
+        (a.start_date is None or b.end_date is None or a.start_date <= b.end_date)
+        and (b.start_date is None or a.end_date is None or b.start_date <= a.end_date)
+    )
+
+
+def _max_tree(day):
+    """
+    Implicit binary tree over ``day``'s intervals: leaf ``size + i`` holds the
+    end of interval ``i``, every inner node the max of its children.
+    """
+    size = 1
+    while size < len(day):
+        size *= 2
+    tree = [0] * (2 * size)
+    for i, (_, end, _) in enumerate(day):
+        tree[size + i] = end
+    for node in range(size - 1, 0, -1):
+        tree[node] = max(tree[2 * node], tree[2 * node + 1])
+    return tree
+
+
+def _running_past(tree, count, start):
+    """
+    Indices below ``count`` of the intervals in ``tree`` ending after
+    ``start``. Subtrees whose max end is ``start`` or earlier are skipped.
+    """
+    size = len(tree) // 2
+    stack = [(1, 0, size)]
+    while stack:
+        node, lo, hi = stack.pop()
+        if lo >= count or tree[node] <= start:
+            continue
+        if node >= size:
+            yield lo
+            continue
+        mid = (lo + hi) // 2
+        stack.append((2 * node + 1, mid, hi))
+        stack.append((2 * node, lo, mid))
+
+
+class WeeklyTimetable:
+    """
+    A user's courses laid out per weekday as intervals sorted by start, with
+    a max-of-end-times tree over them.
+
+    ``conflicts`` binary-searches the intervals starting before the new
+    course ends, then descends the tree only into subtrees with an interval
+    running past its start: O(log n) per weekday plus O(log n) per overlap,
+    however long the earlier slots are.
+    """
+
+    def __init__(self, slots):
+        self.slots = list(slots)
+        self._days = []
+        for bit in range(len(WEEKDAYS)):
+            day = sorted(
+                (
+                    (_minutes(s.start_time), _minutes(s.end_time), s)
+                    for s in self.slots
+                    if s.day_mask & (1 << bit) and s.end_time > s.start_time
+                ),
+                key=lambda item: (item[0], item[1], item[2].course_id),
+            )
+            self._days.append(([start for start, _, _ in day], day, _max_tree(day)))
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Timetable of ``user``'s pending and confirmed enrollments, in one query.
+        """
+        rows = (
+            Enrollment.objects.filter(user=user)
+            .exclude(status=Enrollment.Status.CANCELED)
+            .order_by("course__start_time", "course_id")
+            .values_list(
+                "course_id", "course__name", "status", "course__start_time",
+                "course__end_time", "course__start_date", "course__end_date",
+                "course__day_mask",
+            )
+        )
+        return cls(Slot(*row) for row in rows)
+
+    def conflicts(self, course):
+        """
+        Slots that share a weekday, time and date range with ``course``
+        (anything with the ``Slot`` attributes, e.g. a ``Course``).
+        """
+        start, end = _minutes(course.start_time), _minutes(course.end_time)
+        if end <= start:
+            return []
+
+        own_id = course.course_id if isinstance(course, Slot) else course.id
+        found = {}
+        for bit, (starts, day, tree) in enumerate(self._days):
+            if not course.day_mask & (1 << bit):
+                continue
+            for i in _running_past(tree, bisect_left(starts, end), start):
+                slot = day[i][2]
+                if slot.course_id != own_id and _dates_overlap(slot, course):
+                    found[slot.course_id] = slot
+        return sorted(found.values(), key=lambda s: s.course_id)
+
+    def as_days(self):
+        """
+        ``[{"day": "Mon", "slots": [...]}, ...]`` for all seven weekdays, each
+        slot listing the IDs of the other courses it clashes with.
+        """
+        clashes = {
+            s.course_id: [c.course_id for c in self.conflicts(s)] for s in self.slots
+        }
+        return [
+            {
+                "day": label,
+                "slots": [
+                    {
+                        "course_id": slot.course_id,
+                        "course_name": slot.course_name,
+                        "status": slot.status,
+                        "start_time": slot.start_time,
+                        "end_time": slot.end_time,
+                        "conflicts_with": clashes[slot.course_id],
+                    }
+                    for _, _, slot in day
+                ],
+            }
+            for label, (_, day, _) in zip(WEEKDAYS, self._days)
+        ]
@@ -8,8 +8,6 @@ from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_yasg import openapi
-from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
@@ -21,9 +19,14 @@ from django.db.models import Sum, Count, F, Value
 from accounts.serializers import EmptySerializer, MyCourseSerializer
 from accounts.permissions import IsEduCenter
 from accounts.models import CenterPayment, MonthlyCenterReport, PaidAmountLog
+from api.conditional import ConditionalGetMixin
+from api.docs import openapi, swagger_auto_schema
+from api.fastpath import COURSE_ROWS, EVENT_ROWS, FastListMixin
+from api.sparse import SparseQuerysetMixin
 from api.permissions import IsSuperUserOrReadOnly, IsAccountant
 from api.filters import CourseFilter, EventFilter
 from api.paginations import DefaultPagination
+from api.scopes import get_scope
 from api.permissions import IsEduCenterBranchOrReadOnly, IsSuperUserOrReadOnly, IsAccountant
 from api.serializers import (AppliedStudentSerializer, CategorySerializer,
                              CourseSerializer, DaySerializer,
@@ -31,13 +34,27 @@ from api.serializers import (AppliedStudentSerializer, CategorySerializer,
                              LevelSerializer, TeacherSerializer,
                              CancelEnrollmentSerializer, EnrollmentStatusStatsSerializer,
                              BannerSerializer, CenterPaymentSerializer, MonthlyCenterReportSerializer, 
-                             AddPaymentSerializer, PaidAmountLogSerializer)
+                             AddPaymentSerializer, PaidAmountLogSerializer,
+                             CourseBulkSerializer, TimetableDaySerializer)
+from main import lookups
+from main.recommendations import recommended_course_ids
+from main.timetable import WeeklyTimetable
 from main.models import (Category, Course, Day, EduType, Enrollment, Event,
                          Level, Teacher, Banner, EducationCenter)
 
 # ─── EduType / Category / Level / Day ─────────────────────────────────────
 
 
+class LookupListMixin:
+    """
+    Serve ``list`` from the in-process ``main.lookups`` table of the model.
+    """
+
+    def list(self, request, *args, **kwargs):
+        rows = lookups.get_table(self.queryset.model).values()
+        return Response(self.get_serializer(list(rows), many=True).data)
+
+
 @method_decorator(
     name="list",
     decorator=swagger_auto_schema(
@@ -51,7 +68,7 @@ from main.models import (Category, Course, Day, EduType, Enrollment, Event,
         tags=["EduType"],
     ),
 )
-class EduTypeViewSet(viewsets.ModelViewSet):
+class EduTypeViewSet(LookupListMixin, viewsets.ModelViewSet):
     queryset = EduType.objects.all()
     serializer_class = EduTypeSerializer
     permission_classes = [IsSuperUserOrReadOnly]
@@ -69,7 +86,7 @@ class EduTypeViewSet(viewsets.ModelViewSet):
         operation_summary="Create a new category (Superuser only)", tags=["Category"]
     ),
 )
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(LookupListMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsSuperUserOrReadOnly]
@@ -87,8 +104,8 @@ class CategoryViewSet(viewsets.ModelViewSet):
         operation_summary="Create a new course level (Superuser only)", tags=["Level"]
     ),
 )
-class LevelViewSet(viewsets.ModelViewSet):
-    queryset = Level.objects.select_related('category').all()
+class LevelViewSet(LookupListMixin, viewsets.ModelViewSet):
+    queryset = Level.objects.all()
     serializer_class = LevelSerializer
     permission_classes = [IsSuperUserOrReadOnly]
 
@@ -103,7 +120,7 @@ class LevelViewSet(viewsets.ModelViewSet):
         operation_summary="Add a new week day (Superuser only)", tags=["Day"]
     ),
 )
-class DayViewSet(viewsets.ModelViewSet):
+class DayViewSet(LookupListMixin, viewsets.ModelViewSet):
     queryset = Day.objects.all()
     serializer_class = DaySerializer
     permission_classes = [IsSuperUserOrReadOnly]
@@ -125,6 +142,7 @@ class DayViewSet(viewsets.ModelViewSet):
     ),
 )
 class TeacherViewSet(viewsets.ModelViewSet):
+    user_from_claims = True
     queryset = Teacher.objects.select_related("branch")
     serializer_class = TeacherSerializer
 
@@ -140,13 +158,9 @@ class TeacherViewSet(viewsets.ModelViewSet):
         Others (anonymous) see all (list/retrieve only).
         """
         qs = super().get_queryset()
-        user = self.request.user
-
-        if user.is_authenticated:
-            if user.role == "EDU_CENTER":
-                return qs.filter(branch__edu_center__user=user)
-            if user.role == "BRANCH":
-                return qs.filter(branch__admins=user)
+        scope = get_scope(self.request)
+        if scope is not None:
+            return qs.filter(branch_id__in=scope.branch_ids)
         return qs
 
     def perform_create(self, serializer):
@@ -176,7 +190,11 @@ class TeacherViewSet(viewsets.ModelViewSet):
     name="list",
     decorator=swagger_auto_schema(
         operation_summary="List all courses",
-        operation_description="Retrieve all courses with optional filters, search, ordering.",
+        operation_description=(
+            "Retrieve active courses with optional filters, search, ordering. "
+            "Pass `archived=true` to list archived (finished) courses instead. "
+            "`fields=a,b` or `omit=a,b` trims each item to the named fields."
+        ),
         tags=["Course"],
     ),
 )
@@ -209,7 +227,9 @@ class TeacherViewSet(viewsets.ModelViewSet):
     name="destroy",
     decorator=swagger_auto_schema(operation_summary="Delete a course", tags=["Course"]),
 )
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ConditionalGetMixin, FastListMixin, SparseQuerysetMixin,
+                    viewsets.ModelViewSet):
+    user_from_claims = True
     serializer_class = CourseSerializer
     pagination_class = DefaultPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
@@ -226,11 +246,10 @@ class CourseViewSet(viewsets.ModelViewSet):
         "branch",
         "branch__edu_center",
         "teacher",
-        "category",
-        "level",
-    ).prefetch_related(
-        "days"
     )
+    watermark_fields = ("updated_at", "branch__updated_at", "branch__edu_center__updated_at")
+    watermark_lookups = (Category, Level)
+    row_format = COURSE_ROWS
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -242,21 +261,30 @@ class CourseViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
             return [AllowAny()]
-        if self.action in ["apply", "my_courses"]:
+        if self.action in ["apply", "my_courses", "my_timetable", "recommended"]:
             return [IsAuthenticated()]
         return [IsAuthenticated(), IsEduCenterBranchOrReadOnly()]
 
-    def get_queryset(self):
+    def get_scoped_queryset(self):
         qs = super().get_queryset()
-        user = self.request.user
+        scope = get_scope(self.request)
+        if scope is not None:
+            qs = qs.filter(branch_id__in=scope.branch_ids)
+        if self.action == "list":
+            # Finished courses are archived nightly; ask for them explicitly.
+            archived = self.request.query_params.get("archived", "").lower() in ("true", "1")
+            qs = qs.filter(is_archived=archived)
+        return qs
 
-        if user.is_authenticated:
-            if user.role == "EDU_CENTER":
-                qs = qs.filter(branch__edu_center__user=user)
-            elif user.role == "BRANCH":
-                qs = qs.filter(branch__admins=user)
+    def get_watermark_queryset(self):
+        # Without the enrollment counts, the aggregate needs no GROUP BY.
+        return self.filter_queryset(self.get_scoped_queryset())
 
-        qs = qs.annotate(
+    def get_rows_queryset(self):
+        return self.filter_queryset(self.get_scoped_queryset())
+
+    def get_queryset(self):
+        qs = self.get_scoped_queryset().annotate(
             total_applied=Count("enrollments", distinct=True),
             pending_count=Count("enrollments", filter=Q(enrollments__status="PENDING")),
             confirmed_count=Count("enrollments", filter=Q(
@@ -264,14 +292,15 @@ class CourseViewSet(viewsets.ModelViewSet):
             canceled_count=Count("enrollments", filter=Q(
                 enrollments__status="CANCELED")),
         )
-        qs = qs.prefetch_related(
-            Prefetch(
-                "enrollments",
-                queryset=Enrollment.objects.select_related("user"),
-                to_attr="prefetched_enrollments"
+        if self.wants("students"):
+            qs = qs.prefetch_related(
+                Prefetch(
+                    "enrollments",
+                    queryset=Enrollment.objects.select_related("user"),
+                    to_attr="prefetched_enrollments"
+                )
             )
-        )
-        return qs
+        return self.sparse_queryset(qs)
 
     @action(detail=True, methods=["post"], serializer_class=EmptySerializer)
     def apply(self, request, pk=None):
@@ -281,26 +310,85 @@ class CourseViewSet(viewsets.ModelViewSet):
             return Response(
                 {"detail": "Already applied."}, status=status.HTTP_400_BAD_REQUEST
             )
+        # Clashes are a warning only: the enrollment is still created.
+        conflicts = WeeklyTimetable.for_user(user).conflicts(course)
         Enrollment.objects.create(user=user, course=course)
         return Response(
             {
                 "detail": "Applied successfully.",
                 "course_id": course.id,
                 "user_id": user.id,
+                "conflicts": [
+                    {"course_id": slot.course_id, "course_name": slot.course_name}
+                    for slot in conflicts
+                ],
             },
             status=status.HTTP_201_CREATED,
         )
 
+    @swagger_auto_schema(
+        method="post",
+        operation_summary="Bulk create or replace courses (EDU_CENTER or BRANCH only)",
+        operation_description=(
+            "Rows without `id` are created; rows with `id` fully replace that course. "
+            "Everything is saved in one transaction. On any error nothing is saved "
+            "and `courses` holds one error object per row, in input order."
+        ),
+        request_body=CourseBulkSerializer,
+        tags=["Course"],
+    )
+    @action(detail=False, methods=["post"], url_path="bulk", serializer_class=CourseBulkSerializer)
+    def bulk(self, request):
+        ser = CourseBulkSerializer(data=request.data, context={"request": request})
+        ser.is_valid(raise_exception=True)
+        return Response(ser.save(), status=status.HTTP_201_CREATED)
+
     @action(detail=False, methods=["get"], url_path="my-courses", url_name="my_courses")
     def my_courses(self, request):
         qs = (
             Enrollment.objects.filter(user=request.user)
-            .select_related("course__level")
-            .prefetch_related("course__days")
+            .select_related("course__level", "course__branch__edu_center")
         )
         ser = MyCourseSerializer(qs, many=True, context={"request": request})
         return Response(ser.data)
 
+    @swagger_auto_schema(
+        method="get",
+        operation_summary="Recommended courses for me",
+        operation_description=(
+            "Courses precomputed nightly from co-enrollments, liked and viewed "
+            "centers and the user's quiz level, best first. New users get the "
+            "neighbours of their latest enrollment, or the most popular courses."
+        ),
+        responses={200: CourseSerializer(many=True)},
+        tags=["Course"],
+    )
+    @action(detail=False, methods=["get"], url_path="recommended")
+    def recommended(self, request):
+        ids = recommended_course_ids(request.user)
+        position = {pk: i for i, pk in enumerate(ids)}
+        courses = sorted(
+            self.get_queryset().filter(id__in=ids, is_archived=False),
+            key=lambda course: position[course.id],
+        )
+        return Response(self.get_serializer(courses, many=True).data)
+
+    @swagger_auto_schema(
+        method="get",
+        operation_summary="Weekly timetable of my enrollments",
+        operation_description=(
+            "Pending and confirmed enrollments grouped by weekday (Mon..Sun) and "
+            "sorted by start time. `conflicts_with` lists the other courses whose "
+            "days, times and date ranges overlap the slot."
+        ),
+        responses={200: TimetableDaySerializer(many=True)},
+        tags=["Course"],
+    )
+    @action(detail=False, methods=["get"], url_path="my-timetable", url_name="my_timetable")
+    def my_timetable(self, request):
+        days = WeeklyTimetable.for_user(request.user).as_days()
+        return Response(TimetableDaySerializer(days, many=True).data)
+
     @action(detail=True, methods=["get"], url_path="stats")
     def stats(self, request, pk=None):
         course = self.get_object()
@@ -335,7 +423,11 @@ class CourseViewSet(viewsets.ModelViewSet):
     name="list",
     decorator=swagger_auto_schema(
         operation_summary="List all events",
-        operation_description="Retrieve all upcoming events.",
+        operation_description=(
+            "Retrieve all non-archived events. With `upcoming=true` only events "
+            "from today on are returned, soonest first. "
+            "`fields=a,b` or `omit=a,b` trims each item to the named fields."
+        ),
         tags=["Event"],
     ),
 )
@@ -360,8 +452,10 @@ class CourseViewSet(viewsets.ModelViewSet):
     name="destroy",
     decorator=swagger_auto_schema(operation_summary="Delete an event", tags=["Event"]),
 )
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(ConditionalGetMixin, FastListMixin, SparseQuerysetMixin,
+                   viewsets.ModelViewSet):
 
+    user_from_claims = True
     queryset = (
         Event.objects.filter(is_archived=False)
         .select_related("edu_center", "branch")
@@ -373,16 +467,27 @@ class EventViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_class = EventFilter
     search_fields = ["name", "description"]
+    watermark_fields = ("updated_at", "branch__updated_at", "edu_center__updated_at")
+    watermark_lookups = (Category,)
+    row_format = EVENT_ROWS
+
+    def get_scoped_queryset(self):
+        qs = Event.objects.filter(is_archived=False)
+        scope = get_scope(self.request)
+        if scope is None:
+            return qs
+        if self.request.user.role == "EDU_CENTER":
+            return qs.filter(edu_center_id__in=scope.center_ids)
+        return qs.filter(branch_id__in=scope.branch_ids)
 
     def get_queryset(self):
-        qs = super().get_queryset()
-        user = self.request.user
-        if user.is_authenticated:
-            if user.role == "EDU_CENTER":
-                return qs.filter(edu_center__user=user)
-            if user.role == "BRANCH":
-                return qs.filter(branch__admins=user)
-        return qs
+        qs = self.get_scoped_queryset().select_related("edu_center", "branch")
+        if self.wants("category_names"):
+            qs = qs.prefetch_related("categories")
+        return self.sparse_queryset(qs)
+
+    def get_rows_queryset(self):
+        return self.filter_queryset(self.get_scoped_queryset())
 
 
 # ─── Filter Schema endpoints ────────────────────────────────────────────────
@@ -397,6 +502,7 @@ class CourseFilterSchemaView(APIView):
                 "total_places_min": ">= total places",
                 "total_places_max": "<= total places",
                 "teacher_gender": "male/female",
+                "archived": "true: archived courses instead of active ones",
                 "edu_center": "center ID",
                 "category": "category ID",
             }
@@ -407,6 +513,7 @@ class EventFilterSchemaView(APIView):
     def get(self, request):
         return Response(
             {
+                "upcoming": "true: only events from today on, soonest first",
                 "start_date": "from YYYY-MM-DD",
                 "end_date": "to YYYY-MM-DD",
                 "edu_center_id": "comma–separated center IDs",
@@ -415,7 +522,7 @@ class EventFilterSchemaView(APIView):
         )
 
 
-class AppliedStudentViewSet(viewsets.ReadOnlyModelViewSet):
+class AppliedStudentViewSet(SparseQuerysetMixin, viewsets.ReadOnlyModelViewSet):
     """
     Read-only list of enrollments visible to the current user,
     plus:
@@ -423,6 +530,7 @@ class AppliedStudentViewSet(viewsets.ReadOnlyModelViewSet):
       - POST /api/applied-students/{pk}/confirm/
       - POST /api/applied-students/{pk}/cancel/
     """
+    user_from_claims = True
     serializer_class = AppliedStudentSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = DefaultPagination
@@ -453,11 +561,10 @@ class AppliedStudentViewSet(viewsets.ReadOnlyModelViewSet):
             return qs.none()
 
         if user.role == Enrollment.Status.PENDING:
-            return qs.filter(status=Enrollment.Status.PENDING)
-        if user.role == "EDU_CENTER":
-            return qs.filter(course__branch__edu_center__user=user)
-        if user.role == "BRANCH":
-            return qs.filter(course__branch__admins=user)
+            return self.sparse_queryset(qs.filter(status=Enrollment.Status.PENDING))
+        scope = get_scope(self.request)
+        if scope is not None:
+            return self.sparse_queryset(qs.filter(course__branch_id__in=scope.branch_ids))
 
         return qs.none()
 
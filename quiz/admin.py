@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Pack, Question, Answer, TestAttempt, UserLevelProgress
+from .models import (Pack, Question, Answer, TestAttempt, UserLevelProgress,
+                     PackStats, PackScoreBucket)
 
 
 class AnswerInline(admin.TabularInline):
@@ -49,4 +50,17 @@ class UserLevelProgressAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "level", "total_tests", "passed_tests", "percent")
     list_filter = ("level", "user")
     search_fields = ("user__username", "level__name")
-    readonly_fields = ("user", "level")
\ No newline at end of file
+    readonly_fields = ("user", "level")
+
+
+@admin.register(PackStats)
+class PackStatsAdmin(admin.ModelAdmin):
+    list_display = ("id", "pack", "attempt_count", "mean_percent")
+    readonly_fields = ("pack", "attempt_count", "percent_sum")
+
+
+@admin.register(PackScoreBucket)
+class PackScoreBucketAdmin(admin.ModelAdmin):
+    list_display = ("id", "pack", "bucket", "count")
+    list_filter = ("pack",)
+    readonly_fields = ("pack", "bucket", "count")
@@ -0,0 +1,43 @@
+from django.db import connections, router
+from django.db.models import Max
+
+from .models import Answer, Question
+from .packs import invalidate_level_packs
+
+BULK_BATCH_SIZE = 1000
+
+
+def bulk_add_questions(pack, questions, batch_size=BULK_BATCH_SIZE):
+    """
+    Append ``questions`` to ``pack`` with two ``bulk_create`` calls.
+
+    ``questions`` is a list of ``(text, [(answer_text, correct), ...])``.
+    Positions continue after the pack's last question and are assigned in
+    memory. Call inside ``transaction.atomic()`` to load a pack all-or-nothing.
+    Returns the number of rows inserted.
+    """
+    if not questions:
+        return 0
+
+    last = pack.questions.aggregate(last=Max("position"))["last"] or 0
+    objs = Question.objects.bulk_create(
+        [
+            Question(pack=pack, text=text, position=last + i)
+            for i, (text, _) in enumerate(questions, start=1)
+        ],
+        batch_size=batch_size,
+    )
+
+    connection = connections[router.db_for_write(Question)]
+    if not connection.features.can_return_rows_from_bulk_insert:
+        objs = list(pack.questions.filter(position__gt=last).order_by("position"))
+
+    answers = [
+        Answer(question=q, text=text, correct=correct)
+        for q, (_, options) in zip(objs, questions)
+        for text, correct in options
+    ]
+    Answer.objects.bulk_create(answers, batch_size=batch_size)
+    # bulk_create skips post_save, so drop the cached question counts here.
+    invalidate_level_packs(pack.level_id)
+    return len(objs) + len(answers)
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0005_alter_category_options_remove_category_icon_and_more"),
+        ("quiz", "0002_remove_pack_is_used"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PackScoreBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bucket", models.PositiveSmallIntegerField()),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["pack", "bucket"],
+            },
+        ),
+        migrations.CreateModel(
+            name="PackStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("attempt_count", models.PositiveIntegerField(default=0)),
+                ("percent_sum", models.FloatField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="userlevelprogress",
+            index=models.Index(
+                fields=["level", "-passed_tests", "total_tests"],
+                name="quiz_progress_leaderboard_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="packscorebucket",
+            name="pack",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="score_buckets",
+                to="quiz.pack",
+            ),
+        ),
+        migrations.AddField(
+            model_name="packstats",
+            name="pack",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="stats",
+                to="quiz.pack",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="packscorebucket",
+            unique_together={("pack", "bucket")},
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+from django.db.models import Count, F, IntegerField, Sum
+from django.db.models.functions import Cast, Floor, Least
+
+
+def backfill(apps, schema_editor):
+    TestAttempt = apps.get_model("quiz", "TestAttempt")
+    PackStats = apps.get_model("quiz", "PackStats")
+    PackScoreBucket = apps.get_model("quiz", "PackScoreBucket")
+
+    PackStats.objects.bulk_create(
+        PackStats(pack_id=row["pack"], attempt_count=row["n"], percent_sum=row["s"])
+        for row in TestAttempt.objects.values("pack").annotate(
+            n=Count("id"), s=Sum("percent")
+        ).order_by()
+    )
+    buckets = TestAttempt.objects.annotate(
+        b=Least(Cast(Floor(F("percent") / 10), IntegerField()), 9)
+    ).values("pack", "b").annotate(n=Count("id")).order_by()
+    PackScoreBucket.objects.bulk_create(
+        PackScoreBucket(pack_id=row["pack"], bucket=max(row["b"], 0), count=row["n"])
+        for row in buckets
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0003_pack_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-19 02:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quiz", "0004_backfill_pack_stats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="testattempt",
+            index=models.Index(
+                fields=["user", "pack"], name="quiz_attempt_user_pack_idx"
+            ),
+        ),
+    ]
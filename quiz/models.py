@@ -1,7 +1,10 @@
-from django.db import models
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import F
 from django.conf import settings
 from main.models import Level
 
+PASS_PERCENT = 50
+
 
 class Pack(models.Model):
     level = models.ForeignKey(Level, on_delete=models.CASCADE, related_name='packs')
@@ -47,6 +50,9 @@ class TestAttempt(models.Model):
 
     class Meta:
         ordering = ["-taken_at"]
+        indexes = [
+            models.Index(fields=["user", "pack"], name="quiz_attempt_user_pack_idx"),
+        ]
 
 
 class UserLevelProgress(models.Model):
@@ -58,6 +64,12 @@ class UserLevelProgress(models.Model):
 
     class Meta:
         unique_together = ("user", "level")
+        indexes = [
+            models.Index(
+                fields=["level", "-passed_tests", "total_tests"],
+                name="quiz_progress_leaderboard_idx",
+            ),
+        ]
 
     @property
     def percent(self):
@@ -65,8 +77,97 @@ class UserLevelProgress(models.Model):
             return 0
         return (self.passed_tests / self.total_tests) * 100
 
-    def record(self, attempt: TestAttempt):
-        self.total_tests += 1
-        if attempt.percent >= 50:
-            self.passed_tests += 1
-        self.save()
+    @classmethod
+    def record(cls, attempt: TestAttempt):
+        """
+        Count ``attempt`` towards its user's progress on the pack level.
+
+        Runs as one ``INSERT ... ON CONFLICT DO UPDATE`` with in-database
+        increments, so parallel submits from the same user never lose a count.
+        Returns the new ``(total_tests, passed_tests)``.
+        """
+        return upsert_increment(
+            cls,
+            {"user_id": attempt.user_id, "level_id": attempt.pack.level_id},
+            {"total_tests": 1, "passed_tests": int(attempt.percent >= PASS_PERCENT)},
+        )
+
+
+class PackStats(models.Model):
+    """
+    Running aggregates of every attempt on a pack, bumped on each submit.
+    """
+    pack = models.OneToOneField(Pack, on_delete=models.CASCADE, related_name="stats")
+    attempt_count = models.PositiveIntegerField(default=0)
+    percent_sum = models.FloatField(default=0)
+
+    @property
+    def mean_percent(self):
+        if not self.attempt_count:
+            return 0
+        return self.percent_sum / self.attempt_count
+
+
+class PackScoreBucket(models.Model):
+    """
+    Attempt histogram for a pack: ``bucket`` N counts scores in
+    ``[N * 10, N * 10 + 10)`` percent, with 100% folded into the last bucket.
+    """
+    BUCKET_WIDTH = 10
+    BUCKET_COUNT = 10
+
+    pack = models.ForeignKey(Pack, on_delete=models.CASCADE, related_name="score_buckets")
+    bucket = models.PositiveSmallIntegerField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("pack", "bucket")
+        ordering = ["pack", "bucket"]
+
+    @classmethod
+    def bucket_for(cls, percent):
+        return min(max(int(percent // cls.BUCKET_WIDTH), 0), cls.BUCKET_COUNT - 1)
+
+
+def upsert_increment(model, lookup, increments):
+    """
+    Add ``increments`` to the ``model`` row matching ``lookup`` (a unique key),
+    inserting the row with ``increments`` as its values when it is missing.
+
+    Uses a single ``INSERT ... ON CONFLICT DO UPDATE`` where the backend
+    supports it; otherwise falls back to an ``F()`` update with insert-on-miss.
+    Returns the row's new values for the ``increments`` columns, in order.
+    """
+    connection = connections[router.db_for_write(model)]
+    opts = model._meta
+    names = list(increments)
+
+    if connection.features.supports_update_conflicts_with_target:
+        qn = connection.ops.quote_name
+        table = qn(opts.db_table)
+        keys = [qn(opts.get_field(name).column) for name in lookup]
+        cols = [qn(opts.get_field(name).column) for name in names]
+        sql = (
+            f"INSERT INTO {table} ({', '.join(keys + cols)}) "
+            f"VALUES ({', '.join(['%s'] * (len(keys) + len(cols)))}) "
+            f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET "
+            + ", ".join(f"{c} = {table}.{c} + EXCLUDED.{c}" for c in cols)
+        )
+        returning = connection.features.can_return_columns_from_insert
+        if returning:
+            sql += f" RETURNING {', '.join(cols)}"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [*lookup.values(), *increments.values()])
+            if returning:
+                return tuple(cursor.fetchone())
+    else:
+        rows = model.objects.using(connection.alias).filter(**lookup)
+        bumps = {name: F(name) + value for name, value in increments.items()}
+        if not rows.update(**bumps):
+            try:
+                with transaction.atomic(using=connection.alias):
+                    rows.create(**lookup, **increments)
+            except IntegrityError:
+                rows.update(**bumps)
+
+    return model.objects.using(connection.alias).filter(**lookup).values_list(*names).get()
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.http import Http404
+
+from main.models import Level
+
+from .models import Pack, TestAttempt
+
+LEVEL_PACKS_TIMEOUT = 60 * 60
+
+
+def level_packs_key(level_id):
+    return f"quiz:level-packs:{level_id}"
+
+
+def get_level_packs(level_id):
+    """
+    Pack metadata for a level (id, title, description, question_count),
+    cached until a pack or question in the level changes.
+    """
+    key = level_packs_key(level_id)
+    packs = cache.get(key)
+    if packs is None:
+        if not Level.objects.filter(pk=level_id).exists():
+            raise Http404("No Level matches the given query.")
+        packs = list(
+            Pack.objects.filter(level_id=level_id)
+            .annotate(question_count=Count("questions"))
+            .order_by("id")
+            .values("id", "title", "description", "question_count")
+        )
+        cache.set(key, packs, LEVEL_PACKS_TIMEOUT)
+    return packs
+
+
+def invalidate_level_packs(level_id):
+    """
+    Drop the cached pack list once the surrounding transaction commits.
+    """
+    transaction.on_commit(lambda: cache.delete(level_packs_key(level_id)))
+
+
+def attempted_pack_ids(user, pack_ids):
+    """
+    IDs among ``pack_ids`` that ``user`` has attempted, as one index scan
+    over ``(user, pack)`` instead of an ``EXISTS`` subquery per pack.
+    """
+    if not pack_ids or not user.is_authenticated:
+        return set()
+    return set(
+        TestAttempt.objects.filter(user=user, pack_id__in=pack_ids)
+        .order_by()
+        .values_list("pack_id", flat=True)
+        .distinct()
+    )
+
+
+def list_level_packs(level_id, user):
+    """
+    Cached pack metadata merged with the user's attempted packs as ``used``.
+    """
+    packs = get_level_packs(level_id)
+    used = attempted_pack_ids(user, [p["id"] for p in packs])
+    return [{**p, "used": p["id"] in used} for p in packs]
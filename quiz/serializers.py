@@ -46,3 +46,24 @@ class LevelProgressSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserLevelProgress
         fields = ["level", "total_tests", "passed_tests", "percent"]
+
+
+class ScoreBucketSerializer(serializers.Serializer):
+    min_percent = serializers.IntegerField()
+    max_percent = serializers.IntegerField()
+    count = serializers.IntegerField()
+
+
+class PackStatsSerializer(serializers.Serializer):
+    attempt_count = serializers.IntegerField()
+    mean_percent = serializers.FloatField()
+    histogram = ScoreBucketSerializer(many=True)
+
+
+class LeaderboardEntrySerializer(serializers.Serializer):
+    rank = serializers.IntegerField()
+    user_id = serializers.IntegerField()
+    full_name = serializers.CharField()
+    total_tests = serializers.IntegerField()
+    passed_tests = serializers.IntegerField()
+    percent = serializers.FloatField()
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from quiz.models import Pack, Question
+from quiz.packs import invalidate_level_packs
+
+
+@receiver([post_save, post_delete], sender=Pack)
+def pack_changed(sender, instance, **kwargs):
+    invalidate_level_packs(instance.level_id)
+
+
+@receiver([post_save, post_delete], sender=Question)
+def question_changed(sender, instance, **kwargs):
+    level_id = (
+        Pack.objects.filter(pk=instance.pack_id)
+        .values_list("level_id", flat=True)
+        .first()
+    )
+    if level_id is not None:
+        invalidate_level_packs(level_id)
@@ -0,0 +1,131 @@
+from django.core.cache import cache
+
+from .models import PackScoreBucket, PackStats, UserLevelProgress, upsert_increment
+
+LEADERBOARD_SIZE = 50
+STATS_CACHE_TIMEOUT = 60 * 10
+
+
+def pack_stats_key(pack_id):
+    return f"quiz:pack-stats:{pack_id}"
+
+
+def leaderboard_key(level_id):
+    return f"quiz:leaderboard:{level_id}"
+
+
+def _leaderboard_entry(user_id, full_name, total_tests, passed_tests):
+    return {
+        "user_id": user_id,
+        "full_name": full_name,
+        "total_tests": total_tests,
+        "passed_tests": passed_tests,
+        "percent": round(passed_tests / total_tests * 100, 2) if total_tests else 0,
+    }
+
+
+def _leaderboard_rank(entry):
+    return (-entry["passed_tests"], entry["total_tests"], entry["user_id"])
+
+
+# ─── Writes (called from submit) ────────────────────────────────────────────
+
+
+def record_attempt(attempt, progress):
+    """
+    Fold a freshly saved ``attempt`` into its pack aggregates and level
+    leaderboard. ``progress`` is the ``(total_tests, passed_tests)`` pair
+    returned by ``UserLevelProgress.record``.
+
+    Both cached views are patched in place from the values the upserts
+    return, so reads never rescan ``TestAttempt``. Concurrent patches may
+    race; ``STATS_CACHE_TIMEOUT`` bounds how long such drift can live.
+    """
+    pack = attempt.pack
+    bucket = PackScoreBucket.bucket_for(attempt.percent)
+    attempt_count, percent_sum = upsert_increment(
+        PackStats, {"pack_id": pack.id},
+        {"attempt_count": 1, "percent_sum": attempt.percent},
+    )
+    (bucket_count,) = upsert_increment(
+        PackScoreBucket, {"pack_id": pack.id, "bucket": bucket}, {"count": 1}
+    )
+
+    stats = cache.get(pack_stats_key(pack.id))
+    if stats is not None:
+        stats["attempt_count"] = attempt_count
+        stats["mean_percent"] = round(percent_sum / attempt_count, 2)
+        stats["histogram"][bucket]["count"] = bucket_count
+        cache.set(pack_stats_key(pack.id), stats, STATS_CACHE_TIMEOUT)
+
+    _update_leaderboard(pack.level_id, attempt.user, *progress)
+
+
+def _update_leaderboard(level_id, user, total_tests, passed_tests):
+    key = leaderboard_key(level_id)
+    board = cache.get(key)
+    if board is None:
+        return  # rebuilt from the index on the next read
+
+    others = [e for e in board if e["user_id"] != user.id]
+    listed = len(others) != len(board)
+    previous = next((e for e in board if e["user_id"] == user.id), None)
+    if listed and previous["passed_tests"] == passed_tests and len(board) >= LEADERBOARD_SIZE:
+        # A failed attempt only worsens the tie-break; the user may now rank
+        # below someone who is not cached, so rebuild instead of guessing.
+        cache.delete(key)
+        return
+
+    others.append(_leaderboard_entry(user.id, user.full_name, total_tests, passed_tests))
+    others.sort(key=_leaderboard_rank)
+    cache.set(key, others[:LEADERBOARD_SIZE], STATS_CACHE_TIMEOUT)
+
+
+# ─── Reads ──────────────────────────────────────────────────────────────────
+
+
+def get_pack_stats(pack_id):
+    key = pack_stats_key(pack_id)
+    stats = cache.get(key)
+    if stats is None:
+        attempt_count, percent_sum = (
+            PackStats.objects.filter(pack_id=pack_id)
+            .values_list("attempt_count", "percent_sum")
+            .first()
+        ) or (0, 0)
+        counts = dict(
+            PackScoreBucket.objects.filter(pack_id=pack_id).values_list("bucket", "count")
+        )
+        width = PackScoreBucket.BUCKET_WIDTH
+        stats = {
+            "attempt_count": attempt_count,
+            "mean_percent": round(percent_sum / attempt_count, 2) if attempt_count else 0,
+            "histogram": [
+                {
+                    "min_percent": b * width,
+                    "max_percent": (b + 1) * width,
+                    "count": counts.get(b, 0),
+                }
+                for b in range(PackScoreBucket.BUCKET_COUNT)
+            ],
+        }
+        cache.set(key, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def get_leaderboard(level_id, limit=LEADERBOARD_SIZE):
+    key = leaderboard_key(level_id)
+    board = cache.get(key)
+    if board is None:
+        rows = (
+            UserLevelProgress.objects.filter(level_id=level_id, total_tests__gt=0)
+            .order_by("-passed_tests", "total_tests", "user_id")
+            .values_list("user_id", "user__full_name", "total_tests", "passed_tests")
+            [:LEADERBOARD_SIZE]
+        )
+        board = [_leaderboard_entry(*row) for row in rows]
+        cache.set(key, board, STATS_CACHE_TIMEOUT)
+    return [
+        {"rank": rank, **entry}
+        for rank, entry in enumerate(board[:limit], start=1)
+    ]
@@ -0,0 +1,51 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from main.models import Category, Level
+from quiz.models import Answer, Pack, Question
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def make_student():
+    def make(phone="+998901234567", full_name="Test Student"):
+        return get_user_model().objects.create_user(
+            full_name=full_name, phone_number=phone, password="Test1234!"
+        )
+    return make
+
+
+@pytest.fixture
+def quiz_pack():
+    """
+    A one-question pack: returns ``(pack, question, right, wrong)``.
+    """
+    level = Level.objects.create(
+        category=Category.objects.create(name="English"), name="Beginner"
+    )
+    pack = Pack.objects.create(level=level, title="Pack 1")
+    question = Question.objects.create(pack=pack, text="He ___ a doctor.")
+    right = Answer.objects.create(question=question, text="is", correct=True)
+    wrong = Answer.objects.create(question=question, text="are")
+    return pack, question, right, wrong
+
+
+@pytest.fixture
+def submit():
+    def post(user, pack, question, answer):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.post(
+            f"/api/levels/{pack.level_id}/packs/{pack.id}/questions/submit/",
+            {"answers": [{"question": question.id, "answer": answer.id}]},
+            format="json",
+        )
+    return post
@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection
+from rest_framework import status
+
+from quiz.models import UserLevelProgress, upsert_increment
+
+
+@pytest.mark.django_db
+class TestUserLevelProgress:
+    def test_submits_accumulate_exact_counts(self, quiz_pack, make_student, submit):
+        pack, question, right, wrong = quiz_pack
+        user = make_student()
+
+        for answer in (right, right, wrong):
+            response = submit(user, pack, question, answer)
+            assert response.status_code == status.HTTP_200_OK
+
+        progress = UserLevelProgress.objects.get(user=user, level=pack.level)
+        assert progress.total_tests == 3
+        assert progress.passed_tests == 2
+
+    def test_record_is_a_single_query(
+        self, quiz_pack, make_student, django_assert_max_num_queries
+    ):
+        pack = quiz_pack[0]
+        attempt = pack.testattempt_set.create(
+            user=make_student(), correct_count=1, total_questions=1, percent=100
+        )
+
+        with django_assert_max_num_queries(1):
+            assert UserLevelProgress.record(attempt) == (1, 1)
+
+    # The second writer runs between the first one's check and its insert,
+    # on the same connection, so the race is replayed deterministically.
+    @pytest.mark.parametrize("native, cut_in_before", [
+        (True, "INSERT"),
+        # Just before the savepoint guarding the fallback's insert-on-miss.
+        (False, "SAVEPOINT"),
+    ])
+    def test_interleaved_first_writes_are_summed(
+        self, quiz_pack, make_student, monkeypatch, native, cut_in_before
+    ):
+        monkeypatch.setattr(
+            connection.features, "supports_update_conflicts_with_target", native
+        )
+        lookup = {"user_id": make_student().id, "level_id": quiz_pack[0].level_id}
+        pending = [{"total_tests": 1, "passed_tests": 0}]
+
+        def cut_in(execute, sql, params, many, context):
+            if pending and sql.lstrip().upper().startswith(cut_in_before):
+                upsert_increment(UserLevelProgress, lookup, pending.pop())
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(cut_in):
+            upsert_increment(
+                UserLevelProgress, lookup, {"total_tests": 1, "passed_tests": 1}
+            )
+
+        assert not pending
+        progress = UserLevelProgress.objects.get(**lookup)
+        assert (progress.total_tests, progress.passed_tests) == (2, 1)
+
+
+@pytest.mark.skipif(
+    connection.vendor == "sqlite",
+    reason="SQLite serialises writers; parallel submits need a server database",
+)
+@pytest.mark.django_db(transaction=True)
+def test_parallel_submits_do_not_lose_updates(quiz_pack, make_student, submit):
+    pack, question, right, wrong = quiz_pack
+    user = make_student()
+    answers = [right, wrong] * 10
+
+    def run(answer):
+        try:
+            return submit(user, pack, question, answer).status_code
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        codes = list(pool.map(run, answers))
+
+    assert codes == [status.HTTP_200_OK] * len(answers)
+    progress = UserLevelProgress.objects.get(user=user, level=pack.level)
+    assert progress.total_tests == len(answers)
+    assert progress.passed_tests == len(answers) // 2
@@ -0,0 +1,41 @@
+import pytest
+from rest_framework.test import APIClient
+
+from quiz.models import Pack, Question
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPackListing:
+    def test_list_merges_cached_counts_with_used_flags(
+        self, quiz_pack, make_student, submit, django_assert_num_queries
+    ):
+        pack, question, right, _ = quiz_pack
+        other = Pack.objects.create(level=pack.level, title="Pack 2")
+        user = make_student()
+        submit(user, pack, question, right)
+        client = APIClient()
+        client.force_authenticate(user)
+        url = f"/api/levels/{pack.level_id}/packs/"
+
+        client.get(url)
+        with django_assert_num_queries(1):  # attempted pack IDs only
+            data = client.get(url).data
+
+        assert data == [
+            {"id": pack.id, "title": "Pack 1", "description": "",
+             "question_count": 1, "is_used": True},
+            {"id": other.id, "title": "Pack 2", "description": "",
+             "question_count": 0, "is_used": False},
+        ]
+
+    def test_new_question_invalidates_cached_counts(self, quiz_pack):
+        pack = quiz_pack[0]
+        url = f"/api/levels/{pack.level_id}/packs/"
+        assert APIClient().get(url).data[0]["question_count"] == 1
+
+        Question.objects.create(pack=pack, text="They ___ playing.", position=2)
+
+        assert APIClient().get(url).data[0]["question_count"] == 2
+
+    def test_unknown_level_is_404(self):
+        assert APIClient().get("/api/levels/999/packs/").status_code == 404
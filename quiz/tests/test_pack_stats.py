@@ -0,0 +1,65 @@
+import pytest
+from rest_framework.test import APIClient
+
+from quiz.models import PackScoreBucket, PackStats
+
+
+@pytest.mark.django_db
+class TestPackStats:
+    def test_submits_update_running_aggregates(self, quiz_pack, make_student, submit):
+        pack, question, right, wrong = quiz_pack
+        user = make_student()
+        for answer in (right, wrong, right):
+            submit(user, pack, question, answer)
+
+        stats = PackStats.objects.get(pack=pack)
+        assert stats.attempt_count == 3
+        assert stats.mean_percent == pytest.approx(200 / 3)
+        assert dict(pack.score_buckets.values_list("bucket", "count")) == {0: 1, 9: 2}
+
+    def test_cached_stats_are_patched_on_submit(
+        self, quiz_pack, make_student, submit, django_assert_num_queries
+    ):
+        pack, question, right, wrong = quiz_pack
+        user = make_student()
+        url = f"/api/levels/{pack.level_id}/packs/{pack.id}/stats/"
+        submit(user, pack, question, right)
+        assert APIClient().get(url).data["attempt_count"] == 1
+
+        submit(user, pack, question, wrong)
+        with django_assert_num_queries(1):  # pack lookup only
+            data = APIClient().get(url).data
+
+        assert data["attempt_count"] == 2
+        assert data["mean_percent"] == 50
+        assert [b["count"] for b in data["histogram"]] == [1] + [0] * 8 + [1]
+
+    def test_bucket_bounds(self):
+        assert PackScoreBucket.bucket_for(0) == 0
+        assert PackScoreBucket.bucket_for(49.9) == 4
+        assert PackScoreBucket.bucket_for(100) == 9
+
+
+@pytest.mark.django_db
+class TestLeaderboard:
+    def test_ranking_follows_submits_through_the_cache(
+        self, quiz_pack, make_student, submit
+    ):
+        pack, question, right, wrong = quiz_pack
+        url = f"/api/levels/{pack.level_id}/leaderboard/"
+        alice = make_student("+998901111111", "Alice")
+        bob = make_student("+998902222222", "Bob")
+        submit(alice, pack, question, right)
+        submit(bob, pack, question, wrong)
+
+        board = APIClient().get(url).data
+        assert [e["full_name"] for e in board] == ["Alice", "Bob"]
+
+        submit(bob, pack, question, right)
+        submit(bob, pack, question, right)
+
+        board = APIClient().get(url).data
+        assert [(e["rank"], e["full_name"], e["passed_tests"]) for e in board] == [
+            (1, "Bob", 2), (2, "Alice", 1)
+        ]
+        assert APIClient().get(url, {"limit": 1}).data[0]["full_name"] == "Bob"
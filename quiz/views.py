@@ -4,17 +4,18 @@ from rest_framework import generics, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 from rest_framework.views import APIView
 
 from django.db.models import Count, OuterRef, Exists, Value, BooleanField
+from api.docs import openapi, swagger_auto_schema
 from .models import TestAttempt, UserLevelProgress, Pack
 from .serializers import (
     QuestionSerializer, TestSubmissionSerializer,
     TestResultSerializer, LevelProgressSerializer,
-    PackSerializer
+    PackSerializer, PackStatsSerializer, LeaderboardEntrySerializer
 )
+from .packs import list_level_packs
+from .stats import LEADERBOARD_SIZE, get_leaderboard, get_pack_stats, record_attempt
 from main.models import Level
 
 QUESTIONS_PER_TEST = 20
@@ -68,6 +69,12 @@ class PackViewSet(viewsets.ReadOnlyModelViewSet):
             qs = qs.annotate(used=Value(False, output_field=BooleanField()))
         return qs
 
+    def list(self, request, level_id=None):
+        # Question counts come from the per-level cache; only the user's
+        # attempted pack IDs are read per request.
+        packs = list_level_packs(level_id, request.user)
+        return Response(self.get_serializer(packs, many=True).data)
+
     @swagger_auto_schema(
         method='get',
         operation_summary='Get 20 random questions from a pack',
@@ -126,11 +133,8 @@ class PackViewSet(viewsets.ReadOnlyModelViewSet):
             percent=percent
         )
 
-        prog, _ = UserLevelProgress.objects.get_or_create(
-            user=request.user,
-            level=pack.level
-        )
-        prog.record(attempt)
+        progress = UserLevelProgress.record(attempt)
+        record_attempt(attempt, progress)
 
         return Response(
             TestResultSerializer(attempt, context={'request': request}).data,
@@ -138,6 +142,46 @@ class PackViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
+    @swagger_auto_schema(
+        method='get',
+        operation_summary='Attempt statistics for a pack',
+        operation_description='Attempt count, mean score and a 10-bucket score histogram.',
+        responses={200: PackStatsSerializer}
+    )
+    @action(detail=True, methods=['get'], url_path='stats')
+    def stats(self, request, level_id=None, pk=None):
+        pack = get_object_or_404(Pack.objects.only('id'), pk=pk, level_id=level_id)
+        return Response(PackStatsSerializer(get_pack_stats(pack.id)).data)
+
+
+class LevelLeaderboardView(APIView):
+    """
+    GET /api/levels/{level_id}/leaderboard/?limit=N — top users by passed tests
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    @swagger_auto_schema(
+        operation_summary="Top users for a level",
+        operation_description=(
+            "Ranked by passed tests, then fewest attempts. "
+            f"`limit` defaults to and is capped at {LEADERBOARD_SIZE}."
+        ),
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER)
+        ],
+        responses={200: LeaderboardEntrySerializer(many=True)}
+    )
+    def get(self, request, level_id):
+        get_object_or_404(Level.objects.only('id'), pk=level_id)
+        try:
+            limit = int(request.query_params.get('limit', LEADERBOARD_SIZE))
+        except ValueError:
+            limit = LEADERBOARD_SIZE
+        limit = min(max(limit, 1), LEADERBOARD_SIZE)
+        entries = get_leaderboard(level_id, limit)
+        return Response(LeaderboardEntrySerializer(entries, many=True).data)
+
+
 class QuizFilterSchemaView(APIView):
 
     @swagger_auto_schema(